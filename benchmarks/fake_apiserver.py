@@ -0,0 +1,205 @@
+"""Local stand-in for Kubernetes API server serving synthetic objects for benchmarks.
+
+Only read requests used by KubeLibrary list keywords are implemented: listing namespaced and cluster wide
+collections with limit/continue pagination, equality based label selectors, metadata.name and
+metadata.namespace field selectors and PartialObjectMetadataList responses.
+
+    python benchmarks/fake_apiserver.py --pods 1000 --port 8001
+"""
+import argparse
+import json
+import re
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+CUSTOM_GROUP = 'bench.kubelibrary.io'
+CUSTOM_VERSION = 'v1'
+CUSTOM_PLURAL = 'widgets'
+
+# plural: (group version, kind)
+KINDS = {
+    'pods': ('v1', 'Pod'),
+    'configmaps': ('v1', 'ConfigMap'),
+    'secrets': ('v1', 'Secret'),
+    CUSTOM_PLURAL: (f'{CUSTOM_GROUP}/{CUSTOM_VERSION}', 'Widget'),
+}
+
+PATH = re.compile(r'^/(?:api/v1|apis/(?P<group>[^/]+)/(?P<version>[^/]+))'
+                  r'(?:/namespaces/(?P<namespace>[^/]+))?/(?P<plural>[a-z]+)$')
+
+
+def _metadata(name, namespace, i):
+    return {
+        'name': name,
+        'namespace': namespace,
+        'uid': f'00000000-0000-0000-0000-{i:012d}',
+        'resourceVersion': str(1000 + i),
+        'creationTimestamp': '2024-01-01T00:00:00Z',
+        'labels': {'app': f'bench-{i % 10}', 'bench': 'true'},
+        'annotations': {'bench.kubelibrary.io/index': str(i), 'bench.kubelibrary.io/owner': 'benchmark'},
+    }
+
+
+def _pod(namespace, i):
+    name = f'pod-{i:05d}'
+    return {
+        'apiVersion': 'v1',
+        'kind': 'Pod',
+        'metadata': _metadata(name, namespace, i),
+        'spec': {
+            'nodeName': f'node-{i % 3}',
+            'containers': [{
+                'name': 'app',
+                'image': f'registry.local/bench/app:{i % 5}',
+                'env': [{'name': 'INDEX', 'value': str(i)}, {'name': 'MODE', 'value': 'bench'}],
+                'resources': {'limits': {'cpu': '100m', 'memory': '64Mi'},
+                              'requests': {'cpu': '50m', 'memory': '32Mi'}},
+            }],
+        },
+        'status': {
+            'phase': 'Running',
+            'podIP': f'10.0.{i // 250 % 250}.{i % 250}',
+            'conditions': [{'type': 'Ready', 'status': 'True'}],
+            'containerStatuses': [{'name': 'app', 'ready': True, 'restartCount': 0,
+                                   'image': f'registry.local/bench/app:{i % 5}', 'imageID': '',
+                                   'state': {'running': {'startedAt': '2024-01-01T00:00:00Z'}}}],
+        },
+    }
+
+
+def _config_map(namespace, i):
+    return {'apiVersion': 'v1', 'kind': 'ConfigMap', 'metadata': _metadata(f'config-{i:05d}', namespace, i),
+            'data': {'index': str(i), 'payload': 'x' * 64}}
+
+
+def _secret(namespace, i):
+    return {'apiVersion': 'v1', 'kind': 'Secret', 'type': 'Opaque',
+            'metadata': _metadata(f'secret-{i:05d}', namespace, i), 'data': {'token': 'YmVuY2g='}}
+
+
+def _widget(namespace, i):
+    return {'apiVersion': f'{CUSTOM_GROUP}/{CUSTOM_VERSION}', 'kind': 'Widget',
+            'metadata': _metadata(f'widget-{i:05d}', namespace, i), 'spec': {'size': i % 7}}
+
+
+GENERATORS = {'pods': _pod, 'configmaps': _config_map, 'secrets': _secret, CUSTOM_PLURAL: _widget}
+
+
+class FakeCluster:
+    """Synthetic cluster content, every namespace holds ``size`` objects of each kind."""
+
+    def __init__(self, size, namespaces=('bench',)):
+        self.size = size
+        self.namespaces = list(namespaces)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._objects = {}
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def objects(self, plural, namespace):
+        if plural == 'namespaces':
+            return [{'apiVersion': 'v1', 'kind': 'Namespace', 'metadata': _metadata(name, None, i)}
+                    for i, name in enumerate(self.namespaces)]
+        if namespace is None:
+            return [obj for ns in self.namespaces for obj in self.objects(plural, ns)]
+        key = (plural, namespace)
+        with self._lock:
+            if key not in self._objects:
+                self._objects[key] = [GENERATORS[plural](namespace, i) for i in range(self.size)]
+            return self._objects[key]
+
+
+def _matches(obj, label_selector, field_selector):
+    labels = obj['metadata'].get('labels') or {}
+    for requirement in filter(None, label_selector.split(',')):
+        key, _, value = requirement.partition('=')
+        if labels.get(key) != value.lstrip('='):
+            return False
+    for requirement in filter(None, field_selector.split(',')):
+        key, _, value = requirement.partition('=')
+        field = key.split('.')[-1]
+        if obj['metadata'].get(field) != value.lstrip('='):
+            return False
+    return True
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    cluster = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.cluster.count_request()
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path.rstrip('/') == '/version':
+            return self._send(200, {'major': '1', 'minor': '30', 'gitVersion': 'v1.30.0-fake'})
+        if url.path == '/api/v1/namespaces':
+            return self._send_list('namespaces', None, query)
+        match = PATH.match(url.path)
+        if not match or match['plural'] not in KINDS:
+            return self._send(404, {'kind': 'Status', 'status': 'Failure', 'reason': 'NotFound', 'code': 404})
+        return self._send_list(match['plural'], match['namespace'], query)
+
+    def _send_list(self, plural, namespace, query):
+        items = [obj for obj in self.cluster.objects(plural, namespace)
+                 if _matches(obj, query.get('labelSelector', ''), query.get('fieldSelector', ''))]
+        start = int(query.get('continue') or 0)
+        limit = int(query.get('limit') or 0)
+        end = start + limit if limit else len(items)
+        metadata = {'resourceVersion': str(1000 + self.cluster.size)}
+        if end < len(items):
+            metadata['continue'] = str(end)
+        page = items[start:end]
+        if 'as=PartialObjectMetadataList' in self.headers.get('Accept', ''):
+            body = {'kind': 'PartialObjectMetadataList', 'apiVersion': 'meta.k8s.io/v1', 'metadata': metadata,
+                    'items': [{'kind': 'PartialObjectMetadata', 'apiVersion': 'meta.k8s.io/v1',
+                               'metadata': obj['metadata']} for obj in page]}
+        else:
+            group_version, kind = KINDS.get(plural, ('v1', 'Namespace'))
+            body = {'kind': f'{kind}List', 'apiVersion': group_version, 'metadata': metadata, 'items': page}
+        self._send(200, body)
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def start(cluster, port=0):
+    """Starts server for given cluster in background thread, returns the server, url is server.url."""
+    handler = type('ClusterHandler', (Handler,), {'cluster': cluster})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pods', type=int, default=1000, help='objects of each kind per namespace')
+    parser.add_argument('--namespaces', type=int, default=1)
+    parser.add_argument('--port', type=int, default=8001)
+    args = parser.parse_args()
+    cluster = FakeCluster(args.pods, [f'bench-{i}' for i in range(args.namespaces)])
+    server = start(cluster, args.port)
+    print(f'Serving {args.pods} objects per kind in {args.namespaces} namespaces on {server.url}')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""Times KubeLibrary keywords against local fake API server with synthetic clusters of different size.
+
+For every cluster size and library mode each keyword is run once to measure wall time and number of
+API requests, then once more under tracemalloc to measure memory peak. Results are saved as JSON, so
+runs of different versions can be compared.
+
+    PYTHONPATH=src python benchmarks/run_benchmarks.py --sizes 10 1000 --output benchmark.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_apiserver import CUSTOM_GROUP, CUSTOM_PLURAL, CUSTOM_VERSION, FakeCluster, start  # noqa: E402
+from KubeLibrary import KubeLibrary  # noqa: E402
+from KubeLibrary.version import version  # noqa: E402
+
+NAMESPACE = 'bench'
+
+DEFAULT_SIZES = (10, 1000, 50000)
+
+# mode name: KubeLibrary arguments
+MODES = {
+    'default': {},
+    'raw': {'raw': True},
+    'paged': {'page_size': 500},
+}
+
+# keyword name: function of (library, context) where context holds objects listed before timing
+BENCHMARKS = {
+    'list_namespace': lambda kl, ctx: kl.list_namespace(),
+    'list_namespaced_pod_by_pattern': lambda kl, ctx: kl.list_namespaced_pod_by_pattern('.*', NAMESPACE),
+    'list_namespaced_pod_by_pattern prefix': lambda kl, ctx: kl.list_namespaced_pod_by_pattern('pod-001',
+                                                                                               NAMESPACE),
+    'list_namespaced_pod_by_pattern regex': lambda kl, ctx: kl.list_namespaced_pod_by_pattern('pod-0.*5$',
+                                                                                              NAMESPACE),
+    'list_namespaced_pod_by_pattern exact': lambda kl, ctx: kl.list_namespaced_pod_by_pattern('pod-00001$',
+                                                                                              NAMESPACE),
+    'list_namespaced_pod_by_pattern label': lambda kl, ctx: kl.list_namespaced_pod_by_pattern(
+        '.*', NAMESPACE, label_selector='app=bench-1'),
+    'list_namespaced_pod_by_pattern metadata_only': lambda kl, ctx: kl.list_namespaced_pod_by_pattern(
+        '.*', NAMESPACE, metadata_only=True),
+    'list_namespaced_config_map_by_pattern': lambda kl, ctx: kl.list_namespaced_config_map_by_pattern(
+        '.*', NAMESPACE),
+    'list_namespaced_secret_by_pattern': lambda kl, ctx: kl.list_namespaced_secret_by_pattern('.*', NAMESPACE),
+    'list_namespaced_custom_object': lambda kl, ctx: kl.list_namespaced_custom_object(
+        CUSTOM_GROUP, CUSTOM_VERSION, NAMESPACE, CUSTOM_PLURAL),
+    'iterate_objects': lambda kl, ctx: sum(1 for _ in kl.iterate_objects('Pod', NAMESPACE)),
+    'filter_names': lambda kl, ctx: kl.filter_names(ctx['pods']),
+    'filter_by_key': lambda kl, ctx: kl.filter_by_key(ctx['pods'], 'kind', 'Pod'),
+    'filter_pods_containers_by_name': lambda kl, ctx: kl.filter_pods_containers_by_name(ctx['pods'], 'app'),
+    'filter_containers_images': lambda kl, ctx: kl.filter_containers_images(ctx['containers']),
+    'filter_containers_resources': lambda kl, ctx: kl.filter_containers_resources(ctx['containers']),
+    'filter_pods_containers_statuses_by_name': lambda kl, ctx: kl.filter_pods_containers_statuses_by_name(
+        ctx['pods'], 'app'),
+    'assert_pod_has_labels': lambda kl, ctx: [kl.assert_pod_has_labels(pod, '{"bench": "true"}')
+                                              for pod in ctx['pods']],
+    'assert_pod_has_annotations': lambda kl, ctx: [kl.assert_pod_has_annotations(
+        pod, '{"bench.kubelibrary.io/owner": "benchmark"}') for pod in ctx['pods']],
+    'assert_container_has_env_vars': lambda kl, ctx: [kl.assert_container_has_env_vars(
+        container, '{"MODE": "bench"}') for container in ctx['containers']],
+}
+
+
+def measure(func, kl, ctx, cluster, memory=True):
+    requests = cluster.requests
+    start = time.perf_counter()
+    func(kl, ctx)
+    result = {'seconds': round(time.perf_counter() - start, 6), 'requests': cluster.requests - requests}
+    if memory:
+        tracemalloc.start()
+        func(kl, ctx)
+        result['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return result
+
+
+def run(sizes, modes, keywords, memory=True):
+    results = []
+    for size in sizes:
+        cluster = FakeCluster(size, [NAMESPACE])
+        server = start(cluster)
+        try:
+            for mode in modes:
+                kl = KubeLibrary(api_url=server.url, bearer_token='benchmark', **MODES[mode])
+                pods = kl.list_namespaced_pod_by_pattern('.*', NAMESPACE)
+                ctx = {'pods': pods, 'containers': kl.filter_pods_containers_by_name(pods, '.*')}
+                for keyword in keywords:
+                    result = {'size': size, 'mode': mode, 'keyword': keyword}
+                    result.update(measure(BENCHMARKS[keyword], kl, ctx, cluster, memory))
+                    print(f"{size:>7} {mode:<8} {keyword:<48} {result['seconds']:>10.4f}s "
+                          f"{result['requests']:>5} requests", flush=True)
+                    results.append(result)
+        finally:
+            server.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='objects of each kind in benchmark namespace')
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--keywords', nargs='+', choices=BENCHMARKS, default=list(BENCHMARKS))
+    parser.add_argument('--no-memory', action='store_true', help='skip tracemalloc runs')
+    parser.add_argument('--output', default='benchmark.json')
+    args = parser.parse_args()
+    report = {
+        'kubelibrary_version': version,
+        'python': platform.python_version(),
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'results': run(args.sizes, args.modes, args.keywords, memory=not args.no_memory),
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'Results saved to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,23 +1,177 @@
 import ast
+import gzip
+import hashlib
 import inspect
+import io
 import json
+import os
 import re
+import shutil
+import socket
 import ssl
+import tarfile
+import tempfile
+import threading
+import time
 import urllib3
+import yaml
 
+from functools import partial
 from os import environ
 from kubernetes import client, config, dynamic, stream
+from kubernetes.dynamic.exceptions import NotFoundError
+from urllib3.connection import HTTPConnection
+from urllib.parse import parse_qsl, urlsplit
 from robot.api import logger
 from robot.api.deco import library
+from robot.running.arguments import PythonArgumentParser
+from robot.utils import timestr_to_secs
 from string import digits, ascii_lowercase
 from random import choices
 
+from KubeLibrary.cache import ANY_KIND, ResponseCache
+from KubeLibrary.clusters import with_cluster_argument
+from KubeLibrary.hooks import with_keyword_hooks
 from KubeLibrary.exceptions import BearerTokenWithPrefixException
+from KubeLibrary.informer import Informer, shutdown_response
+from KubeLibrary.metrics import RequestStats, current_keyword, keyword_executor
+from KubeLibrary.objects import KubeObject, loads
+from KubeLibrary.pod_exec import ExecResult, ExecSession, ExecStdinWriter, ExecStdoutReader, connect, read_exec_result
+from KubeLibrary.profiling import PROFILE_DIR_ENV, Profiler
 from KubeLibrary.version import version
 
 # supressing SSL warnings when using self-signed certs
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# kind: (api attribute, namespaced list method, cluster wide list method)
+LIST_METHODS = {
+    'Namespace': ('v1', None, 'list_namespace'),
+    'Node': ('v1', None, 'list_node'),
+    'Pod': ('v1', 'list_namespaced_pod', 'list_pod_for_all_namespaces'),
+    'ConfigMap': ('v1', 'list_namespaced_config_map', 'list_config_map_for_all_namespaces'),
+    'ServiceAccount': ('v1', 'list_namespaced_service_account', 'list_service_account_for_all_namespaces'),
+    'Secret': ('v1', 'list_namespaced_secret', 'list_secret_for_all_namespaces'),
+    'Service': ('v1', 'list_namespaced_service', 'list_service_for_all_namespaces'),
+    'PersistentVolumeClaim': ('v1', 'list_namespaced_persistent_volume_claim',
+                              'list_persistent_volume_claim_for_all_namespaces'),
+    'Deployment': ('appsv1', 'list_namespaced_deployment', 'list_deployment_for_all_namespaces'),
+    'ReplicaSet': ('appsv1', 'list_namespaced_replica_set', 'list_replica_set_for_all_namespaces'),
+    'StatefulSet': ('appsv1', 'list_namespaced_stateful_set', 'list_stateful_set_for_all_namespaces'),
+    'DaemonSet': ('appsv1', 'list_namespaced_daemon_set', 'list_daemon_set_for_all_namespaces'),
+    'Job': ('batchv1', 'list_namespaced_job', 'list_job_for_all_namespaces'),
+    'CronJob': ('batchv1', 'list_namespaced_cron_job', 'list_cron_job_for_all_namespaces'),
+    'Ingress': ('networkingv1api', 'list_namespaced_ingress', 'list_ingress_for_all_namespaces'),
+    'HorizontalPodAutoscaler': ('autoscalingv1', 'list_namespaced_horizontal_pod_autoscaler',
+                                'list_horizontal_pod_autoscaler_for_all_namespaces'),
+    'Role': ('rbac_authv1_api', 'list_namespaced_role', 'list_role_for_all_namespaces'),
+    'RoleBinding': ('rbac_authv1_api', 'list_namespaced_role_binding', 'list_role_binding_for_all_namespaces'),
+    'ClusterRole': ('rbac_authv1_api', None, 'list_cluster_role'),
+    'ClusterRoleBinding': ('rbac_authv1_api', None, 'list_cluster_role_binding'),
+}
+
+# kind: (group version path, plural) used for raw requests e.g. metadata only listing
+RESOURCE_PATHS = {
+    'Namespace': ('/api/v1', 'namespaces'),
+    'Node': ('/api/v1', 'nodes'),
+    'Pod': ('/api/v1', 'pods'),
+    'ConfigMap': ('/api/v1', 'configmaps'),
+    'ServiceAccount': ('/api/v1', 'serviceaccounts'),
+    'Secret': ('/api/v1', 'secrets'),
+    'Service': ('/api/v1', 'services'),
+    'PersistentVolumeClaim': ('/api/v1', 'persistentvolumeclaims'),
+    'Deployment': ('/apis/apps/v1', 'deployments'),
+    'ReplicaSet': ('/apis/apps/v1', 'replicasets'),
+    'StatefulSet': ('/apis/apps/v1', 'statefulsets'),
+    'DaemonSet': ('/apis/apps/v1', 'daemonsets'),
+    'Job': ('/apis/batch/v1', 'jobs'),
+    'CronJob': ('/apis/batch/v1', 'cronjobs'),
+    'Ingress': ('/apis/networking.k8s.io/v1', 'ingresses'),
+    'HorizontalPodAutoscaler': ('/apis/autoscaling/v1', 'horizontalpodautoscalers'),
+    'Role': ('/apis/rbac.authorization.k8s.io/v1', 'roles'),
+    'RoleBinding': ('/apis/rbac.authorization.k8s.io/v1', 'rolebindings'),
+    'ClusterRole': ('/apis/rbac.authorization.k8s.io/v1', 'clusterroles'),
+    'ClusterRoleBinding': ('/apis/rbac.authorization.k8s.io/v1', 'clusterrolebindings'),
+}
+
+PARTIAL_OBJECT_METADATA_LIST = 'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1'
+
+DEFAULT_PAGE_SIZE = 500
+
+# name pattern characters that can be matched literally, k8s names contain only [a-z0-9.-]
+LITERAL_NAME_PATTERN = re.compile(r'(?:[a-z0-9-]|\\\.)+')
+
+INFORMER_SYNC_TIMEOUT = 60
+
+DISCOVERY_CACHE_TTL = '1 hour'
+
+# kinds applied before others by Apply Manifests, later tiers may depend on earlier ones
+APPLY_TIERS = (
+    ('Namespace', 'CustomResourceDefinition'),
+    ('ServiceAccount', 'Secret', 'ConfigMap', 'StorageClass', 'PersistentVolume', 'PersistentVolumeClaim',
+     'ClusterRole', 'ClusterRoleBinding', 'Role', 'RoleBinding', 'PriorityClass', 'LimitRange', 'ResourceQuota'),
+)
+
+MANIFEST_EXTENSIONS = ('.yaml', '.yml', '.json')
+
+LOG_CHUNK_SIZE = 64 * 1024
+
+
+# responses retried when retries are enabled, other errors are reported at once
+RETRY_STATUSES = (429, 502, 503, 504)
+
+TCP_KEEPALIVE_OPTIONS = tuple((socket.IPPROTO_TCP, getattr(socket, option), value)
+                              for option, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 6))
+                              if hasattr(socket, option))
+
+# keywords served from response cache: kind of returned objects, None when result does not depend on objects
+CACHED_KEYWORDS = {
+    'k8s_version': None,
+    'get_kubelet_version': 'Node',
+    'get_healthy_nodes_count': 'Node',
+    'list_namespace': 'Namespace',
+    'get_namespaces': 'Namespace',
+    'list_namespaced_service': 'Service',
+    'get_services_in_namespace': 'Service',
+    'read_namespaced_service': 'Service',
+    'get_service_details_in_namespace': 'Service',
+    'list_namespaced_ingress': 'Ingress',
+    'get_ingresses_in_namespace': 'Ingress',
+    'read_namespaced_ingress': 'Ingress',
+    'get_ingress_details_in_namespace': 'Ingress',
+    'list_cluster_role': 'ClusterRole',
+    'get_cluster_roles': 'ClusterRole',
+    'list_cluster_role_binding': 'ClusterRoleBinding',
+    'get_cluster_role_bindings': 'ClusterRoleBinding',
+    'list_namespaced_role': 'Role',
+    'get_roles_in_namespace': 'Role',
+    'list_namespaced_role_binding': 'RoleBinding',
+    'get_role_bindings_in_namespace': 'RoleBinding',
+    'list_cluster_custom_object': ANY_KIND,
+    'list_cluster_custom_objects': ANY_KIND,
+    'get_cluster_custom_object': ANY_KIND,
+}
+
+# keywords invalidating response cache: kind they change, None when given in kind argument
+MUTATING_KEYWORDS = {
+    'create': None,
+    'patch': None,
+    'replace': None,
+    'delete': None,
+    'delete_collection': None,
+    'apply_manifests': ANY_KIND,
+    'create_namespaced_service_account': 'ServiceAccount',
+    'create_service_account_in_namespace': 'ServiceAccount',
+    'delete_namespaced_service_account': 'ServiceAccount',
+    'delete_service_account_in_namespace': 'ServiceAccount',
+    'create_namespaced_cron_job': 'CronJob',
+    'create_cron_job_in_namespace': 'CronJob',
+    'delete_namespaced_cron_job': 'CronJob',
+    'delete_cron_job_in_namespace': 'CronJob',
+}
+
+# mutating keywords with namespace argument used only for objects without metadata.namespace
+ANY_NAMESPACE_MUTATING_KEYWORDS = ('apply_manifests',)
+
 
 class DynamicClient(dynamic.DynamicClient):
     @property
@@ -25,7 +179,82 @@ class DynamicClient(dynamic.DynamicClient):
         return self.client
 
 
+class ApiClient(client.ApiClient):
+    """ApiClient applying default timeouts to requests and TCP keep-alive to pooled connections.
+
+    - ``connect_timeout``:
+      Seconds to wait for connection, None for no timeout
+    - ``read_timeout``:
+      Seconds to wait for response data, not applied to watches and followed logs which wait for data by design
+    - ``tcp_keepalive``:
+      Enable TCP keep-alive probes, so idle pooled connections are not silently dropped by proxies and NAT
+    - ``stats``:
+      RequestStats recording status, duration and response size of every request
+    """
+
+    def __init__(self, configuration=None, connect_timeout=None, read_timeout=None, tcp_keepalive=False,
+                 stats=None):
+        super().__init__(configuration)
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.tcp_keepalive = tcp_keepalive
+        self.stats = stats
+        if tcp_keepalive:
+            self.rest_client.pool_manager.connection_pool_kw['socket_options'] = (
+                HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+                + list(TCP_KEEPALIVE_OPTIONS))
+        # every API call of all client versions ends in rest_client.request, ApiClient methods differ between them
+        self._rest_request = self.rest_client.request
+        self.rest_client.request = self._timed_request
+
+    def copy(self):
+        """Returns ApiClient with the same configuration and settings, but its own connection pool."""
+        return ApiClient(self.configuration, connect_timeout=self.connect_timeout, read_timeout=self.read_timeout,
+                         tcp_keepalive=self.tcp_keepalive, stats=self.stats)
+
+    def _timed_request(self, method, url, *args, **kwargs):
+        if kwargs.get('_request_timeout') is None and (self.connect_timeout or self.read_timeout):
+            # older clients pass query apart from url, newer ones have it already in url
+            query = parse_qsl(urlsplit(url).query) + list(kwargs.get('query_params') or [])
+            streaming = any(key in ('watch', 'follow') and str(value).lower() == 'true' for key, value in query)
+            kwargs['_request_timeout'] = (self.connect_timeout, None if streaming else self.read_timeout)
+        if self.stats is None:
+            return self._rest_request(method, url, *args, **kwargs)
+        start = time.perf_counter()
+        status, size = 0, 0
+        try:
+            resp = self._rest_request(method, url, *args, **kwargs)
+            status = resp.status
+            if not isinstance(resp, client.rest.RESTResponse):
+                # streamed responses are not read yet, their size is known only when sent with Content-Length
+                size = int(resp.getheader('Content-Length') or 0)
+            elif resp.data is None:
+                # newer clients read response body after request returns
+                self._count_read(resp, current_keyword())
+            else:
+                size = len(resp.data)
+            return resp
+        except client.ApiException as e:
+            status, size = e.status or 0, len(e.body or '')
+            raise
+        finally:
+            self.stats.record(status, time.perf_counter() - start, size)
+
+    def _count_read(self, resp, keyword):
+        read = resp.read
+
+        def count_read():
+            counted = resp.data is not None
+            data = read()
+            if not counted:
+                self.stats.add_bytes(len(data or b''), keyword)
+            return data
+        resp.read = count_read
+
+
 @library(scope="GLOBAL", version=version, auto_keywords=True)
+@with_cluster_argument('add_cluster', 'use_cluster', 'remove_cluster', 'run_keyword_on_clusters')
+@with_keyword_hooks
 class KubeLibrary:
     """KubeLibrary is a Robot Framework test library for Kubernetes.
 
@@ -70,10 +299,143 @@ class KubeLibrary:
     | ***** Settings *****
     | Library           KubeLibrary          None    True
 
+    = Informers =
+
+    Keywords listing objects by pattern (e.g. `List Namespaced Pod By Pattern`) can be served from local
+    cache instead of calling API server each time. With informers enabled, first call for given kind, namespace
+    and label selector lists objects and starts background watch that keeps local copy up to date. All following
+    calls with the same arguments answer from memory, which is useful in `Wait Until Keyword Succeeds` loops.
+
+    | ***** Settings *****
+    | Library           KubeLibrary          informers=True
+
+    Watches are running until `Stop Informers` is called or config is reloaded. Informer which can not list objects
+    (e.g. because of missing permissions) is stopped and keyword fails with the error. Informers always
+    hold whole objects, so in informers mode metadata_only argument of list by pattern keywords has no effect.
+
+    = Pagination =
+
+    By default list keywords fetch all objects in single request. On big clusters this can be split into
+    requests returning at most page_size objects, continue tokens are followed transparently.
+
+    | ***** Settings *****
+    | Library           KubeLibrary          page_size=500
+
+    `Iterate Objects` can be used to process objects page by page without holding all of them in memory.
+
+    = Metadata only =
+
+    List keywords accept metadata_only=True argument. In that case only objects metadata (name, namespace, labels,
+    annotations etc.) is requested from API server as PartialObjectMetadataList, which is much smaller than whole
+    objects. Returned objects give the same attribute access to metadata e.g. ``${pod.metadata.labels}``, but spec
+    and status are not available.
+
+    | @{pods}=    List Namespaced Pod By Pattern    .*    default    metadata_only=True
+    | ${names}=    Filter Names    ${pods}
+
+    = Raw mode =
+
+    Kubernetes client turns every response into its model classes, which takes most of the time when big lists
+    are fetched. With raw mode enabled list and read keywords decode responses straight from JSON (using orjson
+    when installed) and return lightweight objects with the same attribute access as client models, so
+    expressions like ``${pod.metadata.name}`` or ``${pod.status.phase}`` keep working.
+
+    | ***** Settings *****
+    | Library           KubeLibrary          raw=True
+
+    Fields are available both by model name and by JSON name e.g. ``${pod.metadata.resource_version}`` and
+    ``${pod.metadata.resourceVersion}``. Informers keep client models, so in informers mode raw has no effect on
+    list by pattern keywords.
+
+    = Discovery cache =
+
+    Dynamic client keywords (e.g. `Get`, `Create`, `Patch`) need API discovery, which on clusters with many CRDs
+    takes dozens of requests. Discovered API groups are stored in file specific to cluster URL and credentials,
+    so following suites and reloads reuse it. Resources of single API group are discovered only when used,
+    and whole cache is refreshed when requested kind is not found in it. Cache file is dropped after
+    discovery_cache_ttl.
+
+    | ***** Settings *****
+    | Library           KubeLibrary          discovery_cache_dir=${OUTPUT DIR}    discovery_cache_ttl=10min
+
+    = Clusters =
+
+    Many clusters can be used in single suite without reloading config. Each cluster added with `Add Cluster`
+    keeps its own API clients, connection pool and discovery cache, so switching between them with
+    `Use Cluster` is free. Every keyword also accepts ``cluster`` argument running it against given cluster
+    regardless of the one in use.
+
+    | Add Cluster    staging    kube_config=${KUBE_CONFIG_STAGING}
+    | Add Cluster    production    context=gke-production
+    | @{staging}=    List Namespace    cluster=staging
+    | Use Cluster    production
+    | @{production}=    List Namespace
+
+    = Connections =
+
+    All API clients of library share single connection pool. When many keywords run at once (e.g.
+    `Run Keywords Concurrently`) pool_maxsize should be at least the number of concurrent requests, otherwise
+    requests wait for free connection or open new ones with fresh TLS handshake. Idle connections can be
+    kept alive through proxies and NAT with tcp_keepalive. Requests can be limited with connect_timeout and
+    read_timeout, and retried on connection errors or overloaded API server responses.
+
+    | ***** Settings *****
+    | Library           KubeLibrary          pool_maxsize=50    tcp_keepalive=True    read_timeout=30s    retries=3
+
+    = Request stats =
+
+    With request_stats enabled every API request is recorded with HTTP status, duration and response size,
+    grouped by keyword which sent it. Requests sent by worker threads of concurrent keywords are counted for the
+    keyword that started them, unless the threads run other keywords like `Run Keywords Concurrently` does.
+    Stats can be read with `Get Kube Request Stats`, logged with `Log Kube Request Stats` or written as
+    Prometheus textfile with `Write Kube Request Stats`.
+
+    | ***** Settings *****
+    | Library           KubeLibrary          request_stats=True
+    | Suite Teardown    Write Kube Request Stats    ${OUTPUT DIR}/kubelibrary.prom
+
+    = Profiling =
+
+    When profile_dir library argument or KUBELIBRARY_PROFILE_DIR environment variable is set, every keyword
+    call is profiled with cProfile and tracemalloc. At end of each suite ``<keyword>.pstats`` files with CPU
+    profiles and ``summary.txt`` with calls, time and memory peak of every keyword are written to that directory.
+    Profiles show if time goes to network, deserialization of responses or filtering.
+
+    | ***** Settings *****
+    | Library           KubeLibrary          profile_dir=${OUTPUT DIR}/profiles
+
+    | python -m pstats profiles/list_namespaced_pod_by_pattern.pstats
+
+    Profiling slows keywords down, it should not be enabled in regular runs.
+
+    = Response cache =
+
+    Keywords returning data that rarely changes during a suite, like `K8s Version`, `Get Kubelet Version`,
+    `Get Healthy Nodes Count`, `List Cluster Role`, `List Cluster Custom Object` or `Read Namespaced Service`,
+    can be served from cache when response_cache_ttl is set. Results are cached by keyword and arguments for
+    that time, at most response_cache_size of them. Cached results of given kind and namespace are dropped when
+    it is changed by `Create`, `Patch`, `Replace`, `Delete`, `Delete Collection`, `Apply Manifests` or
+    create and delete keywords of service accounts and cron jobs. Changes made in other ways (e.g. by
+    kubectl or controllers) are seen only after cache expires or is flushed with `Flush Kube Response Cache`.
+
+    | ***** Settings *****
+    | Library           KubeLibrary          response_cache_ttl=5 min
+
+    Keywords of pods, deployments, jobs and other objects changed by cluster itself are never cached.
+
+    = Concurrency =
+
+    Keywords are synchronous, but many of them can be run at once with `Run Keywords Concurrently` using
+    single library instance. From Python code ``KubeLibrary.aio.AsyncKubeLibrary`` gives the same keywords
+    as asyncio coroutine functions.
+
     """
 
     def __init__(self, kube_config=None, context=None, api_url=None, bearer_token=None,
-                 ca_cert=None, incluster=False, cert_validation=True):
+                 ca_cert=None, incluster=False, cert_validation=True, informers=False, page_size=None,
+                 raw=False, discovery_cache_dir=None, discovery_cache_ttl=DISCOVERY_CACHE_TTL, pool_maxsize=None,
+                 tcp_keepalive=False, connect_timeout=None, read_timeout=None, retries=None, request_stats=False,
+                 response_cache_ttl=None, response_cache_size=256, profile_dir=None):
         """KubeLibrary can be configured with several optional arguments.
         - ``kube_config``:
           Path pointing to kubeconfig of target Kubernetes cluster.
@@ -89,15 +451,55 @@ class KubeLibrary:
           Default False. Indicates if used from within k8s cluster. Overrides kubeconfig.
         - ``cert_validation``:
           Default True. Can be set to False for self-signed certificates.
+        - ``informers``:
+          Default False. Serve list by pattern keywords from informers cache, see `Informers`.
+        - ``page_size``:
+          Default None. Number of objects fetched in single request by list keywords, see `Pagination`.
+        - ``raw``:
+          Default False. Decode list and read responses without client models, see `Raw mode`.
+        - ``discovery_cache_dir``:
+          Directory of dynamic client discovery cache, system temp directory by default, see `Discovery cache`.
+        - ``discovery_cache_ttl``:
+          Default 1 hour. Time after which discovery cache is refreshed, see `Discovery cache`.
+        - ``pool_maxsize``:
+          Number of connections kept open to API server, by default 5 per CPU, see `Connections`.
+        - ``tcp_keepalive``:
+          Default False. Send TCP keep-alive probes on idle connections, see `Connections`.
+        - ``connect_timeout``:
+          Default None. Time to wait for connection to API server e.g. 5s, see `Connections`.
+        - ``read_timeout``:
+          Default None. Time to wait for response data, not applied to watches and followed logs, see `Connections`.
+        - ``retries``:
+          Default None. Number of retries of failed connections and 429, 502, 503 and 504 responses of
+          idempotent requests, see `Connections`.
+        - ``request_stats``:
+          Default False. Record API requests sent by each keyword, see `Request stats`.
+        - ``response_cache_ttl``:
+          Default None. Time results of read-only keywords are cached e.g. 1 min, see `Response cache`.
+        - ``response_cache_size``:
+          Default 256. Maximum number of cached keyword results, see `Response cache`.
+        - ``profile_dir``:
+          Default None. Directory of keyword CPU and memory profiles, see `Profiling`.
 
         Environment variables:
         - INIT_FOR_LIBDOC_ONLY:
           Set to '1' to generate keyword documentation and skip to load a kube config..
+        - KUBELIBRARY_PROFILE_DIR:
+          Directory of keyword profiles used when profile_dir is not set, see `Profiling`.
         """
         if "1" == environ.get('INIT_FOR_LIBDOC_ONLY', "0"):
             return
         self.reload_config(kube_config=kube_config, context=context, api_url=api_url, bearer_token=bearer_token,
-                           ca_cert=ca_cert, incluster=incluster, cert_validation=cert_validation)
+                           ca_cert=ca_cert, incluster=incluster, cert_validation=cert_validation, informers=informers,
+                           page_size=page_size, raw=raw, discovery_cache_dir=discovery_cache_dir,
+                           discovery_cache_ttl=discovery_cache_ttl, pool_maxsize=pool_maxsize,
+                           tcp_keepalive=tcp_keepalive, connect_timeout=connect_timeout, read_timeout=read_timeout,
+                           retries=retries, request_stats=request_stats, response_cache_ttl=response_cache_ttl,
+                           response_cache_size=response_cache_size)
+        profile_dir = profile_dir or environ.get(PROFILE_DIR_ENV)
+        self.profiler = Profiler(profile_dir) if profile_dir else None
+        if self.profiler:
+            self.ROBOT_LIBRARY_LISTENER = self.profiler
 
     @staticmethod
     def get_proxy():
@@ -228,8 +630,184 @@ class KubeLibrary:
         resource = self.get_dynamic_resource(api_version, kind)
         resource.replace(**kwargs)
 
+    def delete_collection(self, api_version, kind, namespace=None, label_selector="", field_selector="", wait=False,
+                          timeout='60s', propagation_policy='Background', max_workers=10):
+        """Deletes all objects of given kind matching selectors.
+
+        Uses single deletecollection request when resource supports it, otherwise objects are listed and deleted
+        one by one by at most max_workers threads. With wait=True keyword blocks, using watch, until all deleted
+        objects are gone, e.g. finalizers are done and pods terminated.
+
+        Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=my-pod
+
+        Returns list of names of deleted objects. Fails with TimeoutError when objects are not gone within timeout.
+
+        | Delete Collection    v1    Pod    ${namespace}    label_selector=app=test    wait=True    timeout=2min
+
+        - ``api_version``:
+          Api version of the desired kubernetes resource
+        - ``kind``:
+          Kind of the desired kubernetes resource
+        - ``namespace``:
+          Namespace of objects, if not set objects from all namespaces are deleted
+        - ``wait``:
+          Default False. Wait until deleted objects are gone
+        - ``timeout``:
+          Maximum time to wait e.g. 30s or 2min
+        - ``propagation_policy``:
+          Deletion of dependent objects: Background (default), Foreground or Orphan
+        - ``max_workers``:
+          Maximum number of concurrent requests when objects are deleted one by one, default 10
+        """
+        resource = self.get_dynamic_resource(api_version, kind)
+        selectors = {'label_selector': label_selector or None, 'field_selector': field_selector or None}
+        if 'deletecollection' in (resource.verbs or []) and (namespace or not resource.namespaced):
+            ret = self.dynamic.request('delete', resource.path(namespace=namespace),
+                                       propagation_policy=propagation_policy, **selectors)
+            deleted = [item.metadata.name for item in ret.items or []] if ret.kind.endswith('List') else []
+        else:
+            def delete_object(item):
+                try:
+                    self.dynamic.delete(resource, name=item.metadata.name, namespace=item.metadata.namespace,
+                                        propagation_policy=propagation_policy)
+                except NotFoundError:
+                    pass
+                return item.metadata.name
+            items = self.dynamic.get(resource, namespace=namespace, **selectors).items
+            with keyword_executor(max_workers) as executor:
+                deleted = list(executor.map(delete_object, items))
+        if wait:
+            self._wait_until_gone(resource, namespace, selectors, timestr_to_secs(timeout))
+        return deleted
+
+    def _wait_until_gone(self, resource, namespace, selectors, timeout):
+        deadline = time.monotonic() + timeout
+        ret = self.dynamic.get(resource, namespace=namespace, **selectors)
+        remaining = {(item.metadata.namespace, item.metadata.name) for item in ret.items}
+        resource_version = ret.metadata.resourceVersion
+        while remaining:
+            left = deadline - time.monotonic()
+            if left <= 0:
+                raise TimeoutError(f'{resource.kind} objects not deleted within {timeout}s: '
+                                   f'{", ".join(sorted(name for _, name in remaining))}')
+            for event in self.dynamic.watch(resource, namespace=namespace, resource_version=resource_version,
+                                            timeout=max(1, int(left)), **selectors):
+                obj = event['object']
+                resource_version = obj.metadata.resourceVersion
+                if event['type'] == 'DELETED':
+                    remaining.discard((obj.metadata.namespace, obj.metadata.name))
+                if not remaining:
+                    break
+
+    @staticmethod
+    def _load_manifests(manifests):
+        """Yields objects from YAML file, directory of files, YAML string or list of dictionaries."""
+        if isinstance(manifests, dict):
+            manifests = [manifests]
+        if isinstance(manifests, (list, tuple)):
+            docs = iter(manifests)
+        elif os.path.isdir(manifests):
+            paths = sorted(os.path.join(manifests, name) for name in os.listdir(manifests)
+                           if name.endswith(MANIFEST_EXTENSIONS))
+            docs = (doc for path in paths for doc in KubeLibrary._load_manifests(path))
+        elif os.path.isfile(manifests):
+            def load_file(path):
+                with open(path) as f:
+                    yield from yaml.safe_load_all(f)
+            docs = load_file(manifests)
+        else:
+            docs = yaml.safe_load_all(manifests)
+        for doc in docs:
+            if not doc:
+                continue
+            if doc.get('kind', '').endswith('List') and 'items' in doc:
+                yield from doc['items']
+            else:
+                yield doc
+
+    @staticmethod
+    def _apply_tier(obj):
+        for tier, kinds in enumerate(APPLY_TIERS):
+            if obj.get('kind') in kinds:
+                return tier
+        return len(APPLY_TIERS)
+
+    def _apply_manifest(self, resource, obj, namespace, field_manager, force_conflicts):
+        metadata = obj.get('metadata', {})
+        result = {'kind': obj.get('kind'), 'name': metadata.get('name'), 'namespace': None, 'status': 'applied',
+                  'error': None}
+        try:
+            if isinstance(resource, Exception):
+                raise resource
+            if resource.namespaced:
+                result['namespace'] = metadata.get('namespace') or namespace
+            self.dynamic.server_side_apply(resource, body=obj, namespace=result['namespace'],
+                                           field_manager=field_manager, force_conflicts=force_conflicts)
+        except Exception as e:
+            result['status'] = 'failed'
+            result['error'] = str(e)
+        return result
+
+    def apply_manifests(self, manifests, namespace='default', field_manager='kubelibrary', force_conflicts=False,
+                        max_workers=10, fail_on_error=True):
+        """Applies all objects from multi-document YAML manifests using server-side apply.
+
+        Objects are applied in tiers: namespaces and CRDs first, then configuration objects like service accounts,
+        secrets, configmaps and RBAC, then all the rest. Objects within single tier are applied concurrently
+        by at most max_workers threads.
+
+        Returns list of dictionaries with kind, name, namespace, status (applied or failed) and error of each
+        object, in order of manifests. Fails after applying all objects if any of them failed, unless
+        fail_on_error=False.
+
+        | ${results}=    Apply Manifests    testcases/dynamic_client/resources
+        | ${results}=    Apply Manifests    ${CURDIR}/env.yaml    namespace=test    max_workers=20
+
+        - ``manifests``:
+          Path to YAML file or directory with YAML/JSON files, YAML string or list of objects
+        - ``namespace``:
+          Namespace for namespaced objects without metadata.namespace, default 'default'
+        - ``field_manager``:
+          Name of field manager owning applied fields, default 'kubelibrary'
+        - ``force_conflicts``:
+          Default False. Take ownership of fields managed by others
+        - ``max_workers``:
+          Maximum number of concurrent requests, default 10
+        - ``fail_on_error``:
+          Default True. Fail keyword when any object was not applied
+        """
+        objects = list(self._load_manifests(manifests))
+        results = [None] * len(objects)
+        tiers = sorted({self._apply_tier(obj) for obj in objects})
+        with keyword_executor(max_workers) as executor:
+            for tier in tiers:
+                futures = {}
+                for i, obj in enumerate(objects):
+                    if self._apply_tier(obj) != tier:
+                        continue
+                    # discovery is not thread safe, resources are resolved before submitting requests
+                    try:
+                        resource = self.get_dynamic_resource(obj.get('apiVersion'), obj.get('kind'))
+                    except Exception as e:
+                        resource = e
+                    futures[i] = executor.submit(self._apply_manifest, resource, obj, namespace, field_manager,
+                                                 force_conflicts)
+                for i, future in futures.items():
+                    results[i] = future.result()
+        failed = [result for result in results if result['status'] == 'failed']
+        for result in failed:
+            logger.error(f'{result["kind"]} "{result["name"]}" not applied: {result["error"]}')
+        if failed and fail_on_error:
+            raise AssertionError(f'{len(failed)} of {len(results)} objects not applied')
+        return results
+
     def reload_config(self, kube_config=None, context=None, api_url=None, bearer_token=None, ca_cert=None,
-                      incluster=False, cert_validation=True):
+                      incluster=False, cert_validation=True, informers=False, page_size=None, raw=False,
+                      discovery_cache_dir=None, discovery_cache_ttl=DISCOVERY_CACHE_TTL, pool_maxsize=None,
+                      tcp_keepalive=False, connect_timeout=None, read_timeout=None, retries=None,
+                      request_stats=False, response_cache_ttl=None, response_cache_size=256):
         """Reload the KubeLibrary to be configured with different optional arguments.
            This can be used to connect to a different cluster during the same test.
         - ``kube_config``:
@@ -246,13 +824,66 @@ class KubeLibrary:
           Default False. Indicates if used from within k8s cluster. Overrides kubeconfig.
         - ``cert_validation``:
           Default True. Can be set to False for self-signed certificates.
+        - ``informers``:
+          Default False. Serve list by pattern keywords from informers cache, see `Informers`.
+        - ``page_size``:
+          Default None. Number of objects fetched in single request by list keywords, see `Pagination`.
+        - ``raw``:
+          Default False. Decode list and read responses without client models, see `Raw mode`.
+        - ``discovery_cache_dir``:
+          Directory of dynamic client discovery cache, system temp directory by default, see `Discovery cache`.
+        - ``discovery_cache_ttl``:
+          Default 1 hour. Time after which discovery cache is refreshed, see `Discovery cache`.
+        - ``pool_maxsize``:
+          Number of connections kept open to API server, by default 5 per CPU, see `Connections`.
+        - ``tcp_keepalive``:
+          Default False. Send TCP keep-alive probes on idle connections, see `Connections`.
+        - ``connect_timeout``:
+          Default None. Time to wait for connection to API server e.g. 5s, see `Connections`.
+        - ``read_timeout``:
+          Default None. Time to wait for response data, not applied to watches and followed logs, see `Connections`.
+        - ``retries``:
+          Default None. Number of retries of failed connections and 429, 502, 503 and 504 responses of
+          idempotent requests, see `Connections`.
+        - ``request_stats``:
+          Default False. Record API requests sent by each keyword, see `Request stats`.
+        - ``response_cache_ttl``:
+          Default None. Time results of read-only keywords are cached e.g. 1 min, see `Response cache`.
+        - ``response_cache_size``:
+          Default 256. Maximum number of cached keyword results, see `Response cache`.
 
         Environment variables:
         - HTTP_PROXY:
           Proxy URL
         """
-        self.api_client = None
+        if getattr(self, 'informers', None):
+            self.stop_informers()
+        configuration = None
+        self._kube_config = kube_config
+        self._settings = dict(informers=informers, page_size=page_size, raw=raw,
+                              discovery_cache_dir=discovery_cache_dir, discovery_cache_ttl=discovery_cache_ttl,
+                              pool_maxsize=pool_maxsize, tcp_keepalive=tcp_keepalive, connect_timeout=connect_timeout,
+                              read_timeout=read_timeout, retries=retries, request_stats=request_stats,
+                              response_cache_ttl=response_cache_ttl, response_cache_size=response_cache_size)
+        if request_stats:
+            self.request_stats = self.__dict__.get('request_stats') or RequestStats()
+        else:
+            self.request_stats = None
+        # new cluster or credentials, results cached so far are dropped
+        if response_cache_ttl:
+            self.response_cache = ResponseCache(CACHED_KEYWORDS, MUTATING_KEYWORDS, ANY_NAMESPACE_MUTATING_KEYWORDS,
+                                                maxsize=response_cache_size,
+                                                ttl=timestr_to_secs(response_cache_ttl))
+        else:
+            self.response_cache = None
         self.cert_validation = cert_validation
+        self.use_informers = informers
+        self.informers = {}
+        self._informers_lock = threading.Lock()
+        self.page_size = int(page_size) if page_size else None
+        self.raw = raw
+        self.discovery_cache_dir = discovery_cache_dir or tempfile.gettempdir()
+        self.discovery_cache_ttl = timestr_to_secs(discovery_cache_ttl)
         if isinstance(api_url, str):
             api_url = api_url.strip()
         if isinstance(bearer_token, str):
@@ -269,19 +900,31 @@ class KubeLibrary:
             if bearer_token.startswith('Bearer '):
                 raise BearerTokenWithPrefixException
             configuration = client.Configuration.get_default_copy()
-            configuration.api_key["authorization"] = bearer_token
-            configuration.api_key_prefix['authorization'] = 'Bearer'
+            # hook and keys copied from kubeconfig loaded earlier would replace host and token of requests,
+            # newer clients look the key up under BearerToken name first
+            configuration.refresh_api_key_hook = None
+            configuration.api_key = {'authorization': bearer_token}
+            configuration.api_key_prefix = {'authorization': 'Bearer'}
             configuration.host = api_url
             configuration.ssl_ca_cert = ca_cert
-            self.api_client = client.ApiClient(configuration)
         else:
             try:
                 config.load_kube_config(kube_config, context)
             except TypeError:
                 logger.error('Neither KUBECONFIG nor ~/.kube/config available.')
 
-        if not self.api_client:
-            self.api_client = client.ApiClient(configuration=client.Configuration.get_default_copy())
+        if not configuration:
+            configuration = client.Configuration.get_default_copy()
+        if pool_maxsize:
+            configuration.connection_pool_maxsize = int(pool_maxsize)
+        if retries is not None:
+            configuration.retries = urllib3.Retry(total=int(retries), backoff_factor=0.5,
+                                                  status_forcelist=RETRY_STATUSES, raise_on_status=False)
+        self.api_client = ApiClient(configuration,
+                                    connect_timeout=timestr_to_secs(connect_timeout) if connect_timeout else None,
+                                    read_timeout=timestr_to_secs(read_timeout) if read_timeout else None,
+                                    tcp_keepalive=tcp_keepalive,
+                                    stats=self.request_stats)
 
         self._add_api('v1', client.CoreV1Api)
         self._add_api('networkingv1api', client.NetworkingV1Api)
@@ -291,20 +934,669 @@ class KubeLibrary:
         self._add_api('custom_object', client.CustomObjectsApi)
         self._add_api('rbac_authv1_api', client.RbacAuthorizationV1Api)
         self._add_api('autoscalingv1', client.AutoscalingV1Api)
-        self._add_api('dynamic', DynamicClient)
+        self._add_api('dynamic', lambda api_client: DynamicClient(api_client, cache_file=self._discovery_cache_file()))
+
+    def _cluster_library(self, cluster=None):
+        """Returns library of given cluster, or of cluster in use when None."""
+        name = cluster or self.__dict__.get('_active_cluster')
+        if not name:
+            return self
+        clusters = self.__dict__.get('_clusters', {})
+        if name not in clusters:
+            raise ValueError(f'Cluster "{name}" not added, use Add Cluster first')
+        return clusters[name]
+
+    def add_cluster(self, name, kube_config=None, context=None, api_url=None, bearer_token=None, ca_cert=None,
+                    incluster=False, cert_validation=True):
+        """Adds cluster which can be used with `Use Cluster` or ``cluster`` argument of keywords, see `Clusters`.
+
+        Cluster gets its own API clients and connection pool, other settings (e.g. raw, page_size, pool_maxsize)
+        are the same as of this library. Cluster added with already used name replaces previous one.
+
+        | Add Cluster    cluster-2    kube_config=${KUBE_CONFIG2}    cert_validation=False
+        | K8s Api Ping    cluster=cluster-2
+
+        - ``name``:
+          Name used to refer to the cluster
+        - ``kube_config``:
+          Path pointing to kubeconfig of the cluster.
+        - ``context``:
+          Active context. If None current_context from kubeconfig is used.
+        - ``api_url``:
+          K8s API url, used for bearer token authenticaiton.
+        - ``bearer_token``:
+          Bearer token, used for bearer token authenticaiton. Do not include 'Bearer ' prefix.
+        - ``ca_cert``:
+          Optional CA certificate file path, used for bearer token authenticaiton.
+        - ``incuster``:
+          Default False. Indicates if used from within k8s cluster. Overrides kubeconfig.
+        - ``cert_validation``:
+          Default True. Can be set to False for self-signed certificates.
+        """
+        library = KubeLibrary(kube_config=kube_config, context=context, api_url=api_url, bearer_token=bearer_token,
+                              ca_cert=ca_cert, incluster=incluster, cert_validation=cert_validation,
+                              **self._settings)
+        # requests and profiles of all clusters are gathered together
+        library.request_stats = library.api_client.stats = self.request_stats
+        library.profiler = self.profiler
+        if '_clusters' not in self.__dict__:
+            self._clusters = {}
+        self.remove_cluster(name)
+        self._clusters[name] = library
+
+    def use_cluster(self, name=None):
+        """Makes keywords run against cluster added with `Add Cluster`, see `Clusters`.
+
+        Without name keywords use again cluster this library was configured with. Returns name of
+        previously used cluster, so it can be restored later.
+
+        | ${previous}=    Use Cluster    cluster-2
+        | List Namespace
+        | Use Cluster    ${previous}
+
+        - ``name``:
+          Name of cluster, default: None
+        """
+        self._cluster_library(name)
+        previous = self.__dict__.get('_active_cluster')
+        self._active_cluster = name or None
+        return previous
+
+    def remove_cluster(self, name):
+        """Removes cluster added with `Add Cluster`, stopping its informers.
+
+        When removed cluster is in use, keywords use again cluster this library was configured with.
+
+        - ``name``:
+          Name of cluster
+        """
+        library = self.__dict__.get('_clusters', {}).pop(name, None)
+        if library is not None:
+            library.stop_informers()
+        if self.__dict__.get('_active_cluster') == name:
+            self._active_cluster = None
+
+    def _discovery_cache_file(self):
+        """Returns discovery cache file for current cluster and credentials, removing it when expired."""
+        configuration = self.api_client.configuration
+        cache_id = hashlib.sha256(json.dumps([configuration.host, configuration.api_key, configuration.username],
+                                             sort_keys=True, default=str).encode())
+        # client certificates from kubeconfig are written to temporary files, so their content is hashed
+        for path in (configuration.cert_file, configuration.key_file):
+            if path and os.path.isfile(path):
+                with open(path, 'rb') as f:
+                    cache_id.update(f.read())
+        cache_file = os.path.join(self.discovery_cache_dir, f'kubelibrary-discovery-{cache_id.hexdigest()}.json')
+        try:
+            if time.time() - os.path.getmtime(cache_file) > self.discovery_cache_ttl:
+                os.remove(cache_file)
+        except OSError:
+            pass
+        return cache_file
 
     def _add_api(self, reference, class_name):
-        self.__dict__[reference] = class_name(self.api_client)
-        if not self.cert_validation:
-            self.__dict__[reference].api_client.rest_client.pool_manager.connection_pool_kw['cert_reqs'] = ssl.CERT_NONE
+        """Registers API created with current api_client on first access of given attribute."""
+        if '_apis' not in self.__dict__:
+            self._apis = {}
+            self._apis_lock = threading.Lock()
+        self._apis[reference] = class_name
+        self.__dict__.pop(reference, None)
+
+    def __getattr__(self, name):
+        apis = self.__dict__.get('_apis', {})
+        if name not in apis:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        with self._apis_lock:
+            if name not in self.__dict__:
+                api = apis[name](self.api_client)
+                if not self.cert_validation:
+                    api.api_client.rest_client.pool_manager.connection_pool_kw['cert_reqs'] = ssl.CERT_NONE
+                self.__dict__[name] = api
+        return self.__dict__[name]
+
+    def _request_stats(self):
+        if self.request_stats is None:
+            raise RuntimeError('Request stats are disabled, set request_stats=True library argument')
+        return self.request_stats
+
+    def get_kube_request_stats(self, reset=False):
+        """Returns API requests recorded for each keyword, see `Request stats`.
+
+        Returns dictionary of keyword names and dictionaries with number of ``requests``, number of ``errors``
+        (no response or status other than 2xx and 3xx), total ``seconds``, received ``bytes``, counts of
+        ``statuses`` and counts of request durations in histogram ``buckets`` (upper bounds in seconds).
+
+        | &{stats}=    Get Kube Request Stats    reset=True
+        | Should Be True    ${stats}[list_namespaced_pod_by_pattern][requests] < 10
+
+        - ``reset``:
+          Default False. Clear stats after reading them
+        """
+        stats = self._request_stats()
+        ret = stats.to_dict()
+        if reset:
+            stats.reset()
+        return ret
+
+    def log_kube_request_stats(self):
+        """Logs table of API requests recorded for each keyword, see `Request stats`."""
+        lines = [f'{"Keyword":<50} {"Requests":>9} {"Errors":>7} {"Seconds":>10} {"Bytes":>12}']
+        for keyword, stats in self._request_stats().to_dict().items():
+            lines.append(f'{keyword or "(no keyword)":<50} {stats["requests"]:>9} {stats["errors"]:>7} '
+                         f'{stats["seconds"]:>10.3f} {stats["bytes"]:>12}')
+        logger.info('\n'.join(lines))
+
+    def write_kube_request_stats(self, path):
+        """Writes API requests recorded for each keyword as Prometheus textfile, see `Request stats`.
+
+        File can be collected by node exporter textfile collector or pushed to Pushgateway.
+
+        - ``path``:
+          Path of written file, should end with .prom for textfile collector
+        """
+        self._request_stats().write_textfile(path)
+
+    def flush_kube_response_cache(self):
+        """Drops all results cached for cluster in use, see `Response cache`.
+
+        Should be called after objects were changed outside of library, e.g. with kubectl. Does nothing
+        when response cache is not enabled.
+
+        | Run Process    kubectl    apply    -f    service.yaml
+        | Flush Kube Response Cache
+        """
+        if self.response_cache is not None:
+            logger.info(f'Dropping {len(self.response_cache)} cached results, '
+                        f'{self.response_cache.hits} hits and {self.response_cache.misses} misses so far')
+            self.response_cache.flush()
+
+    def _list_func(self, kind, namespace=None):
+        api, namespaced_method, cluster_method = LIST_METHODS[kind]
+        return getattr(getattr(self, api), namespaced_method if namespace else cluster_method)
+
+    def _informer(self, kind, namespace, label_selector="", field_selector=""):
+        key = (kind, namespace, label_selector, field_selector)
+        # keywords run concurrently must not start two informers of the same key
+        with self._informers_lock:
+            if key not in self.informers:
+                kwargs = {'field_selector': field_selector} if field_selector else {}
+                args = (namespace,) if namespace else ()
+                self.informers[key] = Informer(self._list_func(kind, namespace), *args,
+                                               label_selector=label_selector, **kwargs).start()
+            return self.informers[key]
+
+    def _drop_informer(self, informer):
+        """Stops informer which failed to sync, so it does not keep retrying and next call starts new one."""
+        with self._informers_lock:
+            self.informers = {key: value for key, value in self.informers.items() if value is not informer}
+        informer.stop()
+
+    @staticmethod
+    def _continue_token(ret):
+        if isinstance(ret, dict):
+            return ret.get('metadata', {}).get('continue')
+        return getattr(getattr(ret, 'metadata', None), '_continue', None)
+
+    def _pages(self, list_func, *args, page_size=None, **kwargs):
+        """Yields list responses, following continue tokens when page size is set."""
+        page_size = page_size or self.page_size
+        if page_size:
+            kwargs['limit'] = page_size
+        while True:
+            ret = list_func(*args, **kwargs)
+            yield ret
+            token = self._continue_token(ret) if page_size else None
+            if not token:
+                return
+            kwargs['_continue'] = token
+
+    @staticmethod
+    def _resource_path(kind, namespace=None):
+        group_version, plural = RESOURCE_PATHS[kind]
+        if namespace:
+            return f'{group_version}/namespaces/{namespace}/{plural}'
+        return f'{group_version}/{plural}'
+
+    def _list_metadata(self, resource_path, watch=False, label_selector=None, field_selector=None, limit=None,
+                       _continue=None):
+        query_params = [(key, value) for key, value in (('labelSelector', label_selector),
+                                                        ('fieldSelector', field_selector),
+                                                        ('limit', limit),
+                                                        ('continue', _continue)) if value]
+        resp = self._call_api(
+            resource_path, 'GET',
+            {},
+            query_params,
+            {'Accept': PARTIAL_OBJECT_METADATA_LIST},
+            auth_settings=['BearerToken'],
+            _return_http_data_only=True,
+            _preload_content=False)
+        return KubeObject(loads(resp.data))
+
+    def _request(self, func, *args, **kwargs):
+        """Calls typed API function, in raw mode skipping client models and decoding JSON into KubeObject."""
+        if not self.raw:
+            return func(*args, **kwargs)
+        return KubeObject(loads(func(*args, _preload_content=False, **kwargs).data))
+
+    def _list_pages(self, kind, namespace=None, label_selector="", page_size=None, field_selector="",
+                    metadata_only=False):
+        if metadata_only:
+            list_func, args = self._list_metadata, (self._resource_path(kind, namespace),)
+        else:
+            list_func = partial(self._request, self._list_func(kind, namespace))
+            args = (namespace,) if namespace else ()
+        kwargs = {'label_selector': label_selector} if label_selector else {}
+        if field_selector:
+            kwargs['field_selector'] = field_selector
+        for ret in self._pages(list_func, *args, watch=False, page_size=page_size, **kwargs):
+            yield ret.items
+
+    def _list(self, kind, namespace=None, label_selector="", field_selector="", metadata_only=False):
+        return [item for page in self._list_pages(kind, namespace, label_selector, field_selector=field_selector,
+                                                  metadata_only=metadata_only)
+                for item in page]
+
+    @staticmethod
+    def _plan_name_query(name_pattern):
+        """Picks cheapest way of matching names against pattern used with re.match.
+
+        Returns tuple of (name for metadata.name field selector, name matching function), None values
+        meaning that the step is not needed.
+        """
+        if name_pattern in ('', '.*'):
+            return None, None
+        pattern = name_pattern[1:] if name_pattern.startswith('^') else name_pattern
+        exact = pattern.endswith('$') and not pattern.endswith('\\$')
+        literal = pattern[:-1] if exact else pattern
+        if not LITERAL_NAME_PATTERN.fullmatch(literal):
+            return None, re.compile(name_pattern).match
+        literal = literal.replace('\\', '')
+        if exact:
+            return literal, None
+        return None, lambda name: name.startswith(literal)
+
+    def _list_by_pattern(self, kind, name_pattern, namespace, label_selector="", field_selector="",
+                         metadata_only=False):
+        name, match = self._plan_name_query(name_pattern)
+        if self.use_informers:
+            informer = self._informer(kind, namespace, label_selector, field_selector)
+            try:
+                informer.wait_for_sync(INFORMER_SYNC_TIMEOUT)
+            except Exception:
+                self._drop_informer(informer)
+                raise
+            items = informer.items()
+            if name:
+                items = [item for item in items if item.metadata.name == name]
+        else:
+            if name:
+                field_selector = ','.join(filter(None, [f'metadata.name={name}', field_selector]))
+            items = self._list(kind, namespace, label_selector, field_selector, metadata_only)
+        if not match:
+            return items
+        return [item for item in items if match(item.metadata.name)]
+
+    def _list_custom_object(self, list_func, *args):
+        ret = None
+        for page in self._pages(list_func, *args):
+            if ret is None:
+                ret = page
+            else:
+                ret['items'].extend(page['items'])
+        ret.get('metadata', {}).pop('continue', None)
+        return ret
+
+    def iterate_objects(self, kind, namespace=None, name_pattern='.*', label_selector="", field_selector="",
+                        page_size=None, metadata_only=False):
+        """Iterates over objects of given kind matching pattern, fetching them page by page.
+
+        Unlike list keywords, objects are not gathered into single list so only one page is held in memory.
+        Meant to be used in FOR loops or from Python code.
+
+        Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Returns generator of objects.
+
+        | ${pods}=    Iterate Objects    Pod    ${namespace}
+        | FOR    ${pod}    IN    @{pods}
+        |     Log    ${pod.metadata.name}
+        | END
+
+        - ``kind``:
+          Kind of objects e.g. Pod, ConfigMap, Namespace
+        - ``namespace``:
+          Namespace to check, if not set objects from all namespaces are iterated
+        - ``name_pattern``:
+          Object name pattern to match
+        - ``page_size``:
+          Objects fetched in single request, defaults to library page_size or 500
+        - ``metadata_only``:
+          Default False. Fetch only objects metadata, see `Metadata only`.
+        """
+        page_size = int(page_size) if page_size else self.page_size or DEFAULT_PAGE_SIZE
+        name, match = self._plan_name_query(name_pattern)
+        if name:
+            field_selector = ','.join(filter(None, [f'metadata.name={name}', field_selector]))
+        for page in self._list_pages(kind, namespace, label_selector, page_size, field_selector, metadata_only):
+            for item in page:
+                if not match or match(item.metadata.name):
+                    yield item
+
+    def iterate_custom_objects(self, group, version, plural, namespace=None, name_pattern='.*', label_selector="",
+                               field_selector="", page_size=None):
+        """Iterates over custom objects matching pattern, fetching them page by page.
+
+        Like `Iterate Objects`, but for custom resources, which are returned as dictionaries.
+
+        Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Returns generator of objects.
+
+        | ${objects}=    Iterate Custom Objects    k8s.cni.cncf.io    v1    network-attachment-definitions
+        | FOR    ${object}    IN    @{objects}
+        |     Log    ${object}[metadata][name]
+        | END
+
+        - ``group``:
+          API Group, e.g. 'k8s.cni.cncf.io'
+        - ``version``:
+          API version, e.g. 'v1'
+        - ``plural``:
+          e.g. 'network-attachment-definitions'
+        - ``namespace``:
+          Namespace to check, if not set cluster level objects, or objects from all namespaces, are iterated
+        - ``name_pattern``:
+          Object name pattern to match
+        - ``page_size``:
+          Objects fetched in single request, defaults to library page_size or 500
+        """
+        page_size = int(page_size) if page_size else self.page_size or DEFAULT_PAGE_SIZE
+        name, match = self._plan_name_query(name_pattern)
+        if name:
+            field_selector = ','.join(filter(None, [f'metadata.name={name}', field_selector]))
+        kwargs = {'label_selector': label_selector} if label_selector else {}
+        if field_selector:
+            kwargs['field_selector'] = field_selector
+        if namespace:
+            pages = self._pages(self.custom_object.list_namespaced_custom_object, group, version, namespace, plural,
+                                page_size=page_size, **kwargs)
+        else:
+            pages = self._pages(self.custom_object.list_cluster_custom_object, group, version, plural,
+                                page_size=page_size, **kwargs)
+        for page in pages:
+            for item in page['items']:
+                if not match or match(item['metadata']['name']):
+                    yield item
+
+    def list_objects_in_namespaces(self, kind, namespaces=None, name_pattern='.*', label_selector="",
+                                   namespace_label_selector="", field_selector="", max_workers=10,
+                                   metadata_only=False, all_namespaces=False):
+        """Lists objects of given kind matching pattern in many namespaces at once.
+
+        Namespaces can be passed as list or picked by namespace label selector, if neither is set objects
+        from all namespaces are listed. Requests for separate namespaces are sent concurrently by at most
+        max_workers threads. With all_namespaces=True, or when no namespaces are given, objects are fetched
+        with single cluster wide request instead, which requires permission to list objects in all namespaces.
+
+        Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Returns dictionary of namespace names and lists of objects.
+
+        | @{namespaces}=    Create List    tenant-a    tenant-b
+        | &{pods}=    List Objects In Namespaces    Pod    ${namespaces}    name_pattern=nginx.*
+        | Length Should Be    ${pods}[tenant-a]    2
+        | &{pods}=    List Objects In Namespaces    Pod    namespace_label_selector=tenant=true
+
+        - ``kind``:
+          Kind of namespaced objects e.g. Pod, ConfigMap, Deployment
+        - ``namespaces``:
+          List of namespaces (or comma separated string) to check
+        - ``name_pattern``:
+          Object name pattern to match
+        - ``namespace_label_selector``:
+          Checks namespaces with matching labels e.g. tenant=true
+        - ``max_workers``:
+          Maximum number of concurrent requests, default 10
+        - ``metadata_only``:
+          Default False. Fetch only objects metadata, see `Metadata only`.
+        - ``all_namespaces``:
+          Default False. Fetch objects of given namespaces with single cluster wide request, e.g. when
+          checking hundreds of namespaces
+        """
+        if isinstance(namespaces, str):
+            namespaces = [namespace.strip() for namespace in namespaces.split(',') if namespace.strip()]
+        if namespace_label_selector:
+            selected = self.filter_names(self._list('Namespace', label_selector=namespace_label_selector,
+                                                    metadata_only=True))
+            namespaces = [ns for ns in namespaces if ns in selected] if namespaces is not None else selected
+        if namespaces is not None and not all_namespaces:
+            def list_namespace(namespace):
+                return self._list_by_pattern(kind, name_pattern, namespace, label_selector, field_selector,
+                                             metadata_only)
+            with keyword_executor(max_workers) as executor:
+                return dict(zip(namespaces, executor.map(list_namespace, namespaces)))
+        ret = {namespace: [] for namespace in namespaces or []}
+        for item in self._list_by_pattern(kind, name_pattern, None, label_selector, field_selector, metadata_only):
+            if namespaces is None or item.metadata.namespace in ret:
+                ret.setdefault(item.metadata.namespace, []).append(item)
+        return ret
+
+    def _keyword_call(self, call):
+        """Turns list of keyword name and its arguments into callable, named arguments are given as name=value."""
+        if isinstance(call, str):
+            call = [call]
+        name, *args = call
+        method_name = name.strip().lower().replace(' ', '_')
+        method = None if method_name.startswith('_') else getattr(type(self), method_name, None)
+        if not callable(method):
+            raise ValueError(f'No KubeLibrary keyword with name "{name}"')
+        method = getattr(self, method_name)
+        # arguments are resolved and converted by their types as when keyword is called from Robot Framework,
+        # e.g. metadata_only=False gives False and name=value given to **kwargs are named
+        spec = PythonArgumentParser().parse(method, name)
+        positional, named = spec.resolve(args)
+        return partial(method, *positional, **dict(named))
+
+    def run_keywords_concurrently(self, *calls, max_workers=10, fail_on_error=True):
+        """Runs many KubeLibrary keywords at once and returns their results in order of calls.
+
+        Each call is a list of keyword name followed by its arguments, named arguments are given as name=value.
+        Calls are executed by at most max_workers threads sharing this library instance and its connections,
+        so hundreds of API checks can be done from single Robot Framework process. Only KubeLibrary keywords
+        can be called.
+
+        Fails after all calls are done if any of them failed, unless fail_on_error=False. In that case
+        failed calls have the exception in place of result.
+
+        | ${pods}=    Create List    List Namespaced Pod By Pattern    .*    default    label_selector=app=web
+        | ${deployments}=    Create List    List Namespaced Deployment By Pattern    web.*    default
+        | @{results}=    Run Keywords Concurrently    ${pods}    ${deployments}    max_workers=20
+        | Length Should Be    ${results}[0]    3
+
+        - ``calls``:
+          Lists of keyword name and arguments
+        - ``max_workers``:
+          Maximum number of keywords executed at once, default 10
+        - ``fail_on_error``:
+          Default True. Fail keyword when any call failed
+        """
+        funcs = [self._keyword_call(call) for call in calls]
+
+        def run(func):
+            try:
+                return func()
+            except Exception as e:
+                return e
+        with keyword_executor(max_workers) as executor:
+            results = list(executor.map(run, funcs))
+        failed = 0
+        for func, result in zip(funcs, results):
+            if isinstance(result, Exception):
+                failed += 1
+                logger.error(f'{func.func.__name__} failed: {result}')
+        if failed and fail_on_error:
+            raise AssertionError(f'{failed} of {len(results)} keywords failed')
+        return results
+
+    def run_keyword_on_clusters(self, clusters, keyword, *args, max_workers=10):
+        """Runs KubeLibrary keyword against many clusters at once, see `Clusters`.
+
+        Clusters not added with `Add Cluster` are added as contexts of kubeconfig this library was configured with.
+        Keyword is executed by at most max_workers threads, so checks of whole fleet take the time of the slowest
+        cluster. Named arguments are given as name=value.
+
+        Returns dictionary of cluster names and dictionaries with ``status`` (PASS or FAIL), ``result`` of keyword,
+        ``error`` message and ``duration`` in seconds. Keyword does not fail when keyword failed on some clusters.
+
+        | @{contexts}=    Create List    gke-eu    gke-us    gke-asia
+        | &{versions}=    Run Keyword On Clusters    ${contexts}    K8s Version
+        | &{deployments}=    Run Keyword On Clusters    ${contexts}    List Namespaced Deployment By Pattern
+        | ...    web.*    default    label_selector=tier=frontend
+        | FOR    ${cluster}    ${outcome}    IN    &{deployments}
+        |     Should Be Equal    ${outcome}[status]    PASS    ${cluster}: ${outcome}[error]
+        | END
+
+        - ``clusters``:
+          List of cluster names (or comma separated string)
+        - ``keyword``:
+          Name of KubeLibrary keyword
+        - ``args``:
+          Arguments of keyword
+        - ``max_workers``:
+          Maximum number of clusters checked at once, default 10
+        """
+        if isinstance(clusters, str):
+            clusters = [cluster.strip() for cluster in clusters.split(',') if cluster.strip()]
+        for cluster in clusters:
+            if cluster not in self.__dict__.get('_clusters', {}):
+                self.add_cluster(cluster, kube_config=self._kube_config, context=cluster,
+                                 cert_validation=self.cert_validation)
+        call = self._keyword_call([keyword, *args])
+        per_cluster = 'cluster' in inspect.signature(call).parameters
+
+        def run(cluster):
+            start = time.monotonic()
+            try:
+                result = call(cluster=cluster) if per_cluster else call()
+                outcome = {'status': 'PASS', 'result': result, 'error': None}
+            except Exception as e:
+                outcome = {'status': 'FAIL', 'result': None, 'error': f'{type(e).__name__}: {e}'}
+            outcome['duration'] = round(time.monotonic() - start, 3)
+            return outcome
+        with keyword_executor(max_workers) as executor:
+            outcomes = dict(zip(clusters, executor.map(run, clusters)))
+        for cluster, outcome in outcomes.items():
+            if outcome['status'] == 'FAIL':
+                logger.warn(f'{keyword} failed on cluster {cluster}: {outcome["error"]}')
+        return outcomes
+
+    @staticmethod
+    def _has_condition(obj, condition_type, status):
+        conditions = obj.status.conditions if obj.status else None
+        return any(c.type == condition_type and c.status == status for c in conditions or [])
+
+    def wait_for_condition(self, kind, name_pattern, namespace, condition_type, status='True', label_selector="",
+                           timeout='60s'):
+        """Waits until all objects of given kind matching pattern in given namespace have condition with status.
+
+        Objects are listed once and then single watch is opened on the namespace, keyword returns as soon as
+        the condition is met. At least one object matching pattern is required.
+
+        Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Returns list of matching objects. Fails with TimeoutError when condition is not met within timeout.
+
+        | @{jobs}=    Wait For Condition    Job    busybox.*    ${namespace}    Complete    timeout=2min
+
+        - ``kind``:
+          Kind of objects e.g. Pod, Deployment, Job
+        - ``name_pattern``:
+          Name pattern of objects to wait for
+        - ``namespace``:
+          Namespace to check
+        - ``condition_type``:
+          Type of condition from status.conditions e.g. Ready, Available, Complete
+        - ``status``:
+          Expected condition status, default 'True'
+        - ``timeout``:
+          Maximum time to wait e.g. 30s or 2min
+        """
+        r = re.compile(name_pattern)
+        matching = []
+
+        def condition_met(items):
+            matching[:] = [item for item in items if r.match(item.metadata.name)]
+            return bool(matching) and all(self._has_condition(item, condition_type, status) for item in matching)
+
+        timeout = timestr_to_secs(timeout)
+        if self.use_informers:
+            informer = self._informer(kind, namespace, label_selector)
+        else:
+            informer = Informer(self._list_func(kind, namespace), namespace, label_selector=label_selector,
+                                watch_timeout=max(1, int(timeout))).start()
+        try:
+            met = informer.wait_until(condition_met, timeout)
+        except Exception:
+            if self.use_informers:
+                self._drop_informer(informer)
+            raise
+        finally:
+            if not self.use_informers:
+                informer.stop()
+        if not met:
+            raise TimeoutError(f'{kind} matching "{name_pattern}" in namespace "{namespace}" did not reach '
+                               f'condition {condition_type}={status} within {timeout}s')
+        return matching
+
+    def wait_until_pods_ready(self, name_pattern, namespace, label_selector="", timeout='60s'):
+        """Waits until all pods matching pattern in given namespace are Ready.
+
+        Uses single watch instead of polling, see `Wait For Condition`.
+
+        Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Returns list of pods. Fails with TimeoutError when pods are not ready within timeout.
+
+        - ``name_pattern``:
+          Pod name pattern to check
+        - ``namespace``:
+          Namespace to check
+        - ``timeout``:
+          Maximum time to wait e.g. 30s or 2min
+        """
+        return self.wait_for_condition('Pod', name_pattern, namespace, 'Ready', label_selector=label_selector,
+                                       timeout=timeout)
+
+    def stop_informers(self):
+        """Stops all informers started in informers mode and drops their local cache.
+
+        Informers are started again on next list by pattern keyword call.
+        """
+        with self._informers_lock:
+            for informer in self.informers.values():
+                informer.stop()
+            self.informers = {}
 
     def _call_api(self, resource_path, method, path_params, query_params,
                   header_params, response_type='str', auth_settings=None,
-                  async_req=False, _return_http_data_only=False):
+                  async_req=False, _return_http_data_only=False, _preload_content=True):
+        api_client = self.v1.api_client
+        if hasattr(api_client, 'param_serialize'):
+            return self._send_api_request(api_client, resource_path, method, path_params, query_params,
+                                          header_params, response_type, auth_settings, _return_http_data_only,
+                                          _preload_content)
         kwargs = {
             'auth_settings': auth_settings,
             'async_req': async_req,
             '_return_http_data_only': _return_http_data_only,
+            '_preload_content': _preload_content,
         }
         if 'response_types_map' in inspect.signature(
                 self.v1.api_client.call_api).parameters:
@@ -318,6 +1610,26 @@ class KubeLibrary:
             header_params,
             **kwargs)
 
+    @staticmethod
+    def _send_api_request(api_client, resource_path, method, path_params, query_params, header_params,
+                          response_type, auth_settings, _return_http_data_only, _preload_content):
+        """Sends request with clients generated since v36, which build requests apart from sending them.
+
+        Returns the same as call_api of older clients: urllib3 response when _preload_content is False,
+        otherwise response data alone or tuple of (data, status, headers).
+        """
+        request = api_client.param_serialize(method, resource_path, path_params, query_params, header_params,
+                                             auth_settings=auth_settings)
+        resp = api_client.call_api(*request)
+        if not _preload_content:
+            if not 200 <= resp.status <= 299:
+                resp.read()
+                raise client.ApiException(http_resp=resp)
+            return resp.response
+        resp.read()
+        data = api_client.response_deserialize(resp, {'default': response_type}).data
+        return data if _return_http_data_only else (data, resp.status, resp.getheaders())
+
     def k8s_api_ping(self):
         """Performs GET on /api/v1/ for simple check of API availability.
 
@@ -359,15 +1671,16 @@ class KubeLibrary:
         version = ast.literal_eval(resp[0])
         return version
 
-    def list_namespace(self, label_selector=""):
+    def list_namespace(self, label_selector="", metadata_only=False):
         """Lists available namespaces.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of namespaces.
         """
-        ret = self.v1.list_namespace(watch=False, label_selector=label_selector)
-        return ret.items
+        return self._list('Namespace', label_selector=label_selector, metadata_only=metadata_only)
 
     def get_namespaces(self, label_selector=""):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_namespace.
@@ -377,7 +1690,7 @@ class KubeLibrary:
 
         Returns list of namespaces names.
         """
-        return self.filter_names(self.list_namespace(label_selector=label_selector))
+        return self.filter_names(self._list('Namespace', label_selector=label_selector, metadata_only=True))
 
     def get_healthy_nodes_count(self, label_selector=""):
         """Counts node with KubeletReady and status True.
@@ -386,9 +1699,9 @@ class KubeLibrary:
 
         Can be used to check number of healthy nodes. Can be used as prerequisite in tests.
         """
-        ret = self.v1.list_node(watch=False, label_selector=label_selector)
+        items = self._list('Node', label_selector=label_selector)
         healthy_nods = []
-        for item in ret.items:
+        for item in items:
             for condition in item.status.conditions:
                 if condition.reason == 'KubeletReady' and condition.status == 'True':
                     healthy_nods.append(item.metadata.name)
@@ -407,15 +1720,20 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_pod(namespace, watch=False, label_selector=label_selector)
+        items = self._list('Pod', namespace, label_selector, metadata_only=True)
         r = re.compile(name_pattern + '.*')
-        return [item.metadata.name for item in ret.items if r.match(item.metadata.name)]
+        return [item.metadata.name for item in items if r.match(item.metadata.name)]
 
-    def list_namespaced_pod_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_pod_by_pattern(self, name_pattern, namespace,
+                                       label_selector="", field_selector="", metadata_only=False):
         """List pods matching pattern in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can be optionally filtered by field. e.g. field_selector=status.phase=Running
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of pods.
 
         - ``name_pattern``:
@@ -423,9 +1741,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_pod(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        pods = [item for item in ret.items if r.match(item.metadata.name)]
+        pods = self._list_by_pattern('Pod', name_pattern, namespace, label_selector, field_selector, metadata_only)
         return pods
 
     def get_pods_in_namespace(self, name_pattern, namespace, label_selector=""):
@@ -441,16 +1757,19 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_pod(namespace, watch=False, label_selector=label_selector)
+        items = self._list('Pod', namespace, label_selector)
         r = re.compile(name_pattern)
-        pods = [item for item in ret.items if r.match(item.metadata.name)]
+        pods = [item for item in items if r.match(item.metadata.name)]
         return pods
 
-    def read_namespaced_pod_log(self, name, namespace, container, since_seconds=None):
+    def read_namespaced_pod_log(self, name, namespace, container, since_seconds=None, tail_lines=None,
+                                limit_bytes=None):
         """Gets container logs of given pod in given namespace.
 
         Can be optionally filtered by time in seconds. e.g. since_seconds=1000.
 
+        Can be optionally limited to last lines or first bytes. e.g. tail_lines=100 or limit_bytes=65536.
+
         Returns logs.
 
         - ``name``:
@@ -461,9 +1780,179 @@ class KubeLibrary:
           Container to check
         """
         pod_logs = self.v1.read_namespaced_pod_log(name=name, namespace=namespace, container=container, follow=False,
-                                                   since_seconds=since_seconds)
+                                                   since_seconds=since_seconds, tail_lines=tail_lines,
+                                                   limit_bytes=limit_bytes)
         return pod_logs
 
+    @staticmethod
+    def _iter_lines(resp):
+        """Yields decoded lines of streamed response as they arrive, including last line without newline."""
+        buffer = b''
+        try:
+            for chunk in resp.stream(LOG_CHUNK_SIZE, decode_content=True):
+                buffer += chunk.encode() if isinstance(chunk, str) else chunk
+                *lines, buffer = buffer.split(b'\n')
+                for line in lines:
+                    yield line.decode('utf-8', errors='replace')
+            if buffer:
+                yield buffer.decode('utf-8', errors='replace')
+        finally:
+            resp.release_conn()
+
+    def iterate_pod_log_lines(self, name, namespace, container, since_seconds=None, tail_lines=None, follow=False,
+                              limit_bytes=None):
+        """Iterates over container log lines of given pod in given namespace.
+
+        Lines are read from open connection as they come, so whole log is never held in memory. With follow=True
+        iteration continues with new lines until container stops. Meant to be used in FOR loops or from Python code.
+
+        Can be optionally filtered by time in seconds. e.g. since_seconds=1000.
+
+        Can be optionally limited to last lines or first bytes. e.g. tail_lines=100 or limit_bytes=65536.
+
+        Returns generator of lines.
+
+        | ${lines}=    Iterate Pod Log Lines    ${pod_name}    ${namespace}    busybox
+        | FOR    ${line}    IN    @{lines}
+        |     Should Not Contain    ${line}    ERROR
+        | END
+
+        - ``name``:
+          Pod name to check
+        - ``namespace``:
+          Namespace to check
+        - ``container``:
+          Container to check
+        - ``follow``:
+          Default False. Keep reading new lines until container stops
+        """
+        resp = self.v1.read_namespaced_pod_log(name=name, namespace=namespace, container=container, follow=follow,
+                                               since_seconds=since_seconds, tail_lines=tail_lines,
+                                               limit_bytes=limit_bytes, _preload_content=False)
+        return self._iter_lines(resp)
+
+    def wait_until_pod_log_contains(self, name, namespace, container, pattern, timeout='60s', since_seconds=None,
+                                    tail_lines=None):
+        """Waits until container log of given pod in given namespace has line matching pattern.
+
+        Log is followed and each line is checked as soon as it arrives, keyword returns on first match.
+
+        Can be optionally filtered by time in seconds. e.g. since_seconds=1000.
+
+        Can be optionally limited to last lines. e.g. tail_lines=100.
+
+        Returns matching line. Fails with TimeoutError when no line matches within timeout.
+
+        | ${line}=    Wait Until Pod Log Contains    ${pod_name}    ${namespace}    app    Server started on port
+
+        - ``name``:
+          Pod name to check
+        - ``namespace``:
+          Namespace to check
+        - ``container``:
+          Container to check
+        - ``pattern``:
+          Regular expression searched in log lines
+        - ``timeout``:
+          Maximum time to wait e.g. 30s or 2min
+        """
+        timeout = timestr_to_secs(timeout)
+        deadline = time.monotonic() + timeout
+        r = re.compile(pattern)
+        # read timeout ends waiting on quiet log also when socket can not be shut down
+        resp = self.v1.read_namespaced_pod_log(name=name, namespace=namespace, container=container, follow=True,
+                                               since_seconds=since_seconds, tail_lines=tail_lines,
+                                               _preload_content=False,
+                                               _request_timeout=(self.api_client.connect_timeout or timeout, timeout))
+        timer = threading.Timer(timeout, shutdown_response, (resp,))
+        timer.start()
+        lines = self._iter_lines(resp)
+        try:
+            for line in lines:
+                if r.search(line):
+                    return line
+                if time.monotonic() > deadline:
+                    break
+        except Exception:
+            if time.monotonic() < deadline:
+                raise
+        finally:
+            timer.cancel()
+            resp.close()
+            lines.close()
+        raise TimeoutError(f'Log of container {container} in pod {name} has no line matching "{pattern}" '
+                           f'within {timeout}s')
+
+    def _save_pod_log(self, name, namespace, container, path, compress, since_seconds, tail_lines):
+        entry = {'pod': name, 'container': container, 'path': path, 'bytes': 0, 'error': None}
+        try:
+            resp = self.v1.read_namespaced_pod_log(name=name, namespace=namespace, container=container, follow=False,
+                                                   since_seconds=since_seconds, tail_lines=tail_lines,
+                                                   _preload_content=False)
+            try:
+                with (gzip.open if compress else open)(path, 'wb') as f:
+                    for chunk in resp.stream(LOG_CHUNK_SIZE, decode_content=True):
+                        f.write(chunk)
+                        entry['bytes'] += len(chunk)
+            finally:
+                resp.release_conn()
+        except Exception as e:
+            entry['error'] = str(e)
+        return entry
+
+    def collect_pod_logs(self, name_pattern, namespace, output_dir, label_selector="", container_pattern='.*',
+                         compress=False, since_seconds=None, tail_lines=None, max_workers=10):
+        """Saves logs of all containers of pods matching pattern in given namespace to files.
+
+        Logs are streamed straight to files, by at most max_workers threads at once. Each container log is saved
+        as <output_dir>/<namespace>/<pod>/<container>.log (.log.gz when compressed), init containers included.
+        Manifest of collected logs is saved as <output_dir>/<namespace>/manifest.json.
+
+        Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Can be optionally filtered by time in seconds. e.g. since_seconds=1000.
+
+        Returns manifest, list of dictionaries with pod, container, path, bytes and error (None when log was saved).
+
+        | ${manifest}=    Collect Pod Logs    .*    ${namespace}    ${OUTPUT DIR}/logs    compress=True
+
+        - ``name_pattern``:
+          Pod name pattern to check
+        - ``namespace``:
+          Namespace to check
+        - ``output_dir``:
+          Directory where logs are saved
+        - ``container_pattern``:
+          Container name pattern to match
+        - ``compress``:
+          Default False. Save logs gzip compressed
+        - ``tail_lines``:
+          Save only given number of last lines of each log
+        - ``max_workers``:
+          Maximum number of logs downloaded at once, default 10
+        """
+        r = re.compile(container_pattern)
+        tasks = []
+        for pod in self._list_by_pattern('Pod', name_pattern, namespace, label_selector):
+            pod_dir = os.path.join(output_dir, namespace, pod.metadata.name)
+            for container in (pod.spec.init_containers or []) + (pod.spec.containers or []):
+                if r.match(container.name):
+                    os.makedirs(pod_dir, exist_ok=True)
+                    path = os.path.join(pod_dir, f'{container.name}.log{".gz" if compress else ""}')
+                    tasks.append((pod.metadata.name, container.name, path))
+        with keyword_executor(max_workers) as executor:
+            manifest = list(executor.map(lambda task: self._save_pod_log(task[0], namespace, task[1], task[2],
+                                                                         compress, since_seconds, tail_lines),
+                                         tasks))
+        os.makedirs(os.path.join(output_dir, namespace), exist_ok=True)
+        with open(os.path.join(output_dir, namespace, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=2)
+        for entry in manifest:
+            if entry['error']:
+                logger.warn(f'Log of container {entry["container"]} in pod {entry["pod"]} not saved: '
+                            f'{entry["error"]}')
+        return manifest
+
     def get_pod_logs(self, name, namespace, container):
         """*DEPRECATED* Will be removed in v1.0.0. Use read_namespaced_pod_log.
         Gets container logs of given pod in given namespace.
@@ -480,11 +1969,16 @@ class KubeLibrary:
         pod_logs = self.v1.read_namespaced_pod_log(name=name, namespace=namespace, container=container, follow=False)
         return pod_logs
 
-    def list_namespaced_config_map_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_config_map_by_pattern(self, name_pattern, namespace,
+                                              label_selector="", field_selector="", metadata_only=False):
         """Lists configmaps matching pattern in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of configmaps.
 
         - ``name_pattern``:
@@ -492,9 +1986,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_config_map(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        configmaps = [item for item in ret.items if r.match(item.metadata.name)]
+        configmaps = self._list_by_pattern('ConfigMap', name_pattern, namespace, label_selector, field_selector,
+                                           metadata_only)
         return configmaps
 
     def get_configmaps_in_namespace(self, name_pattern, namespace, label_selector=""):
@@ -510,16 +2003,21 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_config_map(namespace, watch=False, label_selector=label_selector)
+        items = self._list('ConfigMap', namespace, label_selector)
         r = re.compile(name_pattern)
-        configmaps = [item for item in ret.items if r.match(item.metadata.name)]
+        configmaps = [item for item in items if r.match(item.metadata.name)]
         return configmaps
 
-    def list_namespaced_service_account_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_service_account_by_pattern(self, name_pattern, namespace,
+                                                   label_selector="", field_selector="", metadata_only=False):
         """Lists service accounts matching pattern in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of service accounts.
 
         - ``name_pattern``:
@@ -527,9 +2025,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_service_account(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        service_accounts = [item for item in ret.items if r.match(item.metadata.name)]
+        service_accounts = self._list_by_pattern('ServiceAccount', name_pattern, namespace, label_selector, field_selector,
+                                                 metadata_only)
         return service_accounts
 
     def get_service_accounts_in_namespace(self, name_pattern, namespace, label_selector=""):
@@ -545,16 +2042,21 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_service_account(namespace, watch=False, label_selector=label_selector)
+        items = self._list('ServiceAccount', namespace, label_selector)
         r = re.compile(name_pattern)
-        service_accounts = [item for item in ret.items if r.match(item.metadata.name)]
+        service_accounts = [item for item in items if r.match(item.metadata.name)]
         return service_accounts
 
-    def list_namespaced_deployment_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_deployment_by_pattern(self, name_pattern, namespace,
+                                              label_selector="", field_selector="", metadata_only=False):
         """Gets deployments matching pattern in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of deployments.
 
         - ``name_pattern``:
@@ -562,9 +2064,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.list_namespaced_deployment(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        deployments = [item for item in ret.items if r.match(item.metadata.name)]
+        deployments = self._list_by_pattern('Deployment', name_pattern, namespace, label_selector, field_selector,
+                                            metadata_only)
         return deployments
 
     def get_deployments_in_namespace(self, name_pattern, namespace, label_selector=""):
@@ -580,16 +2081,21 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.list_namespaced_deployment(namespace, watch=False, label_selector=label_selector)
+        items = self._list('Deployment', namespace, label_selector)
         r = re.compile(name_pattern)
-        deployments = [item for item in ret.items if r.match(item.metadata.name)]
+        deployments = [item for item in items if r.match(item.metadata.name)]
         return deployments
 
-    def list_namespaced_replica_set_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_replica_set_by_pattern(self, name_pattern, namespace,
+                                               label_selector="", field_selector="", metadata_only=False):
         """Lists replicasets matching pattern in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of  replicasets.
 
         - ``name_pattern``:
@@ -597,9 +2103,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.list_namespaced_replica_set(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        replicasets = [item for item in ret.items if r.match(item.metadata.name)]
+        replicasets = self._list_by_pattern('ReplicaSet', name_pattern, namespace, label_selector, field_selector,
+                                            metadata_only)
         return replicasets
 
     def get_replicasets_in_namespace(self, name_pattern, namespace, label_selector=""):
@@ -615,16 +2120,21 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.list_namespaced_replica_set(namespace, watch=False, label_selector=label_selector)
+        items = self._list('ReplicaSet', namespace, label_selector)
         r = re.compile(name_pattern)
-        replicasets = [item for item in ret.items if r.match(item.metadata.name)]
+        replicasets = [item for item in items if r.match(item.metadata.name)]
         return replicasets
 
-    def list_namespaced_job_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_job_by_pattern(self, name_pattern, namespace,
+                                       label_selector="", field_selector="", metadata_only=False):
         """Gets jobs matching pattern in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of jobs.
 
         - ``name_pattern``:
@@ -632,9 +2142,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.batchv1.list_namespaced_job(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        jobs = [item for item in ret.items if r.match(item.metadata.name)]
+        jobs = self._list_by_pattern('Job', name_pattern, namespace, label_selector, field_selector, metadata_only)
         return jobs
 
     def get_jobs_in_namespace(self, name_pattern, namespace, label_selector=""):
@@ -650,16 +2158,21 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.batchv1.list_namespaced_job(namespace, watch=False, label_selector=label_selector)
+        items = self._list('Job', namespace, label_selector)
         r = re.compile(name_pattern)
-        jobs = [item for item in ret.items if r.match(item.metadata.name)]
+        jobs = [item for item in items if r.match(item.metadata.name)]
         return jobs
 
-    def list_namespaced_secret_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_secret_by_pattern(self, name_pattern, namespace,
+                                          label_selector="", field_selector="", metadata_only=False):
         """Lists secrets matching pattern in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of secrets.
 
         - ``name_pattern``:
@@ -667,9 +2180,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_secret(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        secrets = [item for item in ret.items if r.match(item.metadata.name)]
+        secrets = self._list_by_pattern('Secret', name_pattern, namespace, label_selector, field_selector,
+                                        metadata_only)
         return secrets
 
     def get_secrets_in_namespace(self, name_pattern, namespace, label_selector=""):
@@ -685,9 +2197,9 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_secret(namespace, watch=False, label_selector=label_selector)
+        items = self._list('Secret', namespace, label_selector)
         r = re.compile(name_pattern)
-        secrets = [item for item in ret.items if r.match(item.metadata.name)]
+        secrets = [item for item in items if r.match(item.metadata.name)]
         return secrets
 
     def get_namespaced_pod_exec(self, name, namespace, argv_cmd, container=None):
@@ -704,13 +2216,12 @@ class KubeLibrary:
           it do not use shell as default!
         - ``container``:
           container on which we run exec, default: None
+
+        See `Exec In Pod` for separate stdout, stderr and exit code.
         """
-        if not isinstance(argv_cmd, list) or not len(argv_cmd):
-            raise TypeError(
-                f"argv_cmd parameter should be a list and contains values like [\"/bin/bash\", \"-c\", \"ls\"] "
-                f"not {argv_cmd}")
+        self._check_argv_cmd(argv_cmd)
         if not container:
-            return stream.stream(self.v1.connect_get_namespaced_pod_exec,
+            return stream.stream(self._exec_api().connect_get_namespaced_pod_exec,
                                  name,
                                  namespace,
                                  command=argv_cmd,
@@ -719,7 +2230,7 @@ class KubeLibrary:
                                  stdout=True,
                                  tty=False).strip()
         else:
-            return stream.stream(self.v1.connect_get_namespaced_pod_exec,
+            return stream.stream(self._exec_api().connect_get_namespaced_pod_exec,
                                  name,
                                  namespace,
                                  container=container,
@@ -729,6 +2240,310 @@ class KubeLibrary:
                                  stdout=True,
                                  tty=False).strip()
 
+    def _exec_api(self):
+        """Returns CoreV1Api for single exec call.
+
+        stream.stream replaces methods of ApiClient for the time of exec call, so every call gets its own copy
+        and calls made at the same time neither wait for each other nor go over websocket by mistake. Websocket
+        does not use connection pool of the copy.
+        """
+        return client.CoreV1Api(self.api_client.copy())
+
+    def _exec(self, name, namespace, argv_cmd, container=None, timeout=None, max_output_size=None):
+        """Runs command in container reading stdout, stderr and exit code separately, returns ExecResult."""
+        kwargs = {'container': container} if container else {}
+        ws = connect(self._exec_api().connect_get_namespaced_pod_exec,
+                     name,
+                     namespace,
+                     command=argv_cmd,
+                     stderr=True,
+                     stdin=False,
+                     stdout=True,
+                     tty=False,
+                     **kwargs)
+        return read_exec_result(ws, timeout, max_output_size=max_output_size)
+
+    @staticmethod
+    def _check_argv_cmd(argv_cmd):
+        if not isinstance(argv_cmd, list) or not len(argv_cmd):
+            raise TypeError(
+                f"argv_cmd parameter should be a list and contains values like [\"/bin/bash\", \"-c\", \"ls\"] "
+                f"not {argv_cmd}")
+
+    def exec_in_pod(self, name, namespace, argv_cmd, container=None, timeout=None, max_output_size=None):
+        """Exec command on selected container for POD and wait until it ends.
+
+        Unlike `Get Namespaced Pod Exec` stdout and stderr are read separately as they arrive and exit code
+        is reported, so no additional ``echo $?`` command is needed to check success.
+
+        Returns result with ``stdout``, ``stderr``, exit code ``rc``, ``duration``, ``timed_out`` and ``truncated``.
+        When command does not end within timeout, connection is closed, rc is None and timed_out is True.
+
+        | ${command}=    Create List    /bin/sh    -c    grep ERROR /var/log/app.log
+        | ${result}=    Exec In Pod    ${pod_name}    ${namespace}    ${command}    timeout=30s    max_output_size=65536
+        | Should Be Equal As Integers    ${result.rc}    1
+        | Should Be Empty    ${result.stderr}
+
+        - ``name``:
+          pod name
+        - ``namespace``:
+          namespace to check
+        - ``argv_cmd``:
+          command to be executed using argv syntax: ["/bin/sh", "-c", "ls"]
+        - ``container``:
+          container on which we run exec, default: None
+        - ``timeout``:
+          maximum time of command execution e.g. 30s, default: no timeout
+        - ``max_output_size``:
+          maximum number of characters kept of each of stdout and stderr, the rest is dropped
+          and result marked as truncated, default: no limit
+        """
+        self._check_argv_cmd(argv_cmd)
+        timeout = timestr_to_secs(timeout) if timeout else None
+        max_output_size = int(max_output_size) if max_output_size is not None else None
+        return self._exec(name, namespace, argv_cmd, container, timeout, max_output_size)
+
+    def exec_in_pods(self, name_pattern, namespace, argv_cmd, container=None, label_selector="", timeout=None,
+                     max_workers=10, max_output_size=None):
+        """Runs the same command in all pods matching pattern in given namespace at once.
+
+        Commands are executed by at most max_workers threads, each one limited by timeout.
+
+        Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Returns dictionary of pod names and results with ``stdout``, ``stderr``, exit code ``rc``, ``duration``
+        and ``timed_out``. When command could not be started rc is None and stderr holds the reason.
+
+        | ${command}=    Create List    cat    /etc/app/config.yaml
+        | &{results}=    Exec In Pods    myapp-.*    ${namespace}    ${command}    timeout=30s
+        | FOR    ${pod}    ${result}    IN    &{results}
+        |     Should Be Equal As Integers    ${result.rc}    0
+        | END
+
+        - ``name_pattern``:
+          pod name pattern to check
+        - ``namespace``:
+          namespace to check
+        - ``argv_cmd``:
+          command to be executed using argv syntax: ["/bin/sh", "-c", "ls"]
+        - ``container``:
+          container on which we run exec, default: None
+        - ``timeout``:
+          maximum time of command execution in single pod e.g. 30s, default: no timeout
+        - ``max_workers``:
+          maximum number of commands executed at once, default 10
+        - ``max_output_size``:
+          maximum number of characters kept of each of stdout and stderr of single pod, default: no limit
+        """
+        self._check_argv_cmd(argv_cmd)
+        timeout = timestr_to_secs(timeout) if timeout else None
+        max_output_size = int(max_output_size) if max_output_size is not None else None
+
+        def exec_in_pod(name):
+            try:
+                return self._exec(name, namespace, argv_cmd, container, timeout, max_output_size)
+            except Exception as e:
+                return ExecResult(stderr=str(e))
+        names = self.filter_names(self._list_by_pattern('Pod', name_pattern, namespace, label_selector))
+        with keyword_executor(max_workers) as executor:
+            return dict(zip(names, executor.map(exec_in_pod, names)))
+
+    def open_exec_session(self, name, namespace, container=None, shell='/bin/sh'):
+        """Starts shell in container of given pod and keeps it open for running many commands.
+
+        Commands run with `Run In Exec Session` reuse single websocket connection and shell process, which is much
+        faster than `Get Namespaced Pod Exec` opening new connection for each command. Session should be closed
+        with `Close Exec Session`.
+
+        Returns session object.
+
+        | ${session}=    Open Exec Session    ${pod_name}    ${namespace}    container=app
+        | ${result}=    Run In Exec Session    ${session}    cat /etc/hostname
+        | Should Be Equal As Integers    ${result.rc}    0
+        | Close Exec Session    ${session}
+
+        - ``name``:
+          pod name
+        - ``namespace``:
+          namespace to check
+        - ``container``:
+          container on which we run exec, default: None
+        - ``shell``:
+          shell started in container, default: /bin/sh
+        """
+        kwargs = {'container': container} if container else {}
+        ws = connect(self._exec_api().connect_get_namespaced_pod_exec,
+                     name,
+                     namespace,
+                     command=[shell],
+                     stderr=True,
+                     stdin=True,
+                     stdout=True,
+                     tty=False,
+                     **kwargs)
+        return ExecSession(ws)
+
+    @staticmethod
+    def run_in_exec_session(session, command, timeout=None):
+        """Runs shell command in session opened with `Open Exec Session`.
+
+        Returns result with separate ``stdout``, ``stderr`` and exit code ``rc``. On timeout session is closed
+        and keyword fails with TimeoutError.
+
+        - ``session``:
+          session returned by `Open Exec Session`
+        - ``command``:
+          shell command e.g. ls -la /tmp | wc -l
+        - ``timeout``:
+          maximum time of command execution e.g. 30s, default: no timeout
+        """
+        return session.run(command, timestr_to_secs(timeout) if timeout else None)
+
+    @staticmethod
+    def close_exec_session(session):
+        """Closes session opened with `Open Exec Session`.
+
+        - ``session``:
+          session returned by `Open Exec Session`
+        """
+        session.close()
+
+    def _connect_tar(self, name, namespace, command, container=None):
+        kwargs = {'container': container} if container else {}
+        return connect(self._exec_api().connect_get_namespaced_pod_exec,
+                       name,
+                       namespace,
+                       command=command,
+                       stderr=True,
+                       stdin=True,
+                       stdout=True,
+                       tty=False,
+                       binary=True,
+                       **kwargs)
+
+    @staticmethod
+    def _check_tar_result(result, action):
+        if result.timed_out:
+            raise TimeoutError(f'{action} not finished within timeout')
+        if result.rc != 0:
+            raise AssertionError(f'{action} failed with exit code {result.rc}: {result.stderr}')
+
+    def copy_to_pod(self, local_path, name, namespace, remote_dir, container=None, compress=False, timeout=None):
+        """Copies local file or directory into directory in container, container needs ``tar`` command.
+
+        Data is sent as tar archive streamed over exec connection in chunks, so memory use does not depend
+        on size of copied files. Exec connection can not signal end of input, so with ``compress`` archive
+        is first written to temporary file to let container read exact number of bytes, ``head`` command
+        is needed then too.
+
+        | Copy To Pod    ${CURDIR}/fixtures    ${pod_name}    ${namespace}    /tmp    compress=True
+
+        - ``local_path``:
+          file or directory to copy, it is created in remote_dir under the same name
+        - ``name``:
+          pod name
+        - ``namespace``:
+          namespace of pod
+        - ``remote_dir``:
+          existing directory in container
+        - ``container``:
+          container to copy to, default: None
+        - ``compress``:
+          send archive compressed with gzip, default: False
+        - ``timeout``:
+          maximum time of copying e.g. 10min, default: no timeout
+        """
+        timeout = timestr_to_secs(timeout) if timeout else None
+        arcname = os.path.basename(os.path.normpath(local_path))
+        if compress:
+            with tempfile.TemporaryFile() as archive:
+                with tarfile.open(fileobj=archive, mode='w:gz') as tar:
+                    tar.add(local_path, arcname=arcname)
+                size = archive.tell()
+                archive.seek(0)
+                command = ['sh', '-c', f'head -c {size} | tar xzf - -C "$0"', remote_dir]
+                ws = self._connect_tar(name, namespace, command, container)
+                with io.BufferedWriter(ExecStdinWriter(ws), LOG_CHUNK_SIZE) as stdin:
+                    shutil.copyfileobj(archive, stdin, LOG_CHUNK_SIZE)
+        else:
+            # tar in container exits after reading end of archive marker
+            ws = self._connect_tar(name, namespace, ['tar', 'xf', '-', '-C', remote_dir], container)
+            try:
+                with io.BufferedWriter(ExecStdinWriter(ws), LOG_CHUNK_SIZE) as stdin:
+                    with tarfile.open(fileobj=stdin, mode='w|') as tar:
+                        tar.add(local_path, arcname=arcname)
+            except Exception:
+                ws.close()
+                raise
+        self._check_tar_result(read_exec_result(ws, timeout), f'Copying {local_path} to pod {name}')
+
+    @staticmethod
+    def _safe_tar_members(tar, local_dir):
+        """Yields archive members, fails on members which would be written outside of local_dir."""
+        root = os.path.realpath(local_dir)
+        for member in tar:
+            path = os.path.realpath(os.path.join(root, member.name))
+            if member.issym():
+                target = os.path.realpath(os.path.join(os.path.dirname(path), member.linkname))
+            elif member.islnk():
+                target = os.path.realpath(os.path.join(root, member.linkname))
+            else:
+                target = path
+            if os.path.commonpath([root, path, target]) != root:
+                raise AssertionError(f'Archive member {member.name} points outside of {local_dir}')
+            yield member
+
+    def copy_from_pod(self, name, namespace, remote_path, local_dir, container=None, compress=False, timeout=None):
+        """Copies file or directory from container into local directory, container needs ``tar`` command.
+
+        Data is received as tar archive streamed over exec connection and extracted while it arrives, so memory
+        use does not depend on size of copied files.
+
+        Returns local path of copied file or directory.
+
+        | ${path}=    Copy From Pod    ${pod_name}    ${namespace}    /var/log/app    ${OUTPUT_DIR}    compress=True
+
+        - ``name``:
+          pod name
+        - ``namespace``:
+          namespace of pod
+        - ``remote_path``:
+          file or directory in container
+        - ``local_dir``:
+          local directory, created when missing
+        - ``container``:
+          container to copy from, default: None
+        - ``compress``:
+          receive archive compressed with gzip, default: False
+        - ``timeout``:
+          maximum time of copying e.g. 10min, default: no timeout
+        """
+        timeout = timestr_to_secs(timeout) if timeout else None
+        remote_path = remote_path.rstrip('/') or '/'
+        remote_dir, base = os.path.dirname(remote_path) or '.', os.path.basename(remote_path) or '.'
+        command = ['tar', 'czf' if compress else 'cf', '-', '-C', remote_dir, base]
+        os.makedirs(local_dir, exist_ok=True)
+        ws = self._connect_tar(name, namespace, command, container)
+        start = time.monotonic()
+        error = None
+        try:
+            with io.BufferedReader(ExecStdoutReader(ws, timeout), LOG_CHUNK_SIZE) as stdout:
+                with tarfile.open(fileobj=stdout, mode='r|gz' if compress else 'r|') as tar:
+                    tar.extractall(local_dir, members=self._safe_tar_members(tar, local_dir))
+        except tarfile.TarError as e:
+            # failure of command in container is reported first, with its stderr
+            error = e
+        except Exception:
+            ws.close()
+            raise
+        left = None if timeout is None else max(0.0, timeout - (time.monotonic() - start))
+        # rest of archive padding is dropped while waiting for exit code
+        result = read_exec_result(ws, left, keep_stdout=False)
+        self._check_tar_result(result, f'Copying {remote_path} from pod {name}')
+        if error:
+            raise error
+        return os.path.join(local_dir, base)
+
     def filter_names(self, objects):
         """Filter .metadata.name for list of k8s objects.
 
@@ -872,7 +2687,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.read_namespaced_pod_status(name, namespace)
+        ret = self._request(self.v1.read_namespaced_pod_status, name, namespace)
         return ret.status
 
     def get_pod_status_in_namespace(self, name, namespace):
@@ -883,7 +2698,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.read_namespaced_pod_status(name, namespace)
+        ret = self._request(self.v1.read_namespaced_pod_status, name, namespace)
         return ret.status.phase
 
     @staticmethod
@@ -969,18 +2784,19 @@ class KubeLibrary:
             logger.error(f'Failed parsing Container Env Var JSON:{env_vars_json}')
             return False
 
-    def list_namespaced_service(self, namespace, label_selector=""):
+    def list_namespaced_service(self, namespace, label_selector="", metadata_only=False):
         """Gets services in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of strings.
 
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_service(namespace, watch=False, label_selector=label_selector)
-        return [item for item in ret.items]
+        return self._list('Service', namespace, label_selector, metadata_only=metadata_only)
 
     def get_services_in_namespace(self, namespace, label_selector=""):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_namespaced_service.
@@ -994,8 +2810,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_service(namespace, watch=False, label_selector=label_selector)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('Service', namespace, label_selector, metadata_only=True)
+        return [item.metadata.name for item in items]
 
     def read_namespaced_service(self, name, namespace):
         """Gets service details in given namespace.
@@ -1009,7 +2825,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.read_namespaced_service(name, namespace)
+        ret = self._request(self.v1.read_namespaced_service, name, namespace)
         return ret
 
     def get_service_details_in_namespace(self, name, namespace):
@@ -1026,22 +2842,22 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.read_namespaced_service(name, namespace)
+        ret = self._request(self.v1.read_namespaced_service, name, namespace)
         return ret
 
-    def list_namespaced_horizontal_pod_autoscaler(self, namespace, label_selector=""):
+    def list_namespaced_horizontal_pod_autoscaler(self, namespace, label_selector="", metadata_only=False):
         """Gets Horizontal Pod Autoscalers in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of strings.
 
         - ``namespace``:
           Namespace to check
         """
-        ret = self.autoscalingv1.list_namespaced_horizontal_pod_autoscaler(namespace, watch=False,
-                                                                           label_selector=label_selector)
-        return [item for item in ret.items]
+        return self._list('HorizontalPodAutoscaler', namespace, label_selector, metadata_only=metadata_only)
 
     def get_hpas_in_namespace(self, namespace, label_selector=""):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_namespaced_horizontal_pod_autoscaler.
@@ -1055,9 +2871,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.autoscalingv1.list_namespaced_horizontal_pod_autoscaler(namespace, watch=False,
-                                                                           label_selector=label_selector)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('HorizontalPodAutoscaler', namespace, label_selector)
+        return [item.metadata.name for item in items]
 
     def read_namespaced_horizontal_pod_autoscaler(self, name, namespace):
         """Gets Horizontal Pod Autoscaler details in given namespace.
@@ -1071,7 +2886,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.autoscalingv1.read_namespaced_horizontal_pod_autoscaler(name, namespace)
+        ret = self._request(self.autoscalingv1.read_namespaced_horizontal_pod_autoscaler, name, namespace)
         return ret
 
     def get_hpa_details_in_namespace(self, name, namespace):
@@ -1088,7 +2903,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.autoscalingv1.read_namespaced_horizontal_pod_autoscaler(name, namespace)
+        ret = self._request(self.autoscalingv1.read_namespaced_horizontal_pod_autoscaler, name, namespace)
         return ret
 
     def read_namespaced_endpoints(self, name, namespace):
@@ -1103,7 +2918,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.read_namespaced_endpoints(name, namespace)
+        ret = self._request(self.v1.read_namespaced_endpoints, name, namespace)
         return ret
 
     def get_endpoints_in_namespace(self, name, namespace):
@@ -1120,56 +2935,67 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.read_namespaced_endpoints(name, namespace)
+        ret = self._request(self.v1.read_namespaced_endpoints, name, namespace)
         return ret
 
-    def list_namespaced_persistent_volume_claim(self, namespace, label_selector=""):
+    def list_namespaced_persistent_volume_claim(self, namespace, label_selector="", metadata_only=False):
         """Gets pvcs in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of strings.
 
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_persistent_volume_claim(namespace, watch=False, label_selector=label_selector)
-        return [item for item in ret.items]
+        return self._list('PersistentVolumeClaim', namespace, label_selector, metadata_only=metadata_only)
 
-    def list_namespaced_persistent_volume_claim_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_persistent_volume_claim_by_pattern(self, name_pattern, namespace,
+                                                           label_selector="", field_selector="", metadata_only=False):
         """Gets pvcs in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
-       Returns list of strings.
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
+        Returns list of strings.
 
         - ``namespace``:
           Namespace to check
         - ``name_pattern``:
           pvc name pattern to check
         """
-        ret = self.v1.list_namespaced_persistent_volume_claim(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        return [item for item in ret.items if r.match(item.metadata.name)]
+        return self._list_by_pattern('PersistentVolumeClaim', name_pattern, namespace, label_selector, field_selector,
+                                     metadata_only)
 
-    def list_namespaced_stateful_set(self, namespace, label_selector=""):
+    def list_namespaced_stateful_set(self, namespace, label_selector="", metadata_only=False):
         """Lists statefulsets in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of  statefulsets.
 
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.list_namespaced_stateful_set(namespace, watch=False, label_selector=label_selector)
-        return [item for item in ret.items]
+        return self._list('StatefulSet', namespace, label_selector, metadata_only=metadata_only)
 
-    def list_namespaced_stateful_set_by_pattern(self, name_pattern, namespace, label_selector=""):
+    def list_namespaced_stateful_set_by_pattern(self, name_pattern, namespace,
+                                                label_selector="", field_selector="", metadata_only=False):
         """Lists statefulsets matching pattern in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can be optionally filtered by field. e.g. field_selector=metadata.name=name
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of  statefulsets.
 
         - ``namespace``:
@@ -1177,9 +3003,8 @@ class KubeLibrary:
         - ``name_pattern``:
           statefulset name pattern to check
         """
-        ret = self.appsv1.list_namespaced_stateful_set(namespace, watch=False, label_selector=label_selector)
-        r = re.compile(name_pattern)
-        statefulsets = [item for item in ret.items if r.match(item.metadata.name)]
+        statefulsets = self._list_by_pattern('StatefulSet', name_pattern, namespace, label_selector, field_selector,
+                                             metadata_only)
         return statefulsets
 
     def get_pvc_in_namespace(self, namespace, label_selector=""):
@@ -1194,8 +3019,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.list_namespaced_persistent_volume_claim(namespace, watch=False, label_selector=label_selector)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('PersistentVolumeClaim', namespace, label_selector)
+        return [item.metadata.name for item in items]
 
     def read_namespaced_persistent_volume_claim(self, name, namespace):
         """Gets PVC details in given namespace.
@@ -1209,7 +3034,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.read_namespaced_persistent_volume_claim(name, namespace)
+        ret = self._request(self.v1.read_namespaced_persistent_volume_claim, name, namespace)
         return ret
 
     def get_pvc_capacity(self, name, namespace):
@@ -1226,7 +3051,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.v1.read_namespaced_persistent_volume_claim(name, namespace)
+        ret = self._request(self.v1.read_namespaced_persistent_volume_claim, name, namespace)
         return ret
 
     def get_kubelet_version(self, label_selector=""):
@@ -1236,8 +3061,8 @@ class KubeLibrary:
 
         Returns list of strings.
         """
-        ret = self.v1.list_node(watch=False, label_selector=label_selector)
-        return [item.status.node_info.kubelet_version for item in ret.items]
+        items = self._list('Node', label_selector=label_selector)
+        return [item.status.node_info.kubelet_version for item in items]
 
     def create_namespaced_service_account(self, namespace, body):
         """Creates service account in a namespace
@@ -1329,16 +3154,18 @@ class KubeLibrary:
             _return_http_data_only=False)
         return resp
 
-    def list_namespaced_ingress(self, namespace, label_selector=""):
+    def list_namespaced_ingress(self, namespace, label_selector="", metadata_only=False):
         """Gets ingresses in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
+
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of strings.
         - ``namespace``:
           Namespace to check
         """
-        ret = self.networkingv1api.list_namespaced_ingress(namespace, watch=False, label_selector=label_selector)
-        return [item for item in ret.items]
+        return self._list('Ingress', namespace, label_selector, metadata_only=metadata_only)
 
     def get_ingresses_in_namespace(self, namespace, label_selector=""):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_namespaced_ingress.
@@ -1350,8 +3177,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.networkingv1api.list_namespaced_ingress(namespace, watch=False, label_selector=label_selector)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('Ingress', namespace, label_selector)
+        return [item.metadata.name for item in items]
 
     def read_namespaced_ingress(self, name, namespace):
         """Gets ingress details in given namespace.
@@ -1361,7 +3188,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.networkingv1api.read_namespaced_ingress(name, namespace)
+        ret = self._request(self.networkingv1api.read_namespaced_ingress, name, namespace)
         return ret
 
     def get_ingress_details_in_namespace(self, name, namespace):
@@ -1374,21 +3201,22 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.networkingv1api.read_namespaced_ingress(name, namespace)
+        ret = self._request(self.networkingv1api.read_namespaced_ingress, name, namespace)
         return ret
 
-    def list_namespaced_cron_job(self, namespace, label_selector=""):
+    def list_namespaced_cron_job(self, namespace, label_selector="", metadata_only=False):
         """Gets cron jobs in given namespace.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of strings.
 
         - ``namespace``:
           Namespace to check
         """
-        ret = self.batchv1.list_namespaced_cron_job(namespace, watch=False, label_selector=label_selector)
-        return [item for item in ret.items]
+        return self._list('CronJob', namespace, label_selector, metadata_only=metadata_only)
 
     def get_cron_jobs_in_namespace(self, namespace, label_selector=""):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_namespaced_cron_job.
@@ -1402,8 +3230,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.batchv1.list_namespaced_cron_job(namespace, watch=False, label_selector=label_selector)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('CronJob', namespace, label_selector)
+        return [item.metadata.name for item in items]
 
     def read_namespaced_cron_job(self, name, namespace):
         """Gets cron job details in given namespace.
@@ -1415,7 +3243,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.batchv1.read_namespaced_cron_job(name, namespace)
+        ret = self._request(self.batchv1.read_namespaced_cron_job, name, namespace)
         return ret
 
     def get_cron_job_details_in_namespace(self, name, namespace):
@@ -1430,21 +3258,22 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.batchv1.read_namespaced_cron_job(name, namespace)
+        ret = self._request(self.batchv1.read_namespaced_cron_job, name, namespace)
         return ret
 
-    def list_namespaced_daemon_set(self, namespace, label_selector=""):
+    def list_namespaced_daemon_set(self, namespace, label_selector="", metadata_only=False):
         """Gets a list of available daemonsets.
 
         Can be optionally filtered by label. e.g. label_selector=label_key=label_value
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of deaemonsets.
 
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.list_namespaced_daemon_set(namespace, watch=False, label_selector=label_selector)
-        return [item for item in ret.items]
+        return self._list('DaemonSet', namespace, label_selector, metadata_only=metadata_only)
 
     def get_daemonsets_in_namespace(self, namespace, label_selector=""):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_namespaced_daemon_set.
@@ -1458,8 +3287,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.list_namespaced_daemon_set(namespace, watch=False, label_selector=label_selector)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('DaemonSet', namespace, label_selector)
+        return [item.metadata.name for item in items]
 
     def read_namespaced_daemon_set(self, name, namespace):
         """Gets deamonset details in given namespace.
@@ -1471,7 +3300,7 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.read_namespaced_daemon_set(name, namespace)
+        ret = self._request(self.appsv1.read_namespaced_daemon_set, name, namespace)
         return ret
 
     def get_daemonset_details_in_namespace(self, name, namespace):
@@ -1486,16 +3315,17 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.appsv1.read_namespaced_daemon_set(name, namespace)
+        ret = self._request(self.appsv1.read_namespaced_daemon_set, name, namespace)
         return ret
 
-    def list_cluster_role(self):
+    def list_cluster_role(self, metadata_only=False):
         """Gets a list of cluster_roles.
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of cluster_roles.
         """
-        ret = self.rbac_authv1_api.list_cluster_role(watch=False)
-        return [item for item in ret.items]
+        return self._list('ClusterRole', metadata_only=metadata_only)
 
     def get_cluster_roles(self):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_cluster_role.
@@ -1504,16 +3334,17 @@ class KubeLibrary:
 
         Returns list of cluster_roles.
         """
-        ret = self.rbac_authv1_api.list_cluster_role(watch=False)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('ClusterRole', metadata_only=True)
+        return [item.metadata.name for item in items]
 
-    def list_cluster_role_binding(self):
+    def list_cluster_role_binding(self, metadata_only=False):
         """Gets a list of cluster_role_bindings.
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of cluster_role_bindings.
         """
-        ret = self.rbac_authv1_api.list_cluster_role_binding(watch=False)
-        return [item for item in ret.items]
+        return self._list('ClusterRoleBinding', metadata_only=metadata_only)
 
     def get_cluster_role_bindings(self):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_cluster_role_binding.
@@ -1522,19 +3353,20 @@ class KubeLibrary:
 
         Returns list of cluster_role_bindings.
         """
-        ret = self.rbac_authv1_api.list_cluster_role_binding(watch=False)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('ClusterRoleBinding')
+        return [item.metadata.name for item in items]
 
-    def list_namespaced_role(self, namespace):
+    def list_namespaced_role(self, namespace, metadata_only=False):
         """Gets roles in given namespace.
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of roles.
 
         - ``namespace``:
           Namespace to check
         """
-        ret = self.rbac_authv1_api.list_namespaced_role(namespace, watch=False)
-        return [item for item in ret.items]
+        return self._list('Role', namespace, metadata_only=metadata_only)
 
     def get_roles_in_namespace(self, namespace):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_namespaced_role.
@@ -1546,19 +3378,20 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.rbac_authv1_api.list_namespaced_role(namespace, watch=False)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('Role', namespace, metadata_only=True)
+        return [item.metadata.name for item in items]
 
-    def list_namespaced_role_binding(self, namespace):
+    def list_namespaced_role_binding(self, namespace, metadata_only=False):
         """Gets role_bindings in given namespace.
 
+        Can return only metadata of objects. e.g. metadata_only=True, see `Metadata only`.
+
         Returns list of role_bindings.
 
         - ``namespace``:
           Namespace to check
         """
-        ret = self.rbac_authv1_api.list_namespaced_role_binding(namespace, watch=False)
-        return [item for item in ret.items]
+        return self._list('RoleBinding', namespace, metadata_only=metadata_only)
 
     def get_role_bindings_in_namespace(self, namespace):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_namespaced_role_binding.
@@ -1570,8 +3403,8 @@ class KubeLibrary:
         - ``namespace``:
           Namespace to check
         """
-        ret = self.rbac_authv1_api.list_namespaced_role_binding(namespace, watch=False)
-        return [item.metadata.name for item in ret.items]
+        items = self._list('RoleBinding', namespace, metadata_only=True)
+        return [item.metadata.name for item in items]
 
     def list_cluster_custom_object(self, group, version, plural):
         """Lists cluster level custom objects.
@@ -1589,7 +3422,7 @@ class KubeLibrary:
 
         https://github.com/kubernetes-client/python/blob/master/kubernetes/README.md
         """
-        return self.custom_object.list_cluster_custom_object(group, version, plural)
+        return self._list_custom_object(self.custom_object.list_cluster_custom_object, group, version, plural)
 
     def list_cluster_custom_objects(self, group, version, plural):
         """*DEPRECATED* Will be removed in v1.0.0. Use list_cluster_custom_object.
@@ -1609,7 +3442,7 @@ class KubeLibrary:
 
         https://github.com/kubernetes-client/python/blob/master/kubernetes/README.md
         """
-        return self.custom_object.list_cluster_custom_object(group, version, plural)
+        return self._list_custom_object(self.custom_object.list_cluster_custom_object, group, version, plural)
 
     def get_cluster_custom_object(self, group, version, plural, name):
         """Get cluster level custom object.
@@ -1671,7 +3504,8 @@ class KubeLibrary:
 
         https://github.com/kubernetes-client/python/blob/master/kubernetes/README.md
         """
-        return self.custom_object.list_namespaced_custom_object(group, version, namespace, plural)
+        return self._list_custom_object(self.custom_object.list_namespaced_custom_object, group, version, namespace,
+                                        plural)
 
     def get_custom_object_in_namespace(self, group, version, namespace, plural, name):
         """*DEPRECATED* Will be removed in v1.0.0. Use get_namespaced_custom_object.
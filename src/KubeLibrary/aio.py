@@ -0,0 +1,48 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from KubeLibrary.KubeLibrary import KubeLibrary
+
+
+class AsyncKubeLibrary:
+    """asyncio facade of KubeLibrary, every keyword is available as coroutine function with the same arguments.
+
+    Calls are executed by pool of at most max_workers threads sharing single library instance, its API clients
+    and connection pool, so many checks can be awaited at once from single process.
+
+    | async with AsyncKubeLibrary(kube_config='~/.kube/config', max_workers=50) as kl:
+    |     pods, deployments = await asyncio.gather(kl.list_namespaced_pod_by_pattern('.*', 'default'),
+    |                                              kl.list_namespaced_deployment_by_pattern('.*', 'default'))
+
+    - ``library``:
+      KubeLibrary instance to use, by default new one is created with remaining keyword arguments
+    - ``max_workers``:
+      maximum number of keywords executed at once, default 10
+    """
+
+    def __init__(self, library=None, max_workers=10, **kwargs):
+        self.library = library if library is not None else KubeLibrary(**kwargs)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)))
+
+    def __getattr__(self, name):
+        method = None if name.startswith('_') else getattr(self.library, name, None)
+        if not callable(method):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        async def keyword(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, partial(method, *args, **kwargs))
+        keyword.__name__ = name
+        keyword.__doc__ = method.__doc__
+        return keyword
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,112 @@
+import threading
+import time
+
+from collections import OrderedDict
+
+# kind of entries invalidated by mutation of any kind, and of mutations invalidating all entries with kind
+ANY_KIND = '*'
+
+
+class _Entry:
+
+    def __init__(self, result, expires, kind, namespace):
+        self.result = result
+        self.expires = expires
+        self.kind = kind
+        self.namespace = namespace
+
+
+class ResponseCache:
+    """Thread safe LRU cache of keyword results, each kept at most ttl seconds.
+
+    Results are tagged with kind and namespace of objects they hold, so they can be dropped when objects
+    of that kind are changed. Cached results are returned as they are, callers must not modify them.
+
+    - ``cached``:
+      Dictionary of cached keyword names and kind of their results, None for results not depending on
+      any objects, ANY_KIND for results invalidated by every mutation
+    - ``mutating``:
+      Dictionary of mutating keyword names and kind they change, None when kind is given in ``kind``
+      argument, ANY_KIND for keywords which may change any kind
+    - ``any_namespace``:
+      Names of mutating keywords which may change objects outside of their ``namespace`` argument, e.g. when
+      it is only default for objects without own namespace, their calls invalidate results of all namespaces
+    - ``maxsize``:
+      Maximum number of cached results, least recently used are dropped first
+    - ``ttl``:
+      Seconds after which cached result expires
+    """
+
+    def __init__(self, cached, mutating, any_namespace=(), maxsize=256, ttl=60):
+        self.cached = cached
+        self.mutating = mutating
+        self.any_namespace = frozenset(any_namespace)
+        self.maxsize = int(maxsize)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def call(self, name, signature, args, kwargs, call):
+        """Returns result of keyword name, from cache if possible, otherwise calling call without arguments.
+
+        Arguments are bound to keyword signature, so the same call with positional or named arguments
+        is cached once. Results of mutating keywords are never cached, but invalidate cached results.
+        """
+        if name not in self.cached and name not in self.mutating:
+            return call()
+        try:
+            arguments = signature.bind(*args, **kwargs).arguments
+        except TypeError:
+            return call()
+        arguments.pop('self', None)
+        namespace = arguments.get('namespace', arguments.get('kwargs', {}).get('namespace'))
+        if name in self.mutating:
+            kind = self.mutating[name] or arguments.get('kind')
+            if name in self.any_namespace:
+                namespace = None
+            try:
+                return call()
+            finally:
+                # failed call could have changed some objects as well
+                self.invalidate(kind, namespace)
+        key = (name, repr(sorted(arguments.items())))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.result
+            self.misses += 1
+        result = call()
+        with self._lock:
+            self._entries[key] = _Entry(result, time.monotonic() + self.ttl, self.cached[name], namespace)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def invalidate(self, kind=None, namespace=None):
+        """Drops results holding objects of given kind in given namespace, all namespaces when namespace is None.
+
+        Results of cluster wide keywords are dropped regardless of namespace. Unknown kind drops all results
+        depending on objects.
+        """
+        kind = kind.lower() if kind else ANY_KIND
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if entry.kind is None:
+                    continue
+                if kind != ANY_KIND and entry.kind != ANY_KIND and entry.kind.lower() != kind:
+                    continue
+                if namespace and entry.namespace and entry.namespace != namespace:
+                    continue
+                del self._entries[key]
+
+    def flush(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
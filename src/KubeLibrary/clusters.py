@@ -0,0 +1,34 @@
+import functools
+import inspect
+
+
+def _cluster_keyword(name, func):
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    position = next((i for i, parameter in enumerate(parameters) if parameter.kind == parameter.VAR_KEYWORD),
+                    len(parameters))
+    parameters.insert(position, inspect.Parameter('cluster', inspect.Parameter.KEYWORD_ONLY, default=None))
+
+    @functools.wraps(func)
+    def keyword(self, *args, cluster=None, **kwargs):
+        library = self._cluster_library(cluster)
+        if library is not self:
+            return getattr(library, name)(*args, **kwargs)
+        return func(self, *args, **kwargs)
+    keyword.__signature__ = signature.replace(parameters=parameters)
+    return keyword
+
+
+def with_cluster_argument(*exclude):
+    """Class decorator adding ``cluster`` argument to keywords, calls are passed to library of given cluster.
+
+    Library class must implement ``_cluster_library(cluster)`` returning library instance to call, also when
+    cluster is None. Static methods do not depend on cluster and are left as they are, as well as keywords
+    listed in exclude.
+    """
+    def decorate(cls):
+        for name, func in list(vars(cls).items()):
+            if not name.startswith('_') and name not in exclude and inspect.isfunction(func):
+                setattr(cls, name, _cluster_keyword(name, func))
+        return cls
+    return decorate
@@ -0,0 +1,31 @@
+import functools
+import inspect
+
+from KubeLibrary.metrics import keyword_scope
+
+
+def _hooked_keyword(name, func):
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def keyword(self, *args, **kwargs):
+        with keyword_scope(name):
+            call = functools.partial(func, self, *args, **kwargs)
+            cache = self.__dict__.get('response_cache')
+            if cache is not None:
+                call = functools.partial(cache.call, name, signature, (self,) + args, kwargs, call)
+            profiler = self.__dict__.get('profiler')
+            return profiler.run(name, call) if profiler else call()
+    return keyword
+
+
+def with_keyword_hooks(cls):
+    """Class decorator running keywords through hooks of library instance.
+
+    Calls of keywords are marked for request stats with keyword_scope, served from ``response_cache`` when
+    library has one and profiled when library has ``profiler``. Static methods are left as they are.
+    """
+    for name, func in list(vars(cls).items()):
+        if not name.startswith('_') and inspect.isfunction(func):
+            setattr(cls, name, _hooked_keyword(name, func))
+    return cls
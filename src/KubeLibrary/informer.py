@@ -0,0 +1,177 @@
+import functools
+import socket
+import threading
+
+from kubernetes import watch
+from kubernetes.client.rest import ApiException
+
+HTTP_STATUS_GONE = 410
+
+
+def shutdown_response(resp):
+    """Shuts down socket of streamed response, so thread waiting for data on it gets end of stream at once.
+
+    Closing response from other thread does not unblock reading.
+    """
+    sock = getattr(getattr(resp, '_connection', None), 'sock', None)
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+
+class Informer:
+    """Keeps local store of k8s objects fresh using list followed by watch.
+
+    Objects are listed once, then watch is started from returned resourceVersion and every event is
+    applied to the store. When resourceVersion expires (410 Gone) objects are listed again.
+
+    - ``list_func``:
+      Kubernetes client list function e.g. CoreV1Api.list_namespaced_pod
+    - ``*args``:
+      Positional arguments for list_func e.g. namespace
+    - ``watch_timeout``:
+      Server side timeout of single watch request in seconds, watch is resumed afterwards
+    - ``retry_interval``:
+      Seconds to wait before retrying after failed list or watch, doubled after every following failure
+    - ``max_retry_interval``:
+      Longest wait between retries in seconds
+    - ``**kwargs``:
+      Keyword arguments for list_func e.g. label_selector
+    """
+
+    def __init__(self, list_func, *args, watch_timeout=300, retry_interval=1, max_retry_interval=60, **kwargs):
+        self.list_func = list_func
+        self.args = args
+        self.kwargs = kwargs
+        self.watch_timeout = watch_timeout
+        self.retry_interval = retry_interval
+        self.max_retry_interval = max_retry_interval
+        self._retry_delay = retry_interval
+        self.resource_version = None
+        self.error = None
+        self._store = {}
+        self._changed = threading.Condition()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._watch = None
+        self._response = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self, timeout=5):
+        """Stops watch, closing its connection, and waits at most timeout seconds until thread ends."""
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+        if self._response is not None:
+            shutdown_response(self._response)
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def wait_for_sync(self, timeout=None):
+        """Blocks until initial list is stored. Raises error of failed initial list at once, TimeoutError on timeout."""
+        with self._changed:
+            self._changed.wait_for(lambda: self._synced.is_set() or self.error is not None, timeout)
+        if not self._synced.is_set():
+            if self.error:
+                raise self.error
+            raise TimeoutError(f'Informer for {self.list_func.__name__} not synced within {timeout}s')
+
+    def wait_until(self, predicate, timeout=None):
+        """Blocks until predicate called with list of stored objects returns True.
+
+        Predicate is evaluated after initial list and after every watch event. Raises error of failed initial
+        list at once, returns False on timeout.
+        """
+        def done():
+            if self._synced.is_set():
+                return predicate(list(self._store.values()))
+            return self.error is not None
+
+        with self._changed:
+            met = self._changed.wait_for(done, timeout)
+            if not self._synced.is_set() and self.error is not None:
+                raise self.error
+        return met
+
+    def items(self):
+        """Returns stored objects in order of appearance, listed objects keep order returned by API server."""
+        with self._changed:
+            return list(self._store.values())
+
+    @staticmethod
+    def _key(obj):
+        return obj.metadata.namespace or '', obj.metadata.name
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                if self.resource_version is None:
+                    self._list()
+                self._watch_events()
+            except ApiException as e:
+                if self._stopped.is_set():
+                    return
+                if e.status == HTTP_STATUS_GONE:
+                    self.resource_version = None
+                    continue
+                self._fail(e)
+            except Exception as e:
+                if self._stopped.is_set():
+                    return
+                self._fail(e)
+
+    def _fail(self, error):
+        with self._changed:
+            self.error = error
+            self._changed.notify_all()
+        # permanent errors, e.g. missing permissions or invalid selector, must not flood API server with retries
+        self._stopped.wait(self._retry_delay)
+        self._retry_delay = min(self._retry_delay * 2, self.max_retry_interval)
+
+    def _list(self):
+        ret = self.list_func(*self.args, watch=False, **self.kwargs)
+        store = {self._key(item): item for item in ret.items}
+        with self._changed:
+            self._store = store
+            self.resource_version = ret.metadata.resource_version
+            self._synced.set()
+            self._retry_delay = self.retry_interval
+            self._changed.notify_all()
+
+    def _open_watch(self, *args, **kwargs):
+        self._response = self.list_func(*args, **kwargs)
+        if self._stopped.is_set():
+            shutdown_response(self._response)
+        return self._response
+
+    def _watch_events(self):
+        self._watch = watch.Watch()
+
+        # watch finds return type in docstring or annotations of list function
+        @functools.wraps(self.list_func)
+        def open_watch(*args, **kwargs):
+            return self._open_watch(*args, **kwargs)
+
+        for event in self._watch.stream(open_watch, *self.args, resource_version=self.resource_version,
+                                        timeout_seconds=self.watch_timeout, **self.kwargs):
+            if event['type'] in ('ADDED', 'MODIFIED', 'DELETED'):
+                self._apply(event['type'], event['object'])
+            if self._stopped.is_set():
+                break
+
+    def _apply(self, event_type, obj):
+        key = self._key(obj)
+        with self._changed:
+            if event_type == 'DELETED':
+                self._store.pop(key, None)
+            else:
+                self._store[key] = obj
+            self.resource_version = obj.metadata.resource_version
+            self._retry_delay = self.retry_interval
+            self._changed.notify_all()
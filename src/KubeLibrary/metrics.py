@@ -0,0 +1,134 @@
+import os
+import tempfile
+import threading
+
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+# upper bounds of request duration histogram buckets in seconds, as in Prometheus client defaults
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# keyword of requests sent outside of any keyword, e.g. by background informers
+NO_KEYWORD = ''
+
+_local = threading.local()
+
+
+@contextmanager
+def keyword_scope(name):
+    """Marks requests sent by current thread as sent by keyword, nested keywords are counted for outermost one."""
+    stack = _local.__dict__.setdefault('keywords', [])
+    stack.append(name)
+    try:
+        yield
+    finally:
+        stack.pop()
+
+
+def current_keyword():
+    stack = getattr(_local, 'keywords', None)
+    return stack[0] if stack else getattr(_local, 'inherited', NO_KEYWORD)
+
+
+def _inherit_keyword(keyword):
+    _local.inherited = keyword
+
+
+def keyword_executor(max_workers):
+    """Returns ThreadPoolExecutor of at most max_workers threads.
+
+    Requests sent by its threads are counted for current keyword, unless they are sent by other keyword
+    called in the thread, e.g. by `Run Keywords Concurrently`.
+    """
+    return ThreadPoolExecutor(max_workers=max(1, int(max_workers)), initializer=_inherit_keyword,
+                              initargs=(current_keyword(),))
+
+
+class KeywordStats:
+    """Requests sent by single keyword."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.bytes = 0
+        self.statuses = Counter()
+        self.buckets = [0] * (len(DURATION_BUCKETS) + 1)
+
+    def to_dict(self):
+        return {'requests': self.requests, 'errors': self.errors, 'seconds': round(self.seconds, 6),
+                'bytes': self.bytes, 'statuses': dict(self.statuses),
+                'buckets': dict(zip([str(bound) for bound in DURATION_BUCKETS] + ['+Inf'], self.buckets))}
+
+
+class RequestStats:
+    """Thread safe counters of API requests grouped by keyword which sent them.
+
+    Status 0 means that no HTTP response was received, e.g. connection failed or timed out.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keywords = {}
+
+    def record(self, status, seconds, size, keyword=None):
+        keyword = current_keyword() if keyword is None else keyword
+        with self._lock:
+            stats = self._keywords.get(keyword)
+            if stats is None:
+                stats = self._keywords[keyword] = KeywordStats()
+            stats.requests += 1
+            stats.errors += not 200 <= status < 400
+            stats.seconds += seconds
+            stats.bytes += size
+            stats.statuses[status] += 1
+            stats.buckets[bisect_left(DURATION_BUCKETS, seconds)] += 1
+
+    def add_bytes(self, size, keyword=None):
+        """Adds size of response body read after its request was recorded."""
+        keyword = current_keyword() if keyword is None else keyword
+        with self._lock:
+            stats = self._keywords.get(keyword)
+            if stats is not None:
+                stats.bytes += size
+
+    def reset(self):
+        with self._lock:
+            self._keywords = {}
+
+    def to_dict(self):
+        """Returns dictionary of keyword names and their stats, buckets are not cumulative."""
+        with self._lock:
+            return {keyword: stats.to_dict() for keyword, stats in sorted(self._keywords.items())}
+
+    def to_prometheus(self, prefix='kubelibrary'):
+        """Returns stats in Prometheus text exposition format."""
+        lines = [f'# HELP {prefix}_requests_total Kubernetes API requests sent by keyword.',
+                 f'# TYPE {prefix}_requests_total counter']
+        stats = self.to_dict()
+        for keyword, values in stats.items():
+            for status, count in sorted(values['statuses'].items()):
+                lines.append(f'{prefix}_requests_total{{keyword="{keyword}",status="{status}"}} {count}')
+        lines += [f'# HELP {prefix}_response_bytes_total Size of Kubernetes API responses received by keyword.',
+                  f'# TYPE {prefix}_response_bytes_total counter']
+        lines += [f'{prefix}_response_bytes_total{{keyword="{keyword}"}} {values["bytes"]}'
+                  for keyword, values in stats.items()]
+        lines += [f'# HELP {prefix}_request_duration_seconds Duration of Kubernetes API requests by keyword.',
+                  f'# TYPE {prefix}_request_duration_seconds histogram']
+        for keyword, values in stats.items():
+            total = 0
+            for bound, count in values['buckets'].items():
+                total += count
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{keyword="{keyword}",le="{bound}"}} {total}')
+            lines.append(f'{prefix}_request_duration_seconds_sum{{keyword="{keyword}"}} {values["seconds"]}')
+            lines.append(f'{prefix}_request_duration_seconds_count{{keyword="{keyword}"}} {values["requests"]}')
+        return '\n'.join(lines) + '\n'
+
+    def write_textfile(self, path):
+        """Writes stats for node exporter textfile collector, file is replaced at once so it is never read partially."""
+        directory = os.path.dirname(os.path.abspath(path))
+        with tempfile.NamedTemporaryFile('w', dir=directory, suffix='.tmp', delete=False) as f:
+            f.write(self.to_prometheus())
+        os.replace(f.name, path)
@@ -0,0 +1,114 @@
+import json
+import re
+
+from collections.abc import Mapping
+from kubernetes import client
+
+try:
+    from orjson import loads
+except ImportError:
+    loads = json.loads
+
+# openapi types of model fields, e.g. list[V1Container] in older clients and List[V1Container] in newer ones
+LIST_TYPE = re.compile(r'^[Ll]ist\[(.+)\]$')
+
+# Mapping methods shadowed by fields of the same name, e.g. items of lists or values of selector requirements
+MAPPING_METHODS = frozenset(('get', 'items', 'keys', 'values'))
+
+
+def _camel_case(name):
+    first, *rest = name.lstrip('_').split('_')
+    return first + ''.join(word.capitalize() for word in rest)
+
+
+def _model(type_name):
+    """Returns client model class of openapi type name, None for primitive types, maps and unknown names."""
+    model = getattr(client, type_name, None) if type_name else None
+    return model if hasattr(model, 'attribute_map') else None
+
+
+def _kind_model(data):
+    """Returns client model class of object with kind and apiVersion, e.g. V1PodList for v1 PodList."""
+    kind, api_version = data.get('kind'), data.get('apiVersion')
+    if not isinstance(kind, str) or not isinstance(api_version, str):
+        return None
+    return _model(api_version.rpartition('/')[2].capitalize() + kind)
+
+
+def wrap(value, type_name=None):
+    """Wraps JSON dicts (also nested in lists) into KubeObject, other values are returned as they are.
+
+    With openapi type name of value, e.g. ``V1PodStatus`` or ``list[V1Container]``, objects get their model.
+    """
+    if isinstance(value, dict):
+        return KubeObject(value, _model(type_name))
+    if isinstance(value, list):
+        match = LIST_TYPE.match(type_name or '')
+        return [wrap(item, match.group(1) if match else None) for item in value]
+    return value
+
+
+class KubeObject(Mapping):
+    """Lightweight read only view of k8s object decoded from JSON.
+
+    Fields can be accessed the same way as in kubernetes client models, e.g. ``${pod.metadata.name}``.
+    When client model of object is known (from its kind and apiVersion, or from field of parent object),
+    names are resolved with model attribute map, so ``obj.status.pod_ip`` returns ``podIP`` field and unset
+    fields of the model are None. Other names are matched with JSON fields as they are, in camel case and
+    ignoring case, names not found raise AttributeError. Objects are mappings of JSON fields, so they support
+    ``in``, ``[key]`` access and Collections library keywords. Fields named like mapping methods, e.g. ``items``
+    of lists, are returned instead of the methods.
+    """
+
+    __slots__ = ('_data', '_model')
+
+    def __init__(self, data, model=None):
+        self._data = data
+        self._model = model or _kind_model(data)
+
+    def __getattribute__(self, name):
+        if name in MAPPING_METHODS:
+            data, model = object.__getattribute__(self, '_data'), object.__getattribute__(self, '_model')
+            if name in data or (model is not None and name in model.attribute_map):
+                return KubeObject.__getattr__(self, name)
+        return object.__getattribute__(self, name)
+
+    def _key(self, name):
+        if name in self._data:
+            return name
+        camel = _camel_case(name)
+        if camel in self._data:
+            return camel
+        folded = name.replace('_', '').lower()
+        return next((key for key in self._data if key.lower() == folded), None)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        model = self._model
+        if model is not None and name in model.attribute_map:
+            return wrap(self._data.get(model.attribute_map[name]), model.openapi_types.get(name))
+        key = self._key(name)
+        if key is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return wrap(self._data[key])
+
+    def __getitem__(self, key):
+        return wrap(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, KubeObject):
+            other = other._data
+        return self._data == other
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def to_dict(self):
+        return self._data
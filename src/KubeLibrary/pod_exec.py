@@ -0,0 +1,214 @@
+import io
+import time
+import uuid
+
+import yaml
+from kubernetes import stream
+from kubernetes.stream.ws_client import ERROR_CHANNEL, STDERR_CHANNEL, STDOUT_CHANNEL, _IgnoredIO
+
+
+class ExecResult:
+    """Result of command executed in container.
+
+    Attributes follow Robot Framework Process library results: ``stdout``, ``stderr`` and ``rc`` (exit code),
+    additionally ``duration`` holds execution time in seconds, ``timed_out`` tells if command was stopped
+    on timeout and ``truncated`` if part of output was dropped because of size limit. ``rc`` is None when
+    exit code is unknown, e.g. command was not started or timed out.
+    """
+
+    def __init__(self, stdout='', stderr='', rc=None, duration=None, timed_out=False, truncated=False):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.rc = rc
+        self.duration = duration
+        self.timed_out = timed_out
+        self.truncated = truncated
+
+    def __repr__(self):
+        return f'<ExecResult rc={self.rc} stdout={self.stdout!r} stderr={self.stderr!r} duration={self.duration}>'
+
+
+def _exit_code(status):
+    """Returns exit code and error message from status sent on exec error channel."""
+    if not status:
+        return None, ''
+    status = yaml.safe_load(status)
+    if status.get('status') == 'Success':
+        return 0, ''
+    for cause in (status.get('details') or {}).get('causes') or []:
+        if cause.get('reason') == 'ExitCode':
+            return int(cause['message']), ''
+    return None, status.get('message', '')
+
+
+def connect(api_method, *args, **kwargs):
+    """Opens exec websocket with _preload_content=False and returns WSClient.
+
+    Output is read from channels only, so copy of all output kept by WSClient for read_all() is dropped.
+    """
+    ws = stream.stream(api_method, *args, _preload_content=False, **kwargs)
+    ws._all = _IgnoredIO()
+    return ws
+
+
+def _join(chunks):
+    """Joins output chunks, bytes received by binary websocket are decoded as UTF-8."""
+    chunks = [chunk for chunk in chunks if chunk]
+    if chunks and isinstance(chunks[0], bytes):
+        return b''.join(chunks).decode('utf-8', 'replace')
+    return ''.join(chunks)
+
+
+class _Output:
+    """Output of single channel kept up to limit, the rest is dropped as it arrives."""
+
+    def __init__(self, limit=None):
+        self.limit = limit
+        self.size = 0
+        self.truncated = False
+        self.chunks = []
+
+    def append(self, data):
+        if self.limit is not None and self.size + len(data) > self.limit:
+            data = data[:self.limit - self.size]
+            self.truncated = True
+        self.size += len(data)
+        self.chunks.append(data)
+
+    def value(self):
+        return _join(self.chunks)
+
+
+def read_exec_result(ws, timeout=None, keep_stdout=True, max_output_size=None):
+    """Reads stdout and stderr of exec call as they arrive until command ends, returns ExecResult.
+
+    - ``ws``:
+      WSClient of exec call opened with _preload_content=False
+    - ``timeout``:
+      Seconds after which connection is closed and result marked as timed out
+    - ``keep_stdout``:
+      When False stdout is dropped as it arrives, e.g. rest of data already consumed with ExecStdoutReader
+    - ``max_output_size``:
+      Maximum number of characters (bytes for binary websocket) kept of each of stdout and stderr
+    """
+    start = time.monotonic()
+    stdout, stderr = _Output(max_output_size if keep_stdout else 0), _Output(max_output_size)
+    status = []
+    timed_out = False
+    try:
+        while True:
+            # frames may be already buffered by earlier reads, also after connection was closed
+            stdout.append(ws.read_channel(STDOUT_CHANNEL))
+            stderr.append(ws.read_channel(STDERR_CHANNEL))
+            status.append(ws.read_channel(ERROR_CHANNEL))
+            if not ws.is_open():
+                break
+            left = None if timeout is None else timeout - (time.monotonic() - start)
+            if left is not None and left <= 0:
+                timed_out = True
+                break
+            ws.update(timeout=left)
+    finally:
+        ws.close()
+    rc, message = (None, '') if timed_out else _exit_code(_join(status))
+    return ExecResult(stdout.value(), stderr.value() + message, rc, round(time.monotonic() - start, 3), timed_out,
+                      truncated=(stdout.truncated and keep_stdout) or stderr.truncated)
+
+
+class ExecStdinWriter(io.RawIOBase):
+    """Writable binary stream sending data to stdin of exec call, wrap in io.BufferedWriter to send larger frames."""
+
+    def __init__(self, ws):
+        self.ws = ws
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if not self.ws.is_open():
+            raise BrokenPipeError('Exec connection is closed')
+        self.ws.write_stdin(bytes(data))
+        return len(data)
+
+
+class ExecStdoutReader(io.RawIOBase):
+    """Readable binary stream of stdout of exec call opened with binary=True, frames are read when requested.
+
+    Other channels are left in websocket buffers for `read_exec_result`. End of stream is reached when
+    connection is closed. TimeoutError is raised when no data arrives before deadline.
+
+    - ``ws``:
+      WSClient of exec call opened with _preload_content=False and binary=True
+    - ``timeout``:
+      Seconds from creation of reader after which reading fails
+    """
+
+    def __init__(self, ws, timeout=None):
+        self.ws = ws
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self._pending = b''
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            if not self.ws.is_open():
+                return 0
+            left = None if self.deadline is None else self.deadline - time.monotonic()
+            if left is not None and left <= 0:
+                self.ws.close()
+                raise TimeoutError('Exec output not received within timeout')
+            self.ws.update(timeout=left)
+            self._pending = self.ws.read_channel(STDOUT_CHANNEL) or b''
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+class ExecSession:
+    """Shell kept open in container over single exec websocket, commands are run one by one.
+
+    Each command is followed by printing unique sentinel on stdout (with exit code) and stderr, output of command
+    is everything received on given channel before its sentinel.
+
+    - ``ws``:
+      WSClient of exec call running shell with stdin, stdout and stderr, opened with _preload_content=False
+    """
+
+    def __init__(self, ws):
+        self.ws = ws
+
+    def is_open(self):
+        return self.ws.is_open()
+
+    def run(self, command, timeout=None):
+        """Runs command in shell and returns ExecResult. Raises TimeoutError and closes session on timeout."""
+        if not self.ws.is_open():
+            raise ConnectionError('Exec session is closed')
+        marker = f'__KUBELIBRARY_{uuid.uuid4().hex}__'
+        start = time.monotonic()
+        # command gets empty stdin so it can not consume following lines
+        self.ws.write_stdin(f'{{ {command}\n}} </dev/null\n__rc=$?\n'
+                            f'printf "\\n{marker} %s\\n" "$__rc"\nprintf "\\n{marker}\\n" >&2\n')
+        stdout = stderr = ''
+        stdout_end = stderr_end = -1
+        while stdout_end < 0 or stderr_end < 0:
+            left = None if timeout is None else timeout - (time.monotonic() - start)
+            if left is not None and left <= 0:
+                self.close()
+                raise TimeoutError(f'Command "{command}" not finished within {timeout}s')
+            if not self.ws.is_open():
+                raise ConnectionError(f'Exec session closed while running "{command}"')
+            self.ws.update(timeout=left)
+            stdout += self.ws.read_channel(STDOUT_CHANNEL)
+            stderr += self.ws.read_channel(STDERR_CHANNEL)
+            stdout_end = stdout.find(f'\n{marker} ')
+            stderr_end = stderr.find(f'\n{marker}\n')
+        rc = stdout[stdout_end:].split()[1]
+        return ExecResult(stdout[:stdout_end], stderr[:stderr_end], int(rc), round(time.monotonic() - start, 3))
+
+    def close(self):
+        if self.ws.is_open():
+            self.ws.close()
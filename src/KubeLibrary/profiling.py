@@ -0,0 +1,102 @@
+import cProfile
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+PROFILE_DIR_ENV = 'KUBELIBRARY_PROFILE_DIR'
+
+SUMMARY_FILE = 'summary.txt'
+
+
+class KeywordProfile:
+    """CPU profile and timings of all profiled calls of single keyword."""
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.peak_memory = 0
+        self.stats = None
+
+    def add(self, profile, seconds, peak_memory):
+        self.calls += 1
+        self.seconds += seconds
+        self.peak_memory = max(self.peak_memory, peak_memory)
+        if self.stats is None:
+            self.stats = pstats.Stats(profile)
+        else:
+            self.stats.add(profile)
+
+
+class Profiler:
+    """Profiles keyword calls with cProfile and tracemalloc and writes results at end of every suite.
+
+    For each keyword ``<keyword>.pstats`` file is written, which can be opened with pstats, snakeviz or turned
+    into flame graph e.g. with flameprof, and ``summary.txt`` lists calls, time and memory peak of all keywords.
+    Only one keyword is profiled at a time, keywords nested in it or called concurrently from other threads
+    run without profiling. CPU profile covers thread calling keyword only, time spent in worker threads of
+    concurrent keywords is seen as waiting.
+
+    Works as Robot Framework library listener, files are rewritten with data collected so far at end of
+    each suite.
+
+    - ``output_dir``:
+      Directory of written files, created when missing
+    """
+
+    ROBOT_LISTENER_API_VERSION = 2
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.keywords = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def run(self, name, call):
+        """Calls call without arguments, profiling it as keyword name, and returns its result."""
+        if getattr(self._local, 'active', False) or not self._lock.acquire(blocking=False):
+            return call()
+        self._local.active = True
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        elif hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        memory = tracemalloc.get_traced_memory()[0]
+        profile = cProfile.Profile()
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            return call()
+        finally:
+            profile.disable()
+            seconds = time.perf_counter() - start
+            peak_memory = tracemalloc.get_traced_memory()[1] - memory
+            if not tracing:
+                tracemalloc.stop()
+            self.keywords.setdefault(name, KeywordProfile()).add(profile, seconds, peak_memory)
+            self._local.active = False
+            self._lock.release()
+
+    def summary(self):
+        """Returns table of profiled keywords sorted by total time."""
+        lines = [f'{"Keyword":<50} {"Calls":>7} {"Total s":>10} {"Mean s":>10} {"Peak KiB":>10}']
+        for name, keyword in sorted(self.keywords.items(), key=lambda item: -item[1].seconds):
+            lines.append(f'{name:<50} {keyword.calls:>7} {keyword.seconds:>10.3f} '
+                         f'{keyword.seconds / keyword.calls:>10.3f} {keyword.peak_memory / 1024:>10.1f}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        os.makedirs(self.output_dir, exist_ok=True)
+        with self._lock:
+            for name, keyword in self.keywords.items():
+                keyword.stats.dump_stats(os.path.join(self.output_dir, f'{name}.pstats'))
+            with open(os.path.join(self.output_dir, SUMMARY_FILE), 'w') as f:
+                f.write(self.summary())
+
+    def end_suite(self, name, attributes):
+        self.write()
+
+    def close(self):
+        self.write()
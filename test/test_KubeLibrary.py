@@ -1,10 +1,29 @@
+import asyncio
+import contextlib
+import gzip
+import inspect
+import io
 import json
 import mock
+import os
+import pstats
 import re
+import socket
 import ssl
+import tarfile
+import tempfile
+import threading
+import time
 import unittest
+import urllib3
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from KubeLibrary import KubeLibrary
+from KubeLibrary.aio import AsyncKubeLibrary
 from KubeLibrary.exceptions import BearerTokenWithPrefixException
+from KubeLibrary.informer import Informer
+from KubeLibrary.objects import KubeObject
+from kubernetes.client.rest import ApiException, RESTResponse
 from kubernetes.config.config_exception import ConfigException
 from urllib3_mock import Responses
 
@@ -181,6 +200,21 @@ def mock_list_namespaced_pod(namespace, watch=False, label_selector=""):
             return list_of_pods
 
 
+def mock_list_namespaced_pod_with_version(namespace, watch=False, label_selector=""):
+    list_of_pods = mock_list_namespaced_pod(namespace, watch, label_selector)
+    list_of_pods.metadata = AttributeDict({'resource_version': '1'})
+    return list_of_pods
+
+
+def mock_list_namespaced_pod_paged(namespace, watch=False, label_selector="", limit=None, _continue=None):
+    list_of_pods = mock_list_namespaced_pod(namespace, watch, label_selector)
+    page = int(_continue or 0)
+    list_of_pods.items = list_of_pods.items[page:page + limit]
+    next_page = str(page + limit) if page + limit < 2 else None
+    list_of_pods.metadata = AttributeDict({'_continue': next_page})
+    return list_of_pods
+
+
 def mock_read_namespaced_pod_status(name, namespace):
     if namespace == 'default':
         with open('test/resources/pod_status.json') as json_file:
@@ -250,6 +284,17 @@ def mock_list_namespaced_role_bindings(namespace, watch=False):
             return list_of_role_bind
 
 
+def mock_list_metadata(list_func):
+    """Side effect of KubeLibrary._list_metadata returning metadata of objects listed by typed list mock."""
+    def list_metadata(resource_path, watch=False, label_selector=None, **kwargs):
+        namespace = re.search(r'/namespaces/([^/]+)/', resource_path)
+        args = (namespace.group(1),) if namespace else ()
+        ret = list_func(*args, **({'label_selector': label_selector} if label_selector else {}))
+        items = [{'metadata': {'name': item.metadata.name}} for item in (ret.items if ret else [])]
+        return KubeObject({'kind': 'PartialObjectMetadataList', 'metadata': {}, 'items': items})
+    return list_metadata
+
+
 def mock_k8s_version():
     k8s_version = {
         'major': '1',
@@ -287,6 +332,132 @@ k8s_api_url = 'https://0.0.0.0:38041'
 responses = Responses('requests.packages.urllib3')
 
 
+class MockLogResponse(object):
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read = []
+        self.amt = None
+
+    def stream(self, amt=None, decode_content=True):
+        self.amt = amt
+        for chunk in self.chunks:
+            self.read.append(chunk)
+            yield chunk
+
+    def release_conn(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class QuietStreamHandler(BaseHTTPRequestHandler):
+    """Answers lists with empty PodList, starts chunked response of logs and watches, sending first line
+    of logs only, and then stays silent until server is stopped."""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if 'watch=true' not in self.path.lower() and '/log' not in self.path:
+            body = b'{"kind": "PodList", "apiVersion": "v1", "metadata": {"resourceVersion": "1"}, "items": []}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        if '/log' in self.path:
+            self.wfile.write(b'9\r\nstarting\n\r\n')
+        self.wfile.flush()
+        self.server.stopped.wait(10)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def quiet_stream_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), QuietStreamHandler)
+    server.stopped = threading.Event()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f'http://127.0.0.1:{server.server_port}'
+    finally:
+        server.stopped.set()
+        server.shutdown()
+        server.server_close()
+
+
+class MockExecWebSocket(object):
+    """Answers commands written by ExecSession, output is split into several frames."""
+    def __init__(self):
+        self.open = True
+        self.frames = []
+        self.channels = {}
+
+    def is_open(self):
+        return self.open
+
+    def write_stdin(self, data):
+        command = re.match(r'{ (.*)\n}', data).group(1)
+        marker = re.search(r'__KUBELIBRARY_\w+__', data).group(0)
+        if command == 'sleep 10':
+            return
+        stdout, stderr, rc = {'echo hello': ('hello\n', '', 0),
+                              'ls missing': ('', 'ls: missing: No such file\n', 1)}[command]
+        self.frames += [(1, stdout[:2]), (2, stderr), (1, f'{stdout[2:]}\n{marker} '), (1, f'{rc}\n'),
+                        (2, f'\n{marker}\n')]
+
+    def update(self, timeout=None):
+        if self.frames:
+            channel, data = self.frames.pop(0)
+            self.channels[channel] = self.channels.get(channel, '') + data
+        elif timeout:
+            time.sleep(min(timeout, 0.01))
+
+    def read_channel(self, channel, timeout=0):
+        return self.channels.pop(channel, '')
+
+    def close(self):
+        self.open = False
+
+
+class MockExecCommand(MockExecWebSocket):
+    """Sends given frames of single exec call and closes connection, or hangs when no frames are given."""
+    def __init__(self, frames=None):
+        super().__init__()
+        self.frames = list(frames or [])
+        self.hang = frames is None
+
+    def update(self, timeout=None):
+        if self.hang:
+            time.sleep(min(timeout, 0.01))
+            return
+        super().update()
+        if not self.frames:
+            self.open = False
+
+
+class MockTarCommand(MockExecCommand):
+    """Binary exec call, collects data written to stdin and sends given frames once reading starts."""
+    def __init__(self, frames):
+        super().__init__(frames)
+        self.stdin = b''
+
+    def write_stdin(self, data):
+        self.stdin += data
+
+    def update(self, timeout=None):
+        if self.frames:
+            channel, data = self.frames.pop(0)
+            self.channels[channel] = self.channels.get(channel, b'') + data
+        if not self.frames:
+            self.open = False
+
+
 class TestKubeLibrary(unittest.TestCase):
 
     apis = ('v1', 'networkingv1api', 'batchv1', 'appsv1',
@@ -311,6 +482,13 @@ class TestKubeLibrary(unittest.TestCase):
         kl = KubeLibrary(kube_config='test/resources/multiple_context')
         self.assertRaises(ConfigException, kl.reload_config, kube_config='test/resources/multiple_context', context='k3d-k3d-cluster2-wrong')
 
+    def test_KubeLibrary_bearer_token_ignores_loaded_kubeconfig(self):
+        KubeLibrary(kube_config='test/resources/k3d')
+        kl = KubeLibrary(api_url='https://127.0.0.1:6444', bearer_token='token')
+        configuration = kl.api_client.configuration
+        self.assertEqual('Bearer token', configuration.auth_settings()['BearerToken']['value'])
+        self.assertEqual('https://127.0.0.1:6444', configuration.host)
+
     @responses.activate
     def test_inits_all_api_clients(self):
         responses.add("GET", "/version", status=200)
@@ -319,6 +497,194 @@ class TestKubeLibrary(unittest.TestCase):
         for api in TestKubeLibrary.apis:
             self.assertIsNotNone(getattr(kl, api))
 
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespace', autospec=True)
+    def test_KubeLibrary_clusters(self, mock_ln):
+        hosts = []
+
+        def list_namespace(api, **kwargs):
+            hosts.append(api.api_client.configuration.host)
+            return AttributeDict({'items': [], 'metadata': {}})
+        mock_ln.side_effect = list_namespace
+        kl = KubeLibrary(kube_config='test/resources/multiple_context', page_size=10)
+        kl.add_cluster('second', kube_config='test/resources/multiple_context', context='k3d-k3d-cluster2')
+        self.assertEqual(10, kl._cluster_library('second').page_size)
+        kl.list_namespace()
+        kl.list_namespace(cluster='second')
+        self.assertIsNone(kl.use_cluster('second'))
+        kl.list_namespace()
+        kl.list_namespace(label_selector='a=b', cluster='second')
+        self.assertEqual('second', kl.use_cluster())
+        kl.list_namespace()
+        self.assertEqual(['https://0.0.0.0:38531', 'https://0.0.0.0:37971', 'https://0.0.0.0:37971',
+                          'https://0.0.0.0:37971', 'https://0.0.0.0:38531'], hosts)
+        self.assertIs(kl._cluster_library('second').v1, kl._cluster_library('second').v1)
+        self.assertRaisesRegex(ValueError, 'not added', kl.list_namespace, cluster='third')
+        self.assertRaisesRegex(ValueError, 'not added', kl.use_cluster, 'third')
+        kl.use_cluster('second')
+        kl.remove_cluster('second')
+        self.assertIs(kl, kl._cluster_library())
+        self.assertEqual(['kube_config', 'context', 'api_url', 'bearer_token', 'ca_cert', 'incluster',
+                          'cert_validation', 'informers', 'page_size', 'raw', 'discovery_cache_dir',
+                          'discovery_cache_ttl', 'pool_maxsize', 'tcp_keepalive', 'connect_timeout', 'read_timeout',
+                          'retries', 'request_stats', 'response_cache_ttl', 'response_cache_size', 'cluster'],
+                         list(inspect.signature(kl.reload_config).parameters))
+
+    @mock.patch.object(KubeLibrary, '_list_metadata', autospec=True)
+    def test_run_keyword_on_clusters(self, mock_lm):
+        def list_metadata(library, resource_path, **kwargs):
+            if library.api_client.configuration.host == 'https://0.0.0.0:37971':
+                raise ApiException(status=503, reason='Service Unavailable')
+            time.sleep(0.1)
+            return KubeObject({'items': [{'metadata': {'name': kwargs['label_selector']}}], 'metadata': {}})
+        mock_lm.side_effect = list_metadata
+        kl = KubeLibrary(kube_config='test/resources/multiple_context')
+        outcomes = kl.run_keyword_on_clusters(['k3d-k3d-cluster', 'k3d-k3d-cluster2'], 'Get Namespaces',
+                                              'label_selector=env=test')
+        self.assertEqual(['k3d-k3d-cluster', 'k3d-k3d-cluster2'], list(outcomes))
+        self.assertEqual(('PASS', ['env=test'], None), (outcomes['k3d-k3d-cluster']['status'],
+                                                        outcomes['k3d-k3d-cluster']['result'],
+                                                        outcomes['k3d-k3d-cluster']['error']))
+        self.assertGreaterEqual(outcomes['k3d-k3d-cluster']['duration'], 0.1)
+        self.assertEqual('FAIL', outcomes['k3d-k3d-cluster2']['status'])
+        self.assertIn('Service Unavailable', outcomes['k3d-k3d-cluster2']['error'])
+        outcomes = kl.run_keyword_on_clusters('k3d-k3d-cluster, k3d-k3d-cluster2', 'Filter Names', [])
+        self.assertEqual([[], []], [outcome['result'] for outcome in outcomes.values()])
+
+    @responses.activate
+    def test_kube_request_stats(self):
+        body = json.dumps({'kind': 'PodList', 'metadata': {}, 'items': [{'metadata': {'name': 'octopus-0'}}]})
+        responses.add("GET", "/api/v1/namespaces/default/pods", body=body, status=200,
+                      content_type='application/json')
+        responses.add("GET", "/api/v1/namespaces/default/services/missing", body='{"code": 404}', status=404,
+                      content_type='application/json')
+        kl = KubeLibrary(kube_config='test/resources/k3d', request_stats=True)
+        kl.list_namespaced_pod_by_pattern('.*', 'default')
+        self.assertRaises(ApiException, kl.read_namespaced_service, 'missing', 'default')
+        kl.run_keywords_concurrently(['Get Pod Names In Namespace', '.*', 'default'],
+                                     ['List Objects In Namespaces', 'Pod', 'default'])
+        stats = kl.get_kube_request_stats(reset=True)
+        self.assertEqual(['get_pod_names_in_namespace', 'list_namespaced_pod_by_pattern', 'list_objects_in_namespaces',
+                          'read_namespaced_service'], list(stats))
+        pods = stats['list_namespaced_pod_by_pattern']
+        self.assertEqual((1, 0, len(body), {200: 1}), (pods['requests'], pods['errors'], pods['bytes'], pods['statuses']))
+        self.assertEqual(1, sum(pods['buckets'].values()))
+        self.assertEqual({404: 1}, stats['read_namespaced_service']['statuses'])
+        self.assertEqual(1, stats['read_namespaced_service']['errors'])
+        self.assertEqual({}, kl.get_kube_request_stats())
+        kl.list_namespaced_pod_by_pattern('.*', 'default')
+        kl.log_kube_request_stats()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'kubelibrary.prom')
+            kl.write_kube_request_stats(path)
+            with open(path) as f:
+                text = f.read()
+            self.assertEqual(['kubelibrary.prom'], os.listdir(tmp))
+        self.assertIn('kubelibrary_requests_total{keyword="list_namespaced_pod_by_pattern",status="200"} 1\n', text)
+        self.assertIn('kubelibrary_request_duration_seconds_bucket{keyword="list_namespaced_pod_by_pattern",le="+Inf"} 1\n',
+                      text)
+        self.assertRaises(RuntimeError, KubeLibrary(kube_config='test/resources/k3d').get_kube_request_stats)
+
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_keyword_profiling(self, mock_lnp):
+        mock_lnp.side_effect = mock_list_namespaced_pod
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch.dict(os.environ, {'KUBELIBRARY_PROFILE_DIR': tmp}):
+                kl = KubeLibrary(kube_config='test/resources/k3d')
+            self.assertIs(kl.profiler, kl.ROBOT_LIBRARY_LISTENER)
+            kl.list_namespaced_pod_by_pattern('.*', 'default')
+            kl.get_pods_in_namespace('graf.*', 'default')
+            kl.get_pods_in_namespace('octo.*', 'default')
+            kl.profiler.end_suite('Suite', {})
+            self.assertEqual(['get_pods_in_namespace.pstats', 'list_namespaced_pod_by_pattern.pstats', 'summary.txt'],
+                             sorted(os.listdir(tmp)))
+            stats = pstats.Stats(os.path.join(tmp, 'get_pods_in_namespace.pstats'))
+            self.assertTrue(any(function == 'mock_list_namespaced_pod' for _, _, function in stats.stats))
+            with open(os.path.join(tmp, 'summary.txt')) as f:
+                summary = f.read().splitlines()
+            self.assertEqual(['Keyword', 'Calls'], summary[0].split()[:2])
+            self.assertIn(['get_pods_in_namespace', '2'], [line.split()[:2] for line in summary])
+            self.assertEqual(2, len(kl.profiler.keywords))
+        self.assertIsNone(KubeLibrary(kube_config='test/resources/k3d').profiler)
+
+    @mock.patch('kubernetes.client.CoreV1Api.read_namespaced_service')
+    def test_response_cache(self, mock_rns):
+        mock_rns.side_effect = lambda name, namespace: {'name': name, 'namespace': namespace}
+        kl = KubeLibrary(kube_config='test/resources/k3d', response_cache_ttl='1 min', response_cache_size=3)
+        kl.get_dynamic_resource = mock.Mock()
+        kl.dynamic = mock.Mock()
+        kl.read_namespaced_service('grafana', 'default')
+        kl.read_namespaced_service(name='grafana', namespace='default')
+        kl.read_namespaced_service('grafana', 'kubelibrary-testing')
+        self.assertEqual(2, mock_rns.call_count)
+        kl.create('v1', 'Service', body={}, namespace='kubelibrary-testing')
+        kl.create('v1', 'ConfigMap', body={}, namespace='default')
+        kl.read_namespaced_service('grafana', 'kubelibrary-testing')
+        kl.read_namespaced_service('grafana', 'default')
+        self.assertEqual(3, mock_rns.call_count)
+        kl.patch('v1', 'Service', body={})
+        kl.read_namespaced_service('grafana', 'default')
+        self.assertEqual(4, mock_rns.call_count)
+        for name in ('a', 'b', 'c'):
+            kl.read_namespaced_service(name, 'default')
+        kl.read_namespaced_service('grafana', 'default')
+        self.assertEqual(8, mock_rns.call_count)
+        kl.flush_kube_response_cache()
+        kl.read_namespaced_service('c', 'default')
+        self.assertEqual(9, mock_rns.call_count)
+        with mock.patch('KubeLibrary.cache.time.monotonic', return_value=time.monotonic() + 61):
+            kl.read_namespaced_service('c', 'default')
+        self.assertEqual(10, mock_rns.call_count)
+        # applied objects carry own namespace, namespace argument is only default
+        kl.read_namespaced_service('grafana', 'prod')
+        kl.apply_manifests([{'apiVersion': 'v1', 'kind': 'Service', 'metadata': {'name': 'grafana', 'namespace': 'prod'}}],
+                           namespace='default')
+        kl.read_namespaced_service('grafana', 'prod')
+        self.assertEqual(12, mock_rns.call_count)
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        kl.read_namespaced_service('grafana', 'default')
+        kl.read_namespaced_service('grafana', 'default')
+        kl.flush_kube_response_cache()
+        self.assertEqual(14, mock_rns.call_count)
+
+    @mock.patch('kubernetes.client.rest.RESTClientObject.request')
+    def test_KubeLibrary_connection_settings(self, mock_request):
+        kl = KubeLibrary(kube_config='test/resources/k3d', pool_maxsize='50', tcp_keepalive=True,
+                         connect_timeout='2s', read_timeout='10s', retries='3')
+        pool_kw = kl.v1.api_client.rest_client.pool_manager.connection_pool_kw
+        self.assertIs(kl.api_client, kl.v1.api_client)
+        self.assertEqual(50, pool_kw['maxsize'])
+        self.assertEqual(3, pool_kw['retries'].total)
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool_kw['socket_options'])
+        mock_request.return_value = RESTResponse(urllib3.HTTPResponse(
+            body=b'{"items": []}', status=200, headers={'Content-Type': 'application/json'}))
+        rest_client = kl.api_client.rest_client
+        rest_client.request('GET', 'https://localhost/api/v1/pods')
+        self.assertEqual((2, 10), mock_request.call_args.kwargs['_request_timeout'])
+        rest_client.request('GET', 'https://localhost/api/v1/pods?watch=True')
+        self.assertEqual((2, None), mock_request.call_args.kwargs['_request_timeout'])
+        rest_client.request('GET', 'https://localhost/api/v1/namespaces/default/pods/grafana/log',
+                            query_params=[('follow', True)])
+        self.assertEqual((2, None), mock_request.call_args.kwargs['_request_timeout'])
+        rest_client.request('GET', 'https://localhost/api/v1/pods', _request_timeout=1)
+        self.assertEqual(1, mock_request.call_args.kwargs['_request_timeout'])
+        kl.list_namespace()
+        self.assertEqual((2, 10), mock_request.call_args.kwargs['_request_timeout'])
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        kl.api_client.rest_client.request('GET', 'https://localhost/api/v1/pods')
+        self.assertIsNone(mock_request.call_args.kwargs.get('_request_timeout'))
+        self.assertNotIn('socket_options', kl.api_client.rest_client.pool_manager.connection_pool_kw)
+
+    def test_KubeLibrary_inits_api_clients_lazily(self):
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        for api in TestKubeLibrary.apis:
+            self.assertNotIn(api, kl.__dict__)
+        v1 = kl.v1
+        self.assertIs(v1, kl.v1)
+        self.assertNotIn('dynamic', kl.__dict__)
+        kl.reload_config(kube_config='test/resources/k3d')
+        self.assertIsNot(v1, kl.v1)
+        self.assertRaises(AttributeError, getattr, kl, 'missing_api')
+
     @responses.activate
     def test_KubeLibrary_inits_without_cert_validation(self):
         responses.add("GET", "/version", status=200)
@@ -437,6 +803,179 @@ class TestKubeLibrary(unittest.TestCase):
         kl = KubeLibrary(kube_config='test/resources/k3d')
         kl.delete("v1", "Pod", name="Mock")
 
+    @responses.activate
+    def test_KubeLibrary_discovery_cache(self):
+        responses.add("GET", "/version", status=200)
+        responses.add("GET", "/apis", status=200, body='{"groups": [], "kind": "Pod" }', content_type="application/json")
+        with tempfile.TemporaryDirectory() as cache_dir:
+            kl = KubeLibrary(api_url=k8s_api_url, bearer_token=bearer_token, discovery_cache_dir=cache_dir)
+            cache_file = kl._discovery_cache_file()
+            self.assertEqual(cache_dir, os.path.dirname(cache_file))
+            kl.dynamic
+            self.assertTrue(os.path.isfile(cache_file))
+            kl.reload_config(api_url=k8s_api_url, bearer_token='other', discovery_cache_dir=cache_dir)
+            kl.dynamic
+            self.assertNotEqual(cache_file, kl._discovery_cache_file())
+            self.assertEqual(2, len(os.listdir(cache_dir)))
+            os.utime(cache_file, (time.time() - 120, time.time() - 120))
+            kl.reload_config(api_url=k8s_api_url, bearer_token=bearer_token, discovery_cache_dir=cache_dir,
+                             discovery_cache_ttl='1min')
+            kl.dynamic
+            self.assertGreater(os.path.getmtime(cache_file), time.time() - 60)
+
+    @responses.activate
+    @mock.patch('kubernetes.dynamic.DynamicClient.server_side_apply')
+    @mock.patch('kubernetes.dynamic.discovery.LazyDiscoverer.get')
+    def test_apply_manifests(self, mock_get, mock_apply):
+        responses.add("GET", "/version", status=200)
+        responses.add("GET", "/apis", status=200, body='{"groups": [], "kind": "Pod" }', content_type="application/json")
+        mock_get.side_effect = lambda api_version, kind: AttributeDict({'kind': kind, 'namespaced': kind != 'Namespace'})
+        applied = []
+
+        def server_side_apply(resource, body, namespace, field_manager, force_conflicts):
+            if body['metadata']['name'] == 'broken':
+                raise ValueError('invalid')
+            applied.append((resource.kind, namespace))
+        mock_apply.side_effect = server_side_apply
+        manifests = '''
+apiVersion: v1
+kind: Pod
+metadata:
+  name: mock
+---
+apiVersion: v1
+kind: ConfigMap
+metadata:
+  name: broken
+---
+apiVersion: v1
+kind: List
+items:
+- apiVersion: v1
+  kind: Namespace
+  metadata:
+    name: mock
+- apiVersion: v1
+  kind: Service
+  metadata:
+    name: mock
+    namespace: mock
+'''
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        self.assertRaises(AssertionError, kl.apply_manifests, manifests, namespace='mock')
+        self.assertEqual(('Namespace', None), applied[0])
+        self.assertEqual({('Pod', 'mock'), ('Service', 'mock')}, set(applied[1:]))
+        results = kl.apply_manifests(manifests, fail_on_error=False, max_workers=1)
+        self.assertEqual(['applied', 'failed', 'applied', 'applied'], [result['status'] for result in results])
+        self.assertEqual('default', results[0]['namespace'])
+        self.assertEqual('invalid', results[1]['error'])
+
+    @responses.activate
+    @mock.patch('kubernetes.dynamic.DynamicClient.request')
+    @mock.patch('kubernetes.dynamic.DynamicClient.get')
+    @mock.patch('kubernetes.dynamic.discovery.LazyDiscoverer.get')
+    def test_delete_collection(self, mock_resource, mock_get, mock_request):
+        responses.add("GET", "/version", status=200)
+        responses.add("GET", "/apis", status=200, body='{"groups": [], "kind": "Pod" }', content_type="application/json")
+        mock_resource.return_value = AttributeDict({'kind': 'Pod', 'namespaced': True,
+                                                    'verbs': ['delete', 'deletecollection', 'list', 'watch']})
+        mock_resource.return_value.path = lambda namespace=None: f'/api/v1/namespaces/{namespace}/pods'
+        mock_request.return_value = AttributeDict({'kind': 'PodList', 'items': [{'metadata': {'name': 'mock'}}]})
+        mock_get.return_value = AttributeDict({'items': [], 'metadata': {'resourceVersion': '1'}})
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        deleted = kl.delete_collection('v1', 'Pod', 'default', label_selector='app=mock', wait=True)
+        self.assertEqual(['mock'], deleted)
+        mock_request.assert_called_once_with('delete', '/api/v1/namespaces/default/pods',
+                                             propagation_policy='Background', label_selector='app=mock',
+                                             field_selector=None)
+
+    @responses.activate
+    @mock.patch('kubernetes.dynamic.DynamicClient.watch')
+    @mock.patch('kubernetes.dynamic.DynamicClient.delete')
+    @mock.patch('kubernetes.dynamic.DynamicClient.get')
+    @mock.patch('kubernetes.dynamic.discovery.LazyDiscoverer.get')
+    def test_delete_collection_one_by_one(self, mock_resource, mock_get, mock_delete, mock_watch):
+        responses.add("GET", "/version", status=200)
+        responses.add("GET", "/apis", status=200, body='{"groups": [], "kind": "Pod" }', content_type="application/json")
+        mock_resource.return_value = AttributeDict({'kind': 'Mock', 'namespaced': True, 'verbs': ['delete', 'list']})
+        items = [{'metadata': {'name': name, 'namespace': 'default', 'resourceVersion': '2'}} for name in ('a', 'b')]
+        mock_get.return_value = AttributeDict({'items': items, 'metadata': {'resourceVersion': '1'}})
+        mock_watch.side_effect = lambda *args, **kwargs: iter([{'type': 'DELETED', 'object': AttributeDict(item)}
+                                                               for item in items])
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        self.assertEqual(['a', 'b'], kl.delete_collection('mock/v1', 'Mock', wait=True, max_workers=2))
+        self.assertEqual(2, mock_delete.call_count)
+        mock_watch.assert_called_once()
+        mock_watch.side_effect = lambda *args, **kwargs: iter([])
+        self.assertRaises(TimeoutError, kl.delete_collection, 'mock/v1', 'Mock', wait=True, timeout='0.1s')
+
+    @mock.patch('kubernetes.client.CoreV1Api.read_namespaced_pod_log')
+    def test_iterate_pod_log_lines(self, mock_log):
+        mock_log.return_value = MockLogResponse([b'first li', b'ne\nsecond line\n', 'zażółć\nlast'.encode()])
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        lines = kl.iterate_pod_log_lines('mock', 'default', 'busybox', tail_lines=10, limit_bytes=1024)
+        self.assertEqual(['first line', 'second line', 'zażółć', 'last'], list(lines))
+        self.assertEqual(10, mock_log.call_args.kwargs['tail_lines'])
+        self.assertEqual(1024, mock_log.call_args.kwargs['limit_bytes'])
+        self.assertIsNotNone(mock_log.return_value.amt)
+        self.assertFalse(mock_log.call_args.kwargs['_preload_content'])
+
+    @mock.patch('kubernetes.client.CoreV1Api.read_namespaced_pod_log')
+    def test_wait_until_pod_log_contains(self, mock_log):
+        mock_log.return_value = MockLogResponse([b'starting\n', b'Server started on port 8080\n', b'request\n'])
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        line = kl.wait_until_pod_log_contains('mock', 'default', 'busybox', r'started on port \d+')
+        self.assertEqual('Server started on port 8080', line)
+        self.assertEqual(2, len(mock_log.return_value.read))
+        self.assertTrue(mock_log.call_args.kwargs['follow'])
+
+    def test_wait_until_pod_log_contains_quiet_log(self):
+        with quiet_stream_server() as url:
+            kl = KubeLibrary(api_url=url, bearer_token='token')
+            start = time.monotonic()
+            self.assertRaises(TimeoutError, kl.wait_until_pod_log_contains, 'mock', 'default', 'busybox', 'started',
+                              timeout='0.5s')
+            self.assertLess(time.monotonic() - start, 3)
+
+    def test_informer_stop_closes_watch(self):
+        with quiet_stream_server() as url:
+            kl = KubeLibrary(api_url=url, bearer_token='token')
+            informer = Informer(kl.v1.list_namespaced_pod, 'default').start()
+            informer.wait_for_sync(5)
+            for _ in range(500):
+                if informer._response is not None:
+                    break
+                time.sleep(0.01)
+            self.assertIsNotNone(informer._response)
+            start = time.monotonic()
+            informer.stop()
+            self.assertFalse(informer._thread.is_alive())
+            self.assertLess(time.monotonic() - start, 3)
+            self.assertIsNone(informer.error)
+
+    @mock.patch('kubernetes.client.CoreV1Api.read_namespaced_pod_log')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_collect_pod_logs(self, mock_lnp, mock_log):
+        mock_lnp.side_effect = mock_list_namespaced_pod
+
+        def read_log(name, namespace, container, **kwargs):
+            if name == 'octopus-0':
+                raise ValueError('container not started')
+            return MockLogResponse([b'line 1\n', b'line 2\n'])
+        mock_log.side_effect = read_log
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        with tempfile.TemporaryDirectory() as output_dir:
+            manifest = kl.collect_pod_logs('.*', 'default', output_dir, compress=True, max_workers=2)
+            self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], [entry['pod'] for entry in manifest])
+            self.assertEqual('container not started', manifest[0]['error'])
+            self.assertEqual(14, manifest[1]['bytes'])
+            path = os.path.join(output_dir, 'default', 'grafana-5d9895c6c4-sfsn8', 'grafana.log.gz')
+            self.assertEqual(path, manifest[1]['path'])
+            with gzip.open(path) as f:
+                self.assertEqual(b'line 1\nline 2\n', f.read())
+            with open(os.path.join(output_dir, 'default', 'manifest.json')) as f:
+                self.assertEqual(manifest, json.load(f))
+
     def test_generate_alphanumeric_str(self):
         name = KubeLibrary.generate_alphanumeric_str(10)
         self.assertEqual(10, len(name))
@@ -450,9 +989,11 @@ class TestKubeLibrary(unittest.TestCase):
         self.assertIsNotNone(configmap)
         self.assertEqual(configmap.metadata.name, "Mock")
 
+    @mock.patch.object(KubeLibrary, '_list_metadata')
     @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
-    def test_list_namespaced_pod_by_pattern(self, mock_lnp):
+    def test_list_namespaced_pod_by_pattern(self, mock_lnp, mock_lm):
         mock_lnp.side_effect = mock_list_namespaced_pod
+        mock_lm.side_effect = mock_list_metadata(mock_list_namespaced_pod)
         kl = KubeLibrary(kube_config='test/resources/k3d')
         pods = kl.list_namespaced_pod_by_pattern('.*', 'default')
         pods2 = kl.get_pods_in_namespace('.*', 'default')
@@ -461,6 +1002,301 @@ class TestKubeLibrary(unittest.TestCase):
         self.assertEqual(kl.filter_names(pods), kl.filter_pods_names(pods2))
         self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
 
+    @mock.patch('kubernetes.watch.Watch.stream')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_list_namespaced_pod_by_pattern_with_informers(self, mock_lnp, mock_stream):
+        mock_lnp.side_effect = mock_list_namespaced_pod_with_version
+        deleted = threading.Event()
+
+        def mock_watch_stream(list_func, *args, **kwargs):
+            if kwargs['resource_version'] == '1' and deleted.wait(5):
+                pod = mock_list_namespaced_pod('default').items[0]
+                pod.metadata.resource_version = '2'
+                yield {'type': 'DELETED', 'object': pod}
+            time.sleep(0.01)
+        mock_stream.side_effect = mock_watch_stream
+        kl = KubeLibrary(kube_config='test/resources/k3d', informers=True)
+        pods = kl.list_namespaced_pod_by_pattern('.*', 'default')
+        self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+        deleted.set()
+        informer = kl.informers[('Pod', 'default', '', '')]
+        for _ in range(500):
+            if informer.resource_version == '2':
+                break
+            time.sleep(0.01)
+        pods = kl.list_namespaced_pod_by_pattern('graf.*', 'default')
+        self.assertEqual(['grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+        self.assertEqual(1, mock_lnp.call_count)
+        kl.stop_informers()
+        self.assertEqual({}, kl.informers)
+
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_informers_fail_on_list_error(self, mock_lnp):
+        mock_lnp.side_effect = ApiException(status=403, reason='Forbidden')
+        kl = KubeLibrary(kube_config='test/resources/k3d', informers=True)
+        start = time.monotonic()
+        self.assertRaises(ApiException, kl.list_namespaced_pod_by_pattern, '.*', 'default')
+        self.assertLess(time.monotonic() - start, 5)
+        # failed informer is stopped, so it does not retry in background
+        self.assertEqual({}, kl.informers)
+        calls = mock_lnp.call_count
+        time.sleep(1.5)
+        self.assertEqual(calls, mock_lnp.call_count)
+
+    def test_informer_retry_backoff(self):
+        list_func = mock.Mock(side_effect=ApiException(status=403, reason='Forbidden'))
+        informer = Informer(list_func, 'default', retry_interval=0.05, max_retry_interval=0.2).start()
+        self.assertRaises(ApiException, informer.wait_for_sync, 5)
+        time.sleep(0.8)
+        informer.stop()
+        # 0.05, 0.1, 0.2, 0.2, 0.2 seconds between retries instead of 16 retries after 0.05 seconds each
+        self.assertLessEqual(list_func.call_count, 7)
+        self.assertEqual(0.2, informer._retry_delay)
+
+    @mock.patch('KubeLibrary.informer.Informer.start', autospec=True)
+    def test_informers_started_once_for_concurrent_keywords(self, mock_start):
+        mock_start.side_effect = lambda informer: time.sleep(0.05) or informer
+        kl = KubeLibrary(kube_config='test/resources/k3d', informers=True)
+        threads = [threading.Thread(target=kl._informer, args=('Pod', 'default')) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(1, mock_start.call_count)
+
+    @mock.patch('kubernetes.watch.Watch.stream')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_wait_until_pods_ready(self, mock_lnp, mock_stream):
+        mock_lnp.side_effect = mock_list_namespaced_pod_with_version
+
+        def mock_watch_stream(list_func, *args, **kwargs):
+            pod = mock_list_namespaced_pod('default').items[0]
+            pod.metadata.resource_version = '2'
+            pod.status.conditions[1].status = 'True'
+            yield {'type': 'MODIFIED', 'object': pod}
+            time.sleep(0.01)
+        mock_stream.side_effect = mock_watch_stream
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        pods = kl.wait_until_pods_ready('octopus', 'default', timeout='5s')
+        self.assertEqual(['octopus-0'], kl.filter_names(pods))
+        self.assertEqual('True', pods[0].status.conditions[1].status)
+        self.assertEqual({}, kl.informers)
+
+    @mock.patch('kubernetes.watch.Watch.stream')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_wait_for_condition_timeout(self, mock_lnp, mock_stream):
+        mock_lnp.side_effect = mock_list_namespaced_pod_with_version
+
+        def mock_watch_stream(list_func, *args, **kwargs):
+            time.sleep(0.01)
+            return iter([])
+        mock_stream.side_effect = mock_watch_stream
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        pods = kl.wait_for_condition('Pod', '.*', 'default', 'Ready', status='true', timeout='1s')
+        self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+        self.assertRaises(TimeoutError, kl.wait_for_condition, 'Pod', 'grafana', 'default', 'Ready', timeout='0.2s')
+
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_wait_until_pods_ready_fails_on_list_error(self, mock_lnp):
+        mock_lnp.side_effect = ApiException(status=403, reason='Forbidden')
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        start = time.monotonic()
+        with self.assertRaises(ApiException) as cm:
+            kl.wait_until_pods_ready('octopus', 'default', timeout='3s')
+        self.assertEqual(403, cm.exception.status)
+        self.assertLess(time.monotonic() - start, 2)
+
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_list_namespaced_pod_by_pattern_paged(self, mock_lnp):
+        mock_lnp.side_effect = mock_list_namespaced_pod_paged
+        kl = KubeLibrary(kube_config='test/resources/k3d', page_size=1)
+        pods = kl.list_namespaced_pod_by_pattern('.*', 'default')
+        self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+        self.assertEqual(2, mock_lnp.call_count)
+        self.assertEqual('1', mock_lnp.call_args.kwargs['_continue'])
+
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_iterate_objects(self, mock_lnp):
+        mock_lnp.side_effect = mock_list_namespaced_pod_paged
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        pods = kl.iterate_objects('Pod', 'default', name_pattern='graf', page_size=1)
+        self.assertEqual(0, mock_lnp.call_count)
+        self.assertEqual(['grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+        self.assertEqual(2, mock_lnp.call_count)
+
+    @mock.patch('kubernetes.client.CustomObjectsApi.list_cluster_custom_object')
+    def test_iterate_custom_objects(self, mock_lcco):
+        names = ['macvlan-a', 'macvlan-b', 'sriov']
+
+        def list_cluster_custom_object(group, version, plural, limit=None, _continue=None):
+            page = int(_continue or 0)
+            metadata = {'continue': str(page + limit)} if page + limit < len(names) else {}
+            return {'items': [{'metadata': {'name': name}} for name in names[page:page + limit]], 'metadata': metadata}
+        mock_lcco.side_effect = list_cluster_custom_object
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        objects = kl.iterate_custom_objects('k8s.cni.cncf.io', 'v1', 'network-attachment-definitions',
+                                            name_pattern='macvlan', page_size=2)
+        self.assertEqual(0, mock_lcco.call_count)
+        self.assertEqual(['macvlan-a', 'macvlan-b'], [obj['metadata']['name'] for obj in objects])
+        self.assertEqual(2, mock_lcco.call_count)
+        self.assertEqual(('k8s.cni.cncf.io', 'v1', 'network-attachment-definitions'), mock_lcco.call_args.args)
+
+    def test_plan_name_query(self):
+        self.assertEqual((None, None), KubeLibrary._plan_name_query('.*'))
+        self.assertEqual(('octopus-0', None), KubeLibrary._plan_name_query('octopus-0$'))
+        self.assertEqual(('my.app', None), KubeLibrary._plan_name_query('^my\\.app$'))
+        name, match = KubeLibrary._plan_name_query('octopus')
+        self.assertIsNone(name)
+        self.assertTrue(match('octopus-0'))
+        self.assertFalse(match('grafana'))
+        name, match = KubeLibrary._plan_name_query('octo.*-[0-9]$')
+        self.assertIsNone(name)
+        self.assertTrue(match('octopus-0'))
+        self.assertFalse(match('octopus-a'))
+
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_list_namespaced_pod_by_pattern_with_field_selector(self, mock_lnp):
+        mock_lnp.side_effect = lambda namespace, watch, **kwargs: mock_list_namespaced_pod(namespace)
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        kl.list_namespaced_pod_by_pattern('octopus-0$', 'default', field_selector='status.phase=Running')
+        self.assertEqual('metadata.name=octopus-0,status.phase=Running', mock_lnp.call_args.kwargs['field_selector'])
+        pods = kl.list_namespaced_pod_by_pattern('graf', 'default', field_selector='status.phase=Running')
+        self.assertEqual('status.phase=Running', mock_lnp.call_args.kwargs['field_selector'])
+        self.assertEqual(['grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+
+    @responses.activate
+    def test_list_namespaced_pod_by_pattern_metadata_only(self):
+        def mock_callback(request):
+            self.assertEqual(request.headers['Accept'], 'application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1')
+            self.assertIn('labelSelector=app%3Doctopus', request.url)
+            with open('test/resources/pods.json') as json_file:
+                items = [{'metadata': {'name': pod['metadata']['name'], 'labels': pod['metadata']['labels'],
+                                       'resourceVersion': pod['metadata']['resource_version']}}
+                         for pod in json.load(json_file)]
+            return (200, {}, json.dumps({'kind': 'PartialObjectMetadataList', 'metadata': {}, 'items': items}))
+        responses.add_callback("GET", "/api/v1/namespaces/default/pods", callback=mock_callback)
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        pods = kl.list_namespaced_pod_by_pattern('graf', 'default', label_selector='app=octopus', metadata_only=True)
+        self.assertEqual(['grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+        self.assertTrue(kl.assert_pod_has_labels(pods[0], '{"app.kubernetes.io/name":"grafana"}'))
+        self.assertIsNotNone(pods[0].metadata.resource_version)
+        self.assertRaises(AttributeError, getattr, pods[0], 'spec')
+
+    @mock.patch('kubernetes.client.CoreV1Api.list_pod_for_all_namespaces')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_list_objects_in_namespaces(self, mock_lnp, mock_lpfan):
+        mock_lnp.side_effect = lambda namespace, **kwargs: (mock_list_namespaced_pod(namespace, **kwargs)
+                                                            or AttributeDict({'items': []}))
+        mock_lpfan.side_effect = lambda **kwargs: mock_list_namespaced_pod('default', **kwargs)
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        pods = kl.list_objects_in_namespaces('Pod', ['default', 'kube-system'], name_pattern='graf', max_workers=2)
+        self.assertEqual(['default', 'kube-system'], list(pods))
+        self.assertEqual(['grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods['default']))
+        self.assertEqual([], pods['kube-system'])
+        self.assertEqual(2, mock_lnp.call_count)
+        pods = kl.list_objects_in_namespaces('Pod')
+        self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods['default']))
+        mock_lpfan.assert_called_once()
+        namespaces = [f'tenant-{i}' for i in range(60)] + ['default']
+        pods = kl.list_objects_in_namespaces('Pod', namespaces, name_pattern='graf')
+        self.assertEqual(63, mock_lnp.call_count)
+        self.assertEqual(['grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods['default']))
+        pods = kl.list_objects_in_namespaces('Pod', namespaces, name_pattern='graf', all_namespaces=True)
+        self.assertEqual(2, mock_lpfan.call_count)
+        self.assertEqual(['grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods['default']))
+        self.assertEqual([], pods['tenant-0'])
+
+    @mock.patch.object(KubeLibrary, '_list_metadata')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_run_keywords_concurrently(self, mock_lnp, mock_lm):
+        mock_lnp.side_effect = mock_list_namespaced_pod
+        mock_lm.side_effect = mock_list_metadata(mock_list_namespaced_pod)
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        pods, names, versions = kl.run_keywords_concurrently(
+            ['List Namespaced Pod By Pattern', 'graf.*', 'default', 'label_selector=app=grafana'],
+            ['get_pod_names_in_namespace', '.*', 'default'],
+            ['Evaluate Callable From K8s Client', 'V1Namespace'], max_workers=2)
+        self.assertEqual(['grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+        self.assertEqual('app=grafana', mock_lnp.call_args_list[0].kwargs['label_selector'])
+        self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], names)
+        self.assertRaisesRegex(ValueError, 'No KubeLibrary keyword', kl.run_keywords_concurrently, ['Log', 'x'])
+        failing = ['List Namespaced Pod By Pattern', '[', 'default']
+        self.assertRaisesRegex(AssertionError, '1 of 2 keywords failed', kl.run_keywords_concurrently,
+                               failing, ['Get Pod Names In Namespace', '.*', 'default'])
+        results = kl.run_keywords_concurrently(failing, fail_on_error=False)
+        self.assertIsInstance(results[0], re.error)
+
+    def test_keyword_call_arguments(self):
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        call = kl._keyword_call(['List Namespaced Pod By Pattern', '.*', 'default', 'metadata_only=False'])
+        self.assertEqual(('.*', 'default'), call.args)
+        self.assertIs(False, call.keywords['metadata_only'])
+        call = kl._keyword_call(['Delete Collection', 'v1', 'Pod', 'default', 'wait=True', 'timeout=10s'])
+        self.assertIs(True, call.keywords['wait'])
+        self.assertEqual('10s', call.keywords['timeout'])
+        call = kl._keyword_call(['Get', 'v1', 'Pod', 'namespace=default', 'label_selector=app=web'])
+        self.assertEqual(('v1', 'Pod'), call.args)
+        self.assertEqual({'namespace': 'default', 'label_selector': 'app=web'}, call.keywords)
+
+    @mock.patch.object(KubeLibrary, '_list_metadata')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_async_kube_library(self, mock_lnp, mock_lm):
+        mock_lnp.side_effect = mock_list_namespaced_pod
+        mock_lm.side_effect = mock_list_metadata(mock_list_namespaced_pod)
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+
+        async def check():
+            async with AsyncKubeLibrary(kl, max_workers=2) as akl:
+                return await asyncio.gather(akl.get_pod_names_in_namespace('octo.*', 'default'),
+                                            akl.get_pod_names_in_namespace('graf.*', 'default'))
+        self.assertEqual([['octopus-0'], ['grafana-5d9895c6c4-sfsn8']], asyncio.run(check()))
+        self.assertRaises(AttributeError, getattr, AsyncKubeLibrary(kl), '_list')
+
+    @responses.activate
+    def test_list_namespaced_pod_by_pattern_raw(self):
+        with open('test/resources/pods.json') as json_file:
+            body = json.dumps({'kind': 'PodList', 'apiVersion': 'v1', 'metadata': {}, 'items': json.load(json_file)})
+        responses.add("GET", "/api/v1/namespaces/default/pods", body=body, status=200)
+        kl = KubeLibrary(kube_config='test/resources/k3d', raw=True)
+        pods = kl.list_namespaced_pod_by_pattern('.*', 'default')
+        self.assertIsInstance(pods[0], KubeObject)
+        self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], kl.filter_names(pods))
+        containers = kl.filter_pods_containers_by_name(pods, '.*')
+        self.assertEqual('100m', kl.filter_containers_resources(containers)[0].limits.cpu)
+
+    def test_kube_object(self):
+        obj = KubeObject({'kind': 'Pod', 'apiVersion': 'v1',
+                          'metadata': {'name': 'mock', 'resourceVersion': '1', 'labels': {'app': 'mock'}},
+                          'spec': {'containers': [{'name': 'c1', 'imagePullPolicy': 'Always'}]}})
+        self.assertEqual('1', obj.metadata.resource_version)
+        self.assertEqual('Always', obj.spec.containers[0].image_pull_policy)
+        self.assertTrue('app' in obj.metadata.labels)
+        self.assertEqual('mock', obj.metadata.labels['app'])
+        self.assertIsNone(obj.metadata.annotations)
+        self.assertEqual({'app': 'mock'}, obj.metadata.labels)
+        self.assertEqual({'name': 'c1', 'imagePullPolicy': 'Always'}, obj.spec.containers[0].to_dict())
+        self.assertRaises(AttributeError, getattr, obj.metadata, 'missing_field')
+        self.assertRaises(AttributeError, getattr, KubeObject({'spec': {}}), 'status')
+        self.assertIsInstance(obj, Mapping)
+        self.assertEqual(['kind', 'apiVersion', 'metadata', 'spec'], list(obj.keys()))
+        self.assertEqual('mock', obj.get('metadata')['name'])
+        self.assertEqual({'app': 'mock'}, dict(obj.metadata.labels))
+
+    def test_kube_object_ip_fields(self):
+        pod = KubeObject({'kind': 'Pod', 'apiVersion': 'v1', 'status': {
+            'podIP': '10.42.0.9', 'hostIP': '172.18.0.2', 'podIPs': [{'ip': '10.42.0.9'}]}})
+        self.assertEqual('10.42.0.9', pod.status.pod_ip)
+        self.assertEqual('172.18.0.2', pod.status.host_ip)
+        self.assertEqual('10.42.0.9', pod.status.pod_ips[0].ip)
+        self.assertIsNone(pod.status.message)
+        service = KubeObject({'kind': 'Service', 'apiVersion': 'v1', 'spec': {
+            'clusterIP': '10.43.0.1', 'externalIPs': ['192.168.1.10'], 'loadBalancerIP': '192.168.1.11'}})
+        self.assertEqual('10.43.0.1', service.spec.cluster_ip)
+        self.assertEqual(['192.168.1.10'], service.spec.external_ips)
+        self.assertEqual('192.168.1.11', service.spec.load_balancer_ip)
+        items = KubeObject({'items': [{'spec': {'clusterIP': '10.43.0.2'}}]}).items
+        self.assertEqual('10.43.0.2', items[0].spec.cluster_ip)
+
     @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
     def test_get_matching_pods_in_namespace(self, mock_lnp):
         mock_lnp.side_effect = mock_list_namespaced_pod
@@ -562,12 +1398,15 @@ class TestKubeLibrary(unittest.TestCase):
         with open('test/resources/pod_status.json', 'w') as outfile:
             json.dump(json.loads(pods), outfile, indent=4)
 
+    @mock.patch.object(KubeLibrary, '_list_metadata')
     @mock.patch('kubernetes.client.CoreV1Api.list_namespace')
-    def test_list_namespace(self, mock_lnp):
+    def test_list_namespace(self, mock_lnp, mock_lm):
         mock_lnp.side_effect = mock_list_namespaces
+        mock_lm.side_effect = mock_list_metadata(mock_list_namespaces)
         kl = KubeLibrary(kube_config='test/resources/k3d')
         namespaces = kl.list_namespace()
         namespaces2 = kl.get_namespaces()
+        self.assertEqual('/api/v1/namespaces', mock_lm.call_args.args[0])
         self.assertEqual(kl.filter_names(namespaces), namespaces2)
         self.assertTrue(len(namespaces) > 0)
         self.assertEqual(['default', 'kubelib-test-test-objects-chart'], kl.filter_names(namespaces))
@@ -617,6 +1456,23 @@ class TestKubeLibrary(unittest.TestCase):
                                             argv_cmd=["/bin/bash", "-c", f"echo {test_string}"])
         self.assertFalse("container" in mock_stream.call_args.kwargs.keys())
         self.assertEqual(stdout, test_string)
+        # exec gets its own ApiClient, as stream.stream replaces its methods for the time of call
+        exec_client = mock_stream.call_args.args[0].__self__.api_client
+        self.assertIsNot(exec_client, kl.v1.api_client)
+        self.assertEqual(exec_client.configuration.host, kl.v1.api_client.configuration.host)
+
+    @mock.patch('kubernetes.stream.stream')
+    def test_get_namespaced_exec_runs_concurrently(self, mock_stream):
+        def stream(func, name, namespace, **kwargs):
+            time.sleep(0.5)
+            return name
+        mock_stream.side_effect = stream
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        start = time.monotonic()
+        results = kl.run_keywords_concurrently(['Get Namespaced Pod Exec', 'pod-1', 'default', ['hostname']],
+                                               ['Get Namespaced Pod Exec', 'pod-2', 'default', ['hostname']])
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(['pod-1', 'pod-2'], results)
 
     @mock.patch('kubernetes.stream.stream')
     def test_get_namespaced_exec_with_container(self, mock_stream):
@@ -645,9 +1501,129 @@ class TestKubeLibrary(unittest.TestCase):
                                        argv_cmd=f"echo {test_string}")
         self.assertEqual(str(cm.exception), ex)
 
+    @mock.patch('kubernetes.stream.stream')
+    def test_exec_session(self, mock_stream):
+        mock_stream.return_value = MockExecWebSocket()
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        session = kl.open_exec_session('pod_name', 'default', container='manager')
+        self.assertEqual(['/bin/sh'], mock_stream.call_args.kwargs['command'])
+        self.assertFalse(mock_stream.call_args.kwargs['_preload_content'])
+        result = kl.run_in_exec_session(session, 'echo hello')
+        self.assertEqual(('hello\n', '', 0), (result.stdout, result.stderr, result.rc))
+        result = kl.run_in_exec_session(session, 'ls missing')
+        self.assertEqual(('', 'ls: missing: No such file\n', 1), (result.stdout, result.stderr, result.rc))
+        self.assertRaises(TimeoutError, kl.run_in_exec_session, session, 'sleep 10', timeout='0.1s')
+        self.assertFalse(session.is_open())
+        self.assertRaises(ConnectionError, kl.run_in_exec_session, session, 'echo hello')
+        kl.close_exec_session(session)
+
+    @mock.patch('kubernetes.stream.stream')
+    def test_exec_in_pod(self, mock_stream):
+        mock_stream.return_value = MockExecCommand([(1, 'a' * 6), (2, 'warning'), (1, 'b' * 6),
+                                                    (3, '{"status": "Success"}')])
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        result = kl.exec_in_pod('pod_name', 'default', ['cat', '/data'], container='app', max_output_size='10')
+        self.assertEqual('app', mock_stream.call_args.kwargs['container'])
+        self.assertFalse(mock_stream.call_args.kwargs['stdin'])
+        self.assertEqual(('aaaaaabbbb', 'warning', 0, True), (result.stdout, result.stderr, result.rc, result.truncated))
+        mock_stream.return_value = MockExecCommand()
+        result = kl.exec_in_pod('pod_name', 'default', ['sleep', '10'], timeout='0.1s')
+        self.assertTrue(result.timed_out)
+        self.assertFalse(result.truncated)
+        self.assertRaises(TypeError, kl.exec_in_pod, 'pod_name', 'default', 'sleep 10')
+
+    @mock.patch('kubernetes.stream.stream')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_exec_in_pods(self, mock_lnp, mock_stream):
+        mock_lnp.side_effect = mock_list_namespaced_pod
+        failed = ('{"status": "Failure", "reason": "NonZeroExitCode", '
+                  '"details": {"causes": [{"reason": "ExitCode", "message": "2"}]}}')
+        websockets = {'octopus-0': MockExecCommand([(1, 'config'), (2, 'warning'), (1, '\n'), (3, failed)]),
+                      'grafana-5d9895c6c4-sfsn8': MockExecCommand()}
+        mock_stream.side_effect = lambda func, name, namespace, **kwargs: websockets[name]
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        results = kl.exec_in_pods('.*', 'default', ['cat', '/config'], timeout='0.2s')
+        self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], list(results))
+        result = results['octopus-0']
+        self.assertEqual(('config\n', 'warning', 2, False), (result.stdout, result.stderr, result.rc, result.timed_out))
+        result = results['grafana-5d9895c6c4-sfsn8']
+        self.assertTrue(result.timed_out)
+        self.assertIsNone(result.rc)
+        self.assertGreaterEqual(result.duration, 0.2)
+        self.assertFalse(websockets['grafana-5d9895c6c4-sfsn8'].open)
+
+    @mock.patch('kubernetes.stream.stream')
+    @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_pod')
+    def test_exec_in_pods_connects_concurrently(self, mock_lnp, mock_stream):
+        mock_lnp.side_effect = mock_list_namespaced_pod
+        clients = []
+
+        def slow_connect(func, name, namespace, **kwargs):
+            clients.append(func.__self__.api_client)
+            time.sleep(0.5)
+            return MockExecCommand([(1, name), (3, '{"status": "Success"}')])
+        mock_stream.side_effect = slow_connect
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        start = time.monotonic()
+        results = kl.exec_in_pods('.*', 'default', ['hostname'])
+        self.assertLess(time.monotonic() - start, 0.9)
+        self.assertEqual(['octopus-0', 'grafana-5d9895c6c4-sfsn8'], [result.stdout for result in results.values()])
+        self.assertEqual(2, len(set(map(id, clients))))
+
+    @mock.patch('kubernetes.stream.stream')
+    def test_copy_to_pod(self, mock_stream):
+        success = (3, b'{"status": "Success"}')
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        with tempfile.TemporaryDirectory() as tmp:
+            os.makedirs(os.path.join(tmp, 'data', 'sub'))
+            with open(os.path.join(tmp, 'data', 'sub', 'file.bin'), 'wb') as f:
+                f.write(os.urandom(200000))
+            for compress, mode in ((False, 'r|'), (True, 'r:gz')):
+                mock_stream.return_value = ws = MockTarCommand([success])
+                kl.copy_to_pod(os.path.join(tmp, 'data'), 'pod_name', 'default', '/tmp', compress=compress)
+                self.assertTrue(mock_stream.call_args.kwargs['binary'])
+                with tarfile.open(fileobj=io.BytesIO(ws.stdin), mode=mode) as tar:
+                    self.assertEqual(['data', 'data/sub', 'data/sub/file.bin'], tar.getnames())
+            self.assertEqual(['sh', '-c', f'head -c {len(ws.stdin)} | tar xzf - -C "$0"', '/tmp'],
+                             mock_stream.call_args.kwargs['command'])
+            failed = (3, b'{"status": "Failure", "message": "command terminated with non-zero exit code", '
+                         b'"details": {"causes": [{"reason": "ExitCode", "message": "2"}]}}')
+            mock_stream.return_value = MockTarCommand([(2, b'tar: /missing: No such file'), failed])
+            self.assertRaisesRegex(AssertionError, 'exit code 2: tar: /missing', kl.copy_to_pod,
+                                   os.path.join(tmp, 'data'), 'pod_name', 'default', '/missing')
+
+    @mock.patch('kubernetes.stream.stream')
+    def test_copy_from_pod(self, mock_stream):
+        content = os.urandom(200000)
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode='w:gz') as tar:
+            info = tarfile.TarInfo('logs/app.log')
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+        data = archive.getvalue()
+        frames = [(1, data[i:i + 1000]) for i in range(0, len(data), 1000)] + [(3, b'{"status": "Success"}')]
+        mock_stream.return_value = MockTarCommand(frames)
+        kl = KubeLibrary(kube_config='test/resources/k3d')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = kl.copy_from_pod('pod_name', 'default', '/var/logs/', tmp, compress=True)
+            self.assertEqual(['tar', 'czf', '-', '-C', '/var', 'logs'], mock_stream.call_args.kwargs['command'])
+            self.assertEqual(os.path.join(tmp, 'logs'), path)
+            with open(os.path.join(path, 'app.log'), 'rb') as f:
+                self.assertEqual(content, f.read())
+            archive = io.BytesIO()
+            with tarfile.open(fileobj=archive, mode='w') as tar:
+                info = tarfile.TarInfo('../evil')
+                tar.addfile(info, io.BytesIO())
+            mock_stream.return_value = MockTarCommand([(1, archive.getvalue()), (3, b'{"status": "Success"}')])
+            self.assertRaisesRegex(AssertionError, 'outside', kl.copy_from_pod, 'pod_name', 'default', '/evil', tmp)
+            self.assertFalse(os.path.exists(os.path.join(tmp, '..', 'evil')))
+            self.assertFalse(mock_stream.return_value.open)
+
+    @mock.patch.object(KubeLibrary, '_list_metadata')
     @mock.patch('kubernetes.client.RbacAuthorizationV1Api.list_cluster_role')
-    def test_list_cluster_role(self, mock_lnp):
+    def test_list_cluster_role(self, mock_lnp, mock_lm):
         mock_lnp.side_effect = mock_list_cluster_roles
+        mock_lm.side_effect = mock_list_metadata(mock_list_cluster_roles)
         kl = KubeLibrary(kube_config='test/resources/k3d')
         cluster_roles = kl.list_cluster_role()
         cluster_roles2 = kl.get_cluster_roles()
@@ -663,21 +1639,27 @@ class TestKubeLibrary(unittest.TestCase):
         self.assertEqual(kl.filter_names(cluster_role_bindings), cluster_role_bindings2)
         self.assertEqual(['read-secrets-global'], kl.filter_names(cluster_role_bindings))
 
+    @mock.patch.object(KubeLibrary, '_list_metadata')
     @mock.patch('kubernetes.client.RbacAuthorizationV1Api.list_namespaced_role')
-    def test_list_namespaced_role(self, mock_lnp):
+    def test_list_namespaced_role(self, mock_lnp, mock_lm):
         mock_lnp.side_effect = mock_list_namespaced_roles
+        mock_lm.side_effect = mock_list_metadata(mock_list_namespaced_roles)
         kl = KubeLibrary(kube_config='test/resources/k3d')
         roles = kl.list_namespaced_role('default')
         roles2 = kl.get_roles_in_namespace('default')
         self.assertEqual(kl.filter_names(roles), roles2)
         self.assertEqual(['pod-reader'], kl.filter_names(roles))
 
+    @mock.patch.object(KubeLibrary, '_list_metadata')
     @mock.patch('kubernetes.client.RbacAuthorizationV1Api.list_namespaced_role_binding')
-    def test_list_namespaced_role_binding(self, mock_lnp):
+    def test_list_namespaced_role_binding(self, mock_lnp, mock_lm):
         mock_lnp.side_effect = mock_list_namespaced_role_bindings
+        mock_lm.side_effect = mock_list_metadata(mock_list_namespaced_role_bindings)
         kl = KubeLibrary(kube_config='test/resources/k3d')
         role_bindings = kl.list_namespaced_role_binding('default')
         role_bindings2 = kl.get_role_bindings_in_namespace('default')
+        self.assertEqual('/apis/rbac.authorization.k8s.io/v1/namespaces/default/rolebindings',
+                         mock_lm.call_args.args[0])
         self.assertEqual(kl.filter_names(role_bindings), role_bindings2)
         self.assertEqual(['read-pods'], kl.filter_names(role_bindings))
 
@@ -726,12 +1708,16 @@ class TestKubeLibrary(unittest.TestCase):
         self.assertEqual(kl.filter_names(statefulsets), kl.filter_names(statefulsets2))
         self.assertEqual(['nginx-proxy'], kl.filter_names(statefulsets))
 
+    @mock.patch.object(KubeLibrary, '_list_metadata')
     @mock.patch('kubernetes.client.CoreV1Api.list_namespaced_service')
-    def test_list_namespaced_service(self, mock_service):
+    def test_list_namespaced_service(self, mock_service, mock_lm):
         mock_service.side_effect = mock_list_namespaced_services
+        mock_lm.side_effect = mock_list_metadata(mock_list_namespaced_services)
         kl = KubeLibrary(kube_config='test/resources/k3d')
         ret = kl.list_namespaced_service('default')
         self.assertEqual('test-service', ret[0].metadata.name)
+        self.assertEqual(['test-service'], kl.get_services_in_namespace('default'))
+        self.assertEqual('/api/v1/namespaces/default/services', mock_lm.call_args.args[0])
 
     @mock.patch('kubernetes.client.AppsV1Api.list_namespaced_daemon_set')
     def test_list_namespaced_daemon_set(self, mock_lnp):